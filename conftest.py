@@ -4,7 +4,8 @@ import os
 import pytest
 import asyncio
 import asyncpg
-from unittest.mock import patch
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
 # Detect if running inside Docker
@@ -85,6 +86,49 @@ async def cleanup_test_data():
         pass
 
 
+@pytest.fixture(scope="module")
+def _patched_asyncpg_connect():
+    """asyncpg.connect patched once per module, always returning the same connection mock"""
+    with patch('asyncpg.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = AsyncMock()
+        yield mock_connect
+
+
+@pytest.fixture
+def mock_asyncpg(_patched_asyncpg_connect):
+    """(connect mock, connection mock) with calls and canned results cleared"""
+    mock_connect = _patched_asyncpg_connect
+    mock_connect.reset_mock()
+    mock_conn = mock_connect.return_value
+    mock_conn.reset_mock(return_value=True, side_effect=True)
+    return mock_connect, mock_conn
+
+
+@pytest.fixture
+def patched_scheduler():
+    """AutoBackfillScheduler whose DB writes and candle validation are mocked out.
+    
+    db_service is a MagicMock whose insert_ohlcv_batch returns 1, and every
+    candle validates cleanly, so only the Polygon fetch needs patching per test.
+    """
+    from src.scheduler import AutoBackfillScheduler
+    
+    scheduler = AutoBackfillScheduler(
+        polygon_api_key="test_key",
+        database_url="postgresql://test"
+    )
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(
+            scheduler, 'db_service',
+            MagicMock(**{'insert_ohlcv_batch.return_value': 1})
+        ))
+        stack.enter_context(patch.object(
+            scheduler.validation_service, 'validate_candle',
+            return_value=(True, {'validated': True})
+        ))
+        yield scheduler
+
+
 @pytest.fixture
 def api_key():
     """Polygon API key for testing"""
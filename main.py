@@ -1,5 +1,6 @@
 """FastAPI application for Market Data Warehouse"""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -19,7 +20,7 @@ except Exception:
     # dotenv is optional at runtime; uvicorn also auto-loads .env when available
     pass
 
-from src.config import config, ALLOWED_TIMEFRAMES
+from src.config import config, ALLOWED_TIMEFRAMES, ALLOWED_TIMEFRAME_SET
 from src.scheduler import AutoBackfillScheduler, get_last_backfill_result, get_last_backfill_time
 from src.services.database_service import DatabaseService
 from src.models import (
@@ -247,7 +248,7 @@ async def get_status():
     - Scheduler status
     """
     try:
-        metrics = db.get_status_metrics()
+        metrics = await asyncio.to_thread(db.get_status_metrics)
         
         return JSONResponse(
             content={
@@ -289,7 +290,7 @@ def validate_timeframe(timeframe: str) -> str:
     Raises:
         ValueError: If timeframe is invalid
     """
-    if timeframe not in ALLOWED_TIMEFRAMES:
+    if timeframe not in ALLOWED_TIMEFRAME_SET:
         raise ValueError(
             f"Invalid timeframe: {timeframe}. "
             f"Allowed: {', '.join(ALLOWED_TIMEFRAMES)}"
@@ -342,8 +343,9 @@ async def get_historical_data(
                 detail="Invalid date format. Use YYYY-MM-DD"
             )
         
-        # Fetch data (filtered by timeframe)
-        data = db.get_historical_data(
+        # Fetch data (filtered by timeframe); sync DB work runs off the event loop
+        data = await asyncio.to_thread(
+            db.get_historical_data,
             symbol=symbol.upper(),
             timeframe=timeframe,
             start=start,
@@ -383,7 +385,7 @@ async def list_symbols():
     - Array of distinct symbols with basic stats (record count, date range)
     """
     try:
-        metrics = db.get_status_metrics()
+        metrics = await asyncio.to_thread(db.get_status_metrics)
         
         return {
             "symbols_available": metrics.get("symbols_available", 0),
@@ -436,7 +438,7 @@ async def get_symbols_detailed():
     """
     try:
         # Get all symbols from database
-        metrics = db.get_status_metrics()
+        metrics = await asyncio.to_thread(db.get_status_metrics)
         symbol_count = metrics.get("symbols_available", 0)
         
         if symbol_count == 0:
@@ -447,15 +449,13 @@ async def get_symbols_detailed():
             }
         
         # Query database for per-symbol stats
-        symbols_data = db.get_all_symbols_detailed()
+        symbols_data = await asyncio.to_thread(db.get_all_symbols_detailed)
         
-        # Enrich with status calculation
+        # Enrich with status calculation (rows already come back
+        # ordered by symbol from the query)
         for symbol in symbols_data:
             symbol["status"] = calculate_symbol_status(symbol)
         
-        # Sort by symbol name
-        symbols_data = sorted(symbols_data, key=lambda x: x["symbol"])
-        
         return {
             "count": len(symbols_data),
             "timestamp": datetime.utcnow().isoformat(),
@@ -481,7 +481,7 @@ async def get_metrics():
     try:
         backfill_result = get_last_backfill_result()
         backfill_time = get_last_backfill_time()
-        metrics = db.get_status_metrics()
+        metrics = await asyncio.to_thread(db.get_status_metrics)
         
         return {
             "timestamp": datetime.utcnow().isoformat(),
@@ -677,6 +677,7 @@ async def add_symbol(request: AddSymbolRequest):
     try:
         symbol_manager = get_symbol_manager()
         result = await symbol_manager.add_symbol(request.symbol, request.asset_class)
+        scheduler.invalidate_symbols_cache()
         
         logger.info("Symbol added via API", extra={
             "symbol": request.symbol,
@@ -715,9 +716,12 @@ async def list_symbols(active_only: bool = True, include_stats: bool = False):
         
         # Add stats if requested
         if include_stats:
+            # One grouped query for every symbol rather than one per symbol
+            all_stats = await asyncio.to_thread(
+                db.get_symbols_stats, [symbol["symbol"] for symbol in symbols]
+            )
             for symbol in symbols:
-                stats = db.get_symbol_stats(symbol["symbol"])
-                symbol["stats"] = stats
+                symbol["stats"] = all_stats[symbol["symbol"]]
         
         logger.info("Symbols listed via API", extra={
             "count": len(symbols),
@@ -761,7 +765,7 @@ async def get_symbol_info(symbol: str):
             raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
         
         # Add statistics
-        stats = db.get_symbol_stats(symbol)
+        stats = await asyncio.to_thread(db.get_symbol_stats, symbol)
         result["stats"] = stats
         
         logger.info("Symbol info retrieved via API", extra={
@@ -803,6 +807,7 @@ async def update_symbol(symbol: str, active: bool = None):
         
         # Update
         await symbol_manager.update_symbol_status(symbol, active=active)
+        scheduler.invalidate_symbols_cache()
         
         # Return updated info
         updated = await symbol_manager.get_symbol(symbol)
@@ -856,6 +861,7 @@ async def update_symbol_timeframes(symbol: str, request: UpdateSymbolTimeframesR
         
         if not result:
             raise HTTPException(status_code=500, detail="Failed to update timeframes")
+        scheduler.invalidate_symbols_cache()
         
         logger.info("Symbol timeframes updated via API", extra={
             "symbol": symbol,
@@ -900,6 +906,7 @@ async def deactivate_symbol(symbol: str):
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to deactivate symbol")
+        scheduler.invalidate_symbols_cache()
         
         logger.info("Symbol deactivated via API", extra={"symbol": symbol})
         
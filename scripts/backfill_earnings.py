@@ -34,12 +34,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default timeout for every request on the shared Polygon session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
 
 class EarningsBackfiller:
     def __init__(self, db: Database, polygon_client: PolygonClient):
         self.db = db
         self.polygon_client = polygon_client
         self.earnings_service = EarningsService(db)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session so every fetch reuses pooled connections and cached DNS."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=HTTP_TIMEOUT
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and the Polygon client's."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        await self.polygon_client.close()
 
     async def fetch_earnings_from_polygon(
         self, symbol: str, from_date: str, to_date: str
@@ -58,26 +77,24 @@ class EarningsBackfiller:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get("results", [])
-                        logger.info(
-                            f"  Fetched {len(results)} earnings periods for {symbol}"
-                        )
-                        return results
-                    elif response.status == 429:
-                        logger.warning(f"  Rate limited for {symbol}, retrying...")
-                        await asyncio.sleep(2)
-                        return await self.fetch_earnings_from_polygon(
-                            symbol, from_date, to_date
-                        )
-                    else:
-                        logger.warning(f"  API error {response.status} for {symbol}")
-                        return []
+            session = self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    results = data.get("results", [])
+                    logger.info(
+                        f"  Fetched {len(results)} earnings periods for {symbol}"
+                    )
+                    return results
+                elif response.status == 429:
+                    logger.warning(f"  Rate limited for {symbol}, retrying...")
+                    await asyncio.sleep(2)
+                    return await self.fetch_earnings_from_polygon(
+                        symbol, from_date, to_date
+                    )
+                else:
+                    logger.warning(f"  API error {response.status} for {symbol}")
+                    return []
         except asyncio.TimeoutError:
             logger.error(f"  Timeout fetching earnings for {symbol}")
             return []
@@ -316,34 +333,37 @@ async def main():
     successful = 0
     failed = 0
 
-    for i, symbol in enumerate(symbols, 1):
-        logger.info(f"[{i}/{len(symbols)}] Processing {symbol}")
-
-        if args.resume:
-            # Check if already completed
-            query = """
-            SELECT status FROM backfill_progress 
-            WHERE backfill_type = 'earnings' AND symbol = $1
-            """
-            try:
-                result = await db.fetchrow(query, symbol)
-                if result and result["status"] == "completed":
-                    logger.info(f"  Skipping {symbol} (already completed)")
-                    continue
-            except:
-                pass
-
-        success = await backfiller.backfill_symbol(
-            symbol, start_date.isoformat(), end_date.isoformat()
-        )
-
-        if success:
-            successful += 1
-        else:
-            failed += 1
-
-        # Rate limiting: 50 requests/min = 1.2s per request
-        await asyncio.sleep(1.2)
+    try:
+        for i, symbol in enumerate(symbols, 1):
+            logger.info(f"[{i}/{len(symbols)}] Processing {symbol}")
+
+            if args.resume:
+                # Check if already completed
+                query = """
+                SELECT status FROM backfill_progress 
+                WHERE backfill_type = 'earnings' AND symbol = $1
+                """
+                try:
+                    result = await db.fetchrow(query, symbol)
+                    if result and result["status"] == "completed":
+                        logger.info(f"  Skipping {symbol} (already completed)")
+                        continue
+                except:
+                    pass
+
+            success = await backfiller.backfill_symbol(
+                symbol, start_date.isoformat(), end_date.isoformat()
+            )
+
+            if success:
+                successful += 1
+            else:
+                failed += 1
+
+            # Rate limiting: 50 requests/min = 1.2s per request
+            await asyncio.sleep(1.2)
+    finally:
+        await backfiller.close()
 
     logger.info("-" * 60)
     logger.info(f"Earnings backfill complete!")
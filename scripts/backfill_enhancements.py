@@ -333,42 +333,45 @@ async def main():
         'adjusted': {'inserted': 0, 'failed': 0},
     }
     
-    # Backfill each symbol
-    for i, symbol in enumerate(requested_symbols, 1):
-        logger.info(f"\n[{i}/{len(requested_symbols)}] Processing {symbol}")
-        logger.info("-" * 80)
-        
-        try:
-            # OHLCV Data (skip by default in V2, only if --only-ohlcv flag is used)
-            if args.only_ohlcv:
-                inserted, failed = await backfill_ohlcv(
-                    symbol, polygon_client, validation_service, db_service,
-                    start_dt, end_dt, args.timeframe
-                )
-                stats['ohlcv']['inserted'] += inserted
-                stats['ohlcv']['failed'] += failed
+    try:
+        # Backfill each symbol
+        for i, symbol in enumerate(requested_symbols, 1):
+            logger.info(f"\n[{i}/{len(requested_symbols)}] Processing {symbol}")
+            logger.info("-" * 80)
             
-            # News & Sentiment
-            if not args.skip_news:
-                inserted, failed = await backfill_news_sentiment(
-                    symbol, polygon_client, sentiment_service, news_service,
-                    start_dt, end_dt
-                )
-                stats['news']['inserted'] += inserted
-                stats['news']['failed'] += failed
+            try:
+                # OHLCV Data (skip by default in V2, only if --only-ohlcv flag is used)
+                if args.only_ohlcv:
+                    inserted, failed = await backfill_ohlcv(
+                        symbol, polygon_client, validation_service, db_service,
+                        start_dt, end_dt, args.timeframe
+                    )
+                    stats['ohlcv']['inserted'] += inserted
+                    stats['ohlcv']['failed'] += failed
+                
+                # News & Sentiment
+                if not args.skip_news:
+                    inserted, failed = await backfill_news_sentiment(
+                        symbol, polygon_client, sentiment_service, news_service,
+                        start_dt, end_dt
+                    )
+                    stats['news']['inserted'] += inserted
+                    stats['news']['failed'] += failed
+                
+                # Adjusted OHLCV
+                if not args.skip_adjusted:
+                    inserted, failed = await backfill_adjusted_ohlcv(
+                        symbol, polygon_client, dividend_service,
+                        start_dt, end_dt, args.timeframe
+                    )
+                    stats['adjusted']['inserted'] += inserted
+                    stats['adjusted']['failed'] += failed
             
-            # Adjusted OHLCV
-            if not args.skip_adjusted:
-                inserted, failed = await backfill_adjusted_ohlcv(
-                    symbol, polygon_client, dividend_service,
-                    start_dt, end_dt, args.timeframe
-                )
-                stats['adjusted']['inserted'] += inserted
-                stats['adjusted']['failed'] += failed
-        
-        except Exception as e:
-            logger.error(f"[{symbol}] Fatal error: {e}")
-            continue
+            except Exception as e:
+                logger.error(f"[{symbol}] Fatal error: {e}")
+                continue
+    finally:
+        await polygon_client.close()
     
     # Print summary
     logger.info("\n" + "=" * 80)
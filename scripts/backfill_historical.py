@@ -83,17 +83,20 @@ async def main():
     print("=" * 60)
     
     total_records = 0
-    for symbol, asset_class in symbols:
-        # Add symbol to tracking
-        try:
-            db.add_tracked_symbol(symbol, asset_class)
-            print(f"Added {symbol} to tracking")
-        except Exception as e:
-            print(f"Symbol {symbol} may already exist: {e}")
-        
-        # Backfill data
-        records = await backfill_symbol(db, polygon_client, symbol, years_back=5)
-        total_records += records
+    try:
+        for symbol, asset_class in symbols:
+            # Add symbol to tracking
+            try:
+                db.add_tracked_symbol(symbol, asset_class)
+                print(f"Added {symbol} to tracking")
+            except Exception as e:
+                print(f"Symbol {symbol} may already exist: {e}")
+            
+            # Backfill data
+            records = await backfill_symbol(db, polygon_client, symbol, years_back=5)
+            total_records += records
+    finally:
+        await polygon_client.close()
     
     print("\n" + "=" * 60)
     print(f"Total records inserted: {total_records}")
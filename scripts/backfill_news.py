@@ -193,56 +193,59 @@ async def backfill_news(
     total_skipped = 0
     total_validation_errors = 0
     
-    for idx, symbol in enumerate(symbols, 1):
-        # Check if already completed
-        progress = news_service.get_backfill_progress(symbol)
-        if progress and progress['status'] == 'completed':
-            logger.info(f"[{idx}/{len(symbols)}] {symbol}: Already completed, skipping")
-            continue
-        
-        # Mark as in progress
-        news_service.update_backfill_progress(symbol, 'in_progress')
-        
-        try:
-            # Fetch and analyze sentiment
-            articles, skipped = await fetch_news_for_symbol(
-                symbol,
-                polygon_client,
-                start_date,
-                end_date,
-                sentiment_service
-            )
-            
-            if not articles:
-                news_service.update_backfill_progress(symbol, 'completed')
-                logger.info(f"[{idx}/{len(symbols)}] {symbol}: No news data")
+    try:
+        for idx, symbol in enumerate(symbols, 1):
+            # Check if already completed
+            progress = news_service.get_backfill_progress(symbol)
+            if progress and progress['status'] == 'completed':
+                logger.info(f"[{idx}/{len(symbols)}] {symbol}: Already completed, skipping")
                 continue
             
-            # Insert into database
-            inserted, db_skipped = news_service.insert_news_batch(symbol, articles)
+            # Mark as in progress
+            news_service.update_backfill_progress(symbol, 'in_progress')
+            
+            try:
+                # Fetch and analyze sentiment
+                articles, skipped = await fetch_news_for_symbol(
+                    symbol,
+                    polygon_client,
+                    start_date,
+                    end_date,
+                    sentiment_service
+                )
+                
+                if not articles:
+                    news_service.update_backfill_progress(symbol, 'completed')
+                    logger.info(f"[{idx}/{len(symbols)}] {symbol}: No news data")
+                    continue
+                
+                # Insert into database
+                inserted, db_skipped = news_service.insert_news_batch(symbol, articles)
+                
+                total_inserted += inserted
+                total_skipped += skipped + db_skipped
+                total_validation_errors += skipped
+                
+                # Mark as completed
+                news_service.update_backfill_progress(symbol, 'completed')
+                logger.info(
+                    f"[{idx}/{len(symbols)}] {symbol}: ✓ Inserted {inserted}, "
+                    f"skipped {db_skipped} (validation errors: {skipped})"
+                )
             
-            total_inserted += inserted
-            total_skipped += skipped + db_skipped
-            total_validation_errors += skipped
+            except Exception as e:
+                logger.error(f"[{idx}/{len(symbols)}] {symbol}: ✗ Error - {e}")
+                news_service.update_backfill_progress(
+                    symbol,
+                    'failed',
+                    error_message=str(e)
+                )
+                total_skipped += 1
             
-            # Mark as completed
-            news_service.update_backfill_progress(symbol, 'completed')
-            logger.info(
-                f"[{idx}/{len(symbols)}] {symbol}: ✓ Inserted {inserted}, "
-                f"skipped {db_skipped} (validation errors: {skipped})"
-            )
-        
-        except Exception as e:
-            logger.error(f"[{idx}/{len(symbols)}] {symbol}: ✗ Error - {e}")
-            news_service.update_backfill_progress(
-                symbol,
-                'failed',
-                error_message=str(e)
-            )
-            total_skipped += 1
-        
-        # Respect rate limits
-        await asyncio.sleep(RATE_LIMIT_DELAY)
+            # Respect rate limits
+            await asyncio.sleep(RATE_LIMIT_DELAY)
+    finally:
+        await polygon_client.close()
     
     logger.info("=" * 60)
     logger.info("News backfill complete!")
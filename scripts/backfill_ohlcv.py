@@ -31,11 +31,21 @@ logger = logging.getLogger(__name__)
 END_DATE = datetime.utcnow().date()
 START_DATE = END_DATE - timedelta(days=365*5)
 
+# Supported timeframes, in the order stored in tracked_symbols.timeframes
+TIMEFRAMES = ['5m', '15m', '30m', '1h', '4h', '1d', '1w']
+
+# Symbols backfilled at once (bounded to stay within Polygon rate limits)
+DEFAULT_CONCURRENCY = 4
+
 
 async def update_symbol_timeframe(database_url: str, symbol: str, timeframe: str) -> bool:
     """
     Update tracked_symbols to include the backfilled timeframe.
     
+    Done as one atomic UPDATE (append + reorder in SQL) rather than a
+    read-modify-write, so concurrent backfills of different timeframes for
+    the same symbol cannot overwrite each other's additions.
+    
     Args:
         database_url: Database connection string
         symbol: Stock ticker
@@ -47,35 +57,31 @@ async def update_symbol_timeframe(database_url: str, symbol: str, timeframe: str
     try:
         conn = await asyncpg.connect(database_url)
         
-        # Get current timeframes
         row = await conn.fetchrow(
-            "SELECT timeframes FROM tracked_symbols WHERE symbol = $1",
-            symbol
+            """
+            UPDATE tracked_symbols
+            SET timeframes = CASE
+                WHEN $2 = ANY(COALESCE(timeframes, '{}')) THEN timeframes
+                ELSE ARRAY(
+                    SELECT tf
+                    FROM unnest(array_append(COALESCE(timeframes, '{}'), $2::text)) AS tf
+                    ORDER BY array_position($3::text[], tf)
+                )
+            END
+            WHERE symbol = $1
+            RETURNING timeframes
+            """,
+            symbol,
+            timeframe,
+            TIMEFRAMES
         )
         
+        await conn.close()
+        
         if not row:
-            await conn.close()
             return False
         
-        current_timeframes = list(row['timeframes']) if row['timeframes'] else []
-        
-        # Add timeframe if not already present
-        if timeframe not in current_timeframes:
-            current_timeframes.append(timeframe)
-            # Sort for consistency
-            current_timeframes = sorted(
-                current_timeframes,
-                key=lambda x: (['5m', '15m', '30m', '1h', '4h', '1d', '1w'].index(x))
-            )
-            
-            await conn.execute(
-                "UPDATE tracked_symbols SET timeframes = $1 WHERE symbol = $2",
-                current_timeframes,
-                symbol
-            )
-            logger.info(f"Updated {symbol} timeframes to: {current_timeframes}")
-        
-        await conn.close()
+        logger.info(f"{symbol} timeframes: {list(row['timeframes'])}")
         return True
     
     except Exception as e:
@@ -209,6 +215,12 @@ def _parse_args():
         default="1d",
         help="Timeframe: 5m, 15m, 30m, 1h, 4h, 1d (default), 1w"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of symbols to backfill concurrently (default {DEFAULT_CONCURRENCY})"
+    )
     return parser.parse_args()
 
 
@@ -264,7 +276,7 @@ async def main():
         return
     
     # Validate timeframe
-    if args.timeframe not in ['5m', '15m', '30m', '1h', '4h', '1d', '1w']:
+    if args.timeframe not in TIMEFRAMES:
         logger.error(f"Invalid timeframe: {args.timeframe}. Must be one of: 5m, 15m, 30m, 1h, 4h, 1d, 1w")
         return
     
@@ -280,23 +292,38 @@ async def main():
     logger.info(f"Starting backfill for {len(requested_symbols)} symbols")
     logger.info(f"Timeframe: {args.timeframe}")
     logger.info(f"Date range: {start_dt} to {end_dt}")
+    logger.info(f"Concurrency: {args.concurrency}")
     logger.info("-" * 60)
     
     total_inserted = 0
     total_failed = 0
     
-    # Backfill each symbol
-    for symbol in requested_symbols:
-        inserted, failed = await backfill_symbol(
-            symbol,
-            polygon_client,
-            validation_service,
-            db_service,
-            start_dt,
-            end_dt,
-            args.timeframe,
-            database_url
-        )
+    # Backfill symbols concurrently so Polygon fetches overlap; the semaphore
+    # caps in-flight requests. backfill_symbol handles its own errors, so one
+    # failing symbol never cancels the rest of the group.
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+    
+    async def run_symbol(symbol: str) -> tuple[int, int]:
+        async with semaphore:
+            return await backfill_symbol(
+                symbol,
+                polygon_client,
+                validation_service,
+                db_service,
+                start_dt,
+                end_dt,
+                args.timeframe,
+                database_url
+            )
+    
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_symbol(symbol)) for symbol in requested_symbols]
+    finally:
+        await polygon_client.close()
+    
+    for task in tasks:
+        inserted, failed = task.result()
         total_inserted += inserted
         total_failed += failed
     
@@ -36,12 +36,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default timeout for every request on the shared Polygon session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
 
 class OptionsIVBackfiller:
     def __init__(self, db: Database, polygon_client: PolygonClient):
         self.db = db
         self.polygon_client = polygon_client
         self.options_service = OptionsIVService(db)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session so every fetch reuses pooled connections and cached DNS."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=HTTP_TIMEOUT
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and the Polygon client's."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        await self.polygon_client.close()
 
     async def fetch_options_contracts(
         self, symbol: str, expiration_date: str
@@ -60,26 +79,24 @@ class OptionsIVBackfiller:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get("results", [])
-                        logger.debug(
-                            f"  Fetched {len(results)} contracts for {symbol} {expiration_date}"
-                        )
-                        return results
-                    elif response.status == 429:
-                        logger.warning(f"  Rate limited, waiting 2s...")
-                        await asyncio.sleep(2)
-                        return await self.fetch_options_contracts(
-                            symbol, expiration_date
-                        )
-                    else:
-                        logger.warning(f"  API error {response.status}")
-                        return []
+            session = self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    results = data.get("results", [])
+                    logger.debug(
+                        f"  Fetched {len(results)} contracts for {symbol} {expiration_date}"
+                    )
+                    return results
+                elif response.status == 429:
+                    logger.warning(f"  Rate limited, waiting 2s...")
+                    await asyncio.sleep(2)
+                    return await self.fetch_options_contracts(
+                        symbol, expiration_date
+                    )
+                else:
+                    logger.warning(f"  API error {response.status}")
+                    return []
         except asyncio.TimeoutError:
             logger.error(f"  Timeout fetching options for {symbol}")
             return []
@@ -335,20 +352,23 @@ async def main():
     successful = 0
     failed = 0
 
-    for i, symbol in enumerate(symbols, 1):
-        logger.info(f"[{i}/{len(symbols)}] Processing {symbol}")
+    try:
+        for i, symbol in enumerate(symbols, 1):
+            logger.info(f"[{i}/{len(symbols)}] Processing {symbol}")
 
-        success = await backfiller.backfill_symbol_recent(
-            symbol, days=args.days
-        )
+            success = await backfiller.backfill_symbol_recent(
+                symbol, days=args.days
+            )
 
-        if success:
-            successful += 1
-        else:
-            failed += 1
+            if success:
+                successful += 1
+            else:
+                failed += 1
 
-        # Rate limiting
-        await asyncio.sleep(2)
+            # Rate limiting
+            await asyncio.sleep(2)
+    finally:
+        await backfiller.close()
 
     logger.info("-" * 60)
     logger.info(f"Options IV backfill complete!")
@@ -16,20 +16,125 @@ Collects:
 import asyncio
 import aiohttp
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 import yfinance as yf
+import numpy as np
 import pandas as pd
 import logging
-from decimal import Decimal
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from psycopg2.pool import SimpleConnectionPool
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Default timeout for every request on the shared HTTP session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Max yfinance history downloads in flight at once
+HISTORY_CONCURRENCY = 10
+
+# Worker processes for indicator computation (None = one per CPU)
+INDICATOR_WORKERS = None
+
+# technical_indicators float columns, in INSERT order (volume_sma_20 follows as int)
+INDICATOR_COLUMNS = [
+    'RSI_14', 'MACD', 'MACD_Signal', 'MACD_Histogram',
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26',
+    'BB_Upper', 'BB_Middle', 'BB_Lower', 'ATR_14',
+]
+
+
+def _option_chain_records(symbol: str, expiration, chain: pd.DataFrame,
+                          option_type: str, fetched_at: datetime) -> List[tuple]:
+    """options_iv rows for one side of an option chain, built column-wise.
+    
+    Missing or NaN IV/open interest/volume/last price become 0.
+    """
+    values = chain.reindex(
+        columns=['impliedVolatility', 'openInterest', 'volume', 'lastPrice']
+    ).fillna(0)
+    n = len(chain)
+    return list(zip(
+        [symbol] * n,
+        [expiration] * n,
+        chain['strike'].astype(float).tolist(),
+        [option_type] * n,
+        values['impliedVolatility'].astype(float).tolist(),
+        values['openInterest'].astype('int64').tolist(),
+        values['volume'].astype('int64').tolist(),
+        values['lastPrice'].astype(float).tolist(),
+        ['yfinance'] * n,
+        [fetched_at] * n,
+    ))
+
+
+def _indicator_records(symbol: str, hist: pd.DataFrame) -> List[tuple]:
+    """technical_indicators rows for one symbol's price history.
+    
+    Module-level so it can be pickled into the indicator process pool.
+    """
+    # Calculate indicators
+    hist['SMA_20'] = hist['Close'].rolling(window=20).mean()
+    hist['SMA_50'] = hist['Close'].rolling(window=50).mean()
+    hist['SMA_200'] = hist['Close'].rolling(window=200).mean()
+    
+    hist['EMA_12'] = hist['Close'].ewm(span=12, adjust=False).mean()
+    hist['EMA_26'] = hist['Close'].ewm(span=26, adjust=False).mean()
+    hist['MACD'] = hist['EMA_12'] - hist['EMA_26']
+    hist['MACD_Signal'] = hist['MACD'].ewm(span=9, adjust=False).mean()
+    hist['MACD_Histogram'] = hist['MACD'] - hist['MACD_Signal']
+    
+    # RSI
+    delta = hist['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss
+    hist['RSI_14'] = 100 - (100 / (1 + rs))
+    
+    # Bollinger Bands (the middle band is SMA_20; reuse it rather than
+    # running the same rolling window twice)
+    hist['BB_Middle'] = hist['SMA_20']
+    hist['BB_Std'] = hist['Close'].rolling(window=20).std()
+    hist['BB_Upper'] = hist['BB_Middle'] + (hist['BB_Std'] * 2)
+    hist['BB_Lower'] = hist['BB_Middle'] - (hist['BB_Std'] * 2)
+    
+    # ATR (true range on raw arrays; fmax skips the NaN prev close on row 0)
+    high = hist['High'].to_numpy()
+    low = hist['Low'].to_numpy()
+    prev_close = hist['Close'].shift().to_numpy()
+    true_range = np.fmax(
+        high - low,
+        np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    hist['ATR_14'] = pd.Series(true_range, index=hist.index).rolling(window=14).mean()
+    
+    # Volume SMA
+    hist['Volume_SMA_20'] = hist['Volume'].rolling(window=20).mean()
+    
+    # Prepare records: NaN -> None once per column instead of
+    # pd.notna on every cell of every row
+    indicators = hist[INDICATOR_COLUMNS]
+    indicators = indicators.astype(object).where(indicators.notna(), None)
+    volume_sma = hist['Volume_SMA_20']
+    volume_sma = np.trunc(volume_sma).astype('Int64').astype(object).where(volume_sma.notna(), None)
+    computed_at = datetime.now()
+    
+    # One row per date, keeping the last (yfinance can repeat the current
+    # bar), since a single upsert statement can't touch the same row twice
+    records = {
+        indicator_date: (symbol, indicator_date, *values, vol_sma, computed_at)
+        for indicator_date, values, vol_sma in zip(
+            hist.index.date,
+            zip(*(indicators[col] for col in INDICATOR_COLUMNS)),
+            volume_sma
+        )
+    }
+    return list(records.values())
+
 
 class PredictionDataBackfiller:
     def __init__(self, symbols: List[str]):
@@ -40,7 +145,7 @@ class PredictionDataBackfiller:
         self.fred_key = os.getenv("FRED_API_KEY", "")
         
     async def init(self):
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         # Initialize DB connection pool
         try:
             self.db_pool = SimpleConnectionPool(
@@ -55,6 +160,31 @@ class PredictionDataBackfiller:
             logger.error(f"Failed to initialize DB pool: {e}")
             self.db_pool = None
     
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on first use; requests inherit its timeout"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(timeout=HTTP_TIMEOUT)
+        return self.session
+    
+    async def _fetch_histories(self, period: str) -> Dict[str, Any]:
+        """Download price history for every symbol, HISTORY_CONCURRENCY at a time.
+        
+        yfinance blocks, so each download runs in a worker thread. A failed
+        download maps to its exception so callers can still log per symbol.
+        """
+        semaphore = asyncio.Semaphore(HISTORY_CONCURRENCY)
+        
+        async def fetch(symbol: str):
+            async with semaphore:
+                try:
+                    return symbol, await asyncio.to_thread(
+                        lambda: yf.Ticker(symbol).history(period=period)
+                    )
+                except Exception as e:
+                    return symbol, e
+        
+        return dict(await asyncio.gather(*(fetch(symbol) for symbol in self.symbols)))
+    
     async def close(self):
         if self.session:
             await self.session.close()
@@ -83,28 +213,33 @@ class PredictionDataBackfiller:
                         logger.info(f"{symbol}: No dividends found")
                         continue
                     
-                    records = []
-                    for date, amount in dividends.items():
-                        records.append((
+                    # Cast the whole series once rather than float() per row
+                    fetched_at = datetime.now()
+                    records = [
+                        (
                             symbol,
-                            date.date(),  # ex_date
+                            ex_date,
                             None,  # record_date
                             None,  # payment_date
-                            float(amount),
+                            amount,
                             'dividend',
                             'yfinance',
-                            datetime.now()
-                        ))
+                            fetched_at
+                        )
+                        for ex_date, amount in zip(
+                            dividends.index.date, dividends.astype(float).tolist()
+                        )
+                    ]
                     
                     # Insert with conflict handling
                     query = """
                     INSERT INTO dividends 
                     (symbol, ex_date, record_date, payment_date, dividend_amount, dividend_type, data_source, fetched_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (symbol, ex_date, dividend_amount) DO NOTHING
                     """
                     
-                    execute_batch(cursor, query, records, page_size=1000)
+                    execute_values(cursor, query, records, page_size=1000)
                     conn.commit()
                     logger.info(f"{symbol}: Inserted {len(records)} dividends")
                     
@@ -136,25 +271,29 @@ class PredictionDataBackfiller:
                         logger.info(f"{symbol}: No splits found")
                         continue
                     
-                    records = []
-                    for date, ratio in splits.items():
-                        records.append((
+                    fetched_at = datetime.now()
+                    records = [
+                        (
                             symbol,
-                            date.date(),
-                            float(ratio),
+                            split_date,
+                            ratio,
                             f"{ratio:.4f} split",
                             'yfinance',
-                            datetime.now()
-                        ))
+                            fetched_at
+                        )
+                        for split_date, ratio in zip(
+                            splits.index.date, splits.astype(float).tolist()
+                        )
+                    ]
                     
                     query = """
                     INSERT INTO stock_splits 
                     (symbol, split_date, split_ratio, description, data_source, fetched_at)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (symbol, split_date, split_ratio) DO NOTHING
                     """
                     
-                    execute_batch(cursor, query, records, page_size=1000)
+                    execute_values(cursor, query, records, page_size=1000)
                     conn.commit()
                     logger.info(f"{symbol}: Inserted {len(records)} splits")
                     
@@ -266,11 +405,11 @@ class PredictionDataBackfiller:
                     query = """
                     INSERT INTO news_articles 
                     (symbol, news_date, title, url, source, data_source, fetched_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (symbol, url) DO NOTHING
                     """
                     
-                    execute_batch(cursor, query, records, page_size=1000)
+                    execute_values(cursor, query, records, page_size=1000)
                     conn.commit()
                     logger.info(f"{symbol}: Inserted {len(records)} news articles")
                     
@@ -309,36 +448,16 @@ class PredictionDataBackfiller:
                     for expiration in expirations[:3]:
                         try:
                             opt_chain = ticker.option_chain(expiration)
+                            expiration_date = datetime.strptime(expiration, '%Y-%m-%d').date()
+                            fetched_at = datetime.now()
                             
-                            # Process calls
-                            for _, row in opt_chain.calls.iterrows():
-                                records.append((
-                                    symbol,
-                                    datetime.strptime(expiration, '%Y-%m-%d').date(),
-                                    float(row['strike']),
-                                    'call',
-                                    float(row.get('impliedVolatility', 0)),
-                                    int(row.get('openInterest', 0)),
-                                    int(row.get('volume', 0)),
-                                    float(row.get('lastPrice', 0)),
-                                    'yfinance',
-                                    datetime.now()
-                                ))
-                            
-                            # Process puts
-                            for _, row in opt_chain.puts.iterrows():
-                                records.append((
-                                    symbol,
-                                    datetime.strptime(expiration, '%Y-%m-%d').date(),
-                                    float(row['strike']),
-                                    'put',
-                                    float(row.get('impliedVolatility', 0)),
-                                    int(row.get('openInterest', 0)),
-                                    int(row.get('volume', 0)),
-                                    float(row.get('lastPrice', 0)),
-                                    'yfinance',
-                                    datetime.now()
-                                ))
+                            # Process calls and puts
+                            records.extend(_option_chain_records(
+                                symbol, expiration_date, opt_chain.calls, 'call', fetched_at
+                            ))
+                            records.extend(_option_chain_records(
+                                symbol, expiration_date, opt_chain.puts, 'put', fetched_at
+                            ))
                         
                         except Exception as e:
                             logger.warning(f"{symbol} {expiration}: Option chain failed: {e}")
@@ -350,12 +469,12 @@ class PredictionDataBackfiller:
                         (symbol, expiration_date, strike_price, option_type, 
                          implied_volatility, open_interest, volume, last_price,
                          data_source, fetched_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        VALUES %s
                         ON CONFLICT (symbol, expiration_date, strike_price, option_type, updated_at::DATE) 
                         DO NOTHING
                         """
                         
-                        execute_batch(cursor, query, records, page_size=1000)
+                        execute_values(cursor, query, records, page_size=1000)
                         conn.commit()
                         logger.info(f"{symbol}: Inserted {len(records)} options")
                 
@@ -378,97 +497,54 @@ class PredictionDataBackfiller:
         conn = self.db_pool.getconn()
         try:
             cursor = conn.cursor()
+            histories = await self._fetch_histories("2y")  # 2 years of data
             
-            for symbol in self.symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(period="2y")  # 2 years of data
-                    
-                    if hist.empty:
-                        logger.warning(f"{symbol}: No price data for indicators")
-                        continue
-                    
-                    # Calculate indicators
-                    hist['SMA_20'] = hist['Close'].rolling(window=20).mean()
-                    hist['SMA_50'] = hist['Close'].rolling(window=50).mean()
-                    hist['SMA_200'] = hist['Close'].rolling(window=200).mean()
-                    
-                    hist['EMA_12'] = hist['Close'].ewm(span=12, adjust=False).mean()
-                    hist['EMA_26'] = hist['Close'].ewm(span=26, adjust=False).mean()
-                    hist['MACD'] = hist['EMA_12'] - hist['EMA_26']
-                    hist['MACD_Signal'] = hist['MACD'].ewm(span=9, adjust=False).mean()
-                    hist['MACD_Histogram'] = hist['MACD'] - hist['MACD_Signal']
-                    
-                    # RSI
-                    delta = hist['Close'].diff()
-                    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                    rs = gain / loss
-                    hist['RSI_14'] = 100 - (100 / (1 + rs))
-                    
-                    # Bollinger Bands
-                    hist['BB_Middle'] = hist['Close'].rolling(window=20).mean()
-                    hist['BB_Std'] = hist['Close'].rolling(window=20).std()
-                    hist['BB_Upper'] = hist['BB_Middle'] + (hist['BB_Std'] * 2)
-                    hist['BB_Lower'] = hist['BB_Middle'] - (hist['BB_Std'] * 2)
-                    
-                    # ATR
-                    hist['H-L'] = hist['High'] - hist['Low']
-                    hist['H-C'] = abs(hist['High'] - hist['Close'].shift())
-                    hist['L-C'] = abs(hist['Low'] - hist['Close'].shift())
-                    hist['TR'] = hist[['H-L', 'H-C', 'L-C']].max(axis=1)
-                    hist['ATR_14'] = hist['TR'].rolling(window=14).mean()
-                    
-                    # Volume SMA
-                    hist['Volume_SMA_20'] = hist['Volume'].rolling(window=20).mean()
-                    
-                    # Prepare records
-                    records = []
-                    for idx, row in hist.iterrows():
-                        records.append((
-                            symbol,
-                            idx.date(),
-                            float(row.get('RSI_14')) if pd.notna(row.get('RSI_14')) else None,
-                            float(row.get('MACD')) if pd.notna(row.get('MACD')) else None,
-                            float(row.get('MACD_Signal')) if pd.notna(row.get('MACD_Signal')) else None,
-                            float(row.get('MACD_Histogram')) if pd.notna(row.get('MACD_Histogram')) else None,
-                            float(row.get('SMA_20')) if pd.notna(row.get('SMA_20')) else None,
-                            float(row.get('SMA_50')) if pd.notna(row.get('SMA_50')) else None,
-                            float(row.get('SMA_200')) if pd.notna(row.get('SMA_200')) else None,
-                            float(row.get('EMA_12')) if pd.notna(row.get('EMA_12')) else None,
-                            float(row.get('EMA_26')) if pd.notna(row.get('EMA_26')) else None,
-                            float(row.get('BB_Upper')) if pd.notna(row.get('BB_Upper')) else None,
-                            float(row.get('BB_Middle')) if pd.notna(row.get('BB_Middle')) else None,
-                            float(row.get('BB_Lower')) if pd.notna(row.get('BB_Lower')) else None,
-                            float(row.get('ATR_14')) if pd.notna(row.get('ATR_14')) else None,
-                            int(row.get('Volume_SMA_20')) if pd.notna(row.get('Volume_SMA_20')) else None,
-                            datetime.now()
-                        ))
-                    
-                    query = """
-                    INSERT INTO technical_indicators
-                    (symbol, indicator_date, rsi_14, macd, macd_signal, macd_histogram,
-                     sma_20, sma_50, sma_200, ema_12, ema_26, bb_upper, bb_middle, bb_lower,
-                     atr_14, volume_sma_20, computed_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (symbol, indicator_date) DO UPDATE SET
-                        rsi_14 = EXCLUDED.rsi_14,
-                        macd = EXCLUDED.macd,
-                        macd_signal = EXCLUDED.macd_signal,
-                        macd_histogram = EXCLUDED.macd_histogram,
-                        sma_20 = EXCLUDED.sma_20,
-                        sma_50 = EXCLUDED.sma_50,
-                        sma_200 = EXCLUDED.sma_200,
-                        computed_at = NOW()
-                    """
-                    
-                    execute_batch(cursor, query, records, page_size=1000)
-                    conn.commit()
-                    logger.info(f"{symbol}: Computed and stored {len(records)} technical indicators")
-                    
-                except Exception as e:
-                    logger.error(f"{symbol}: Indicators computation failed: {e}")
-                    conn.rollback()
+            # Indicator math is CPU-bound pandas work; run it in worker
+            # processes so it neither blocks the event loop nor serialises
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=INDICATOR_WORKERS) as executor:
+                computed = {
+                    symbol: loop.run_in_executor(executor, _indicator_records, symbol, hist)
+                    for symbol, hist in histories.items()
+                    if isinstance(hist, pd.DataFrame) and not hist.empty
+                }
+                
+                for symbol in self.symbols:
+                    try:
+                        hist = histories[symbol]
+                        if isinstance(hist, Exception):
+                            raise hist
+                        
+                        if hist.empty:
+                            logger.warning(f"{symbol}: No price data for indicators")
+                            continue
+                        
+                        records = await computed[symbol]
+                        
+                        query = """
+                        INSERT INTO technical_indicators
+                        (symbol, indicator_date, rsi_14, macd, macd_signal, macd_histogram,
+                         sma_20, sma_50, sma_200, ema_12, ema_26, bb_upper, bb_middle, bb_lower,
+                         atr_14, volume_sma_20, computed_at)
+                        VALUES %s
+                        ON CONFLICT (symbol, indicator_date) DO UPDATE SET
+                            rsi_14 = EXCLUDED.rsi_14,
+                            macd = EXCLUDED.macd,
+                            macd_signal = EXCLUDED.macd_signal,
+                            macd_histogram = EXCLUDED.macd_histogram,
+                            sma_20 = EXCLUDED.sma_20,
+                            sma_50 = EXCLUDED.sma_50,
+                            sma_200 = EXCLUDED.sma_200,
+                            computed_at = NOW()
+                        """
+                        
+                        execute_values(cursor, query, records, page_size=1000)
+                        conn.commit()
+                        logger.info(f"{symbol}: Computed and stored {len(records)} technical indicators")
+                        
+                    except Exception as e:
+                        logger.error(f"{symbol}: Indicators computation failed: {e}")
+                        conn.rollback()
         
         finally:
             self.db_pool.putconn(conn)
@@ -494,7 +570,8 @@ class PredictionDataBackfiller:
                 try:
                     url = f"https://finnhub.io/api/v1/stock/recommendation?symbol={symbol}&token={self.finnhub_key}"
                     
-                    async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                    session = await self._ensure_session()
+                    async with session.get(url) as resp:
                         if resp.status == 200:
                             data = await resp.json()
                             
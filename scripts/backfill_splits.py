@@ -24,6 +24,7 @@ from src.clients.polygon_client import PolygonClient
 from src.services.database_service import DatabaseService
 from src.services.dividend_split_service import DividendSplitService
 from src.services.validation_service import ValidationService
+from src.services.scheduler_retry import RateLimiter
 from src.config import get_db_url, get_polygon_api_key
 
 # Setup logging
@@ -36,7 +37,9 @@ logger = logging.getLogger(__name__)
 # Backfill settings
 START_DATE = (datetime.utcnow() - timedelta(days=365*10)).date()  # 10 years
 END_DATE = datetime.utcnow().date()
-RATE_LIMIT_DELAY = 1.2  # seconds between requests (50 req/min)
+RATE_LIMIT_REQUESTS = 50  # Polygon requests allowed per window (50 req/min)
+RATE_LIMIT_WINDOW = 60  # seconds
+FETCH_CONCURRENCY = 8  # symbols fetched at once
 
 
 async def fetch_splits_for_symbol(
@@ -107,7 +110,7 @@ async def backfill_splits(
         logger.error("POLYGON_API_KEY not set")
         return
     
-    polygon_client = PolygonClient(api_key)
+    polygon_client = PolygonClient(api_key, cache_dir=os.getenv("POLYGON_CACHE_DIR"))
     db_service = DatabaseService(db_url)
     div_service = DividendSplitService(db_service)
     validation_service = ValidationService()
@@ -141,62 +144,70 @@ async def backfill_splits(
     logger.info(f"Date range: {START_DATE} to {END_DATE}")
     logger.info("=" * 60)
     
-    total_inserted = 0
-    total_skipped = 0
-    total_validation_errors = 0
+    rate_limiter = RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW)
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
     
-    for idx, symbol in enumerate(symbols, 1):
-        # Check if already completed
-        progress = div_service.get_backfill_progress('splits', symbol)
-        if progress and progress['status'] == 'completed':
-            logger.info(f"[{idx}/{len(symbols)}] {symbol}: Already completed, skipping")
-            continue
-        
-        # Mark as in progress
-        div_service.update_backfill_progress('splits', symbol, 'in_progress')
-        
-        try:
-            # Fetch and validate
-            validated, skipped = await fetch_splits_for_symbol(
-                symbol,
-                polygon_client,
-                START_DATE,
-                END_DATE,
-                validation_service
-            )
-            
-            if not validated:
-                # Mark as completed even if no data
-                div_service.update_backfill_progress('splits', symbol, 'completed')
-                logger.info(f"[{idx}/{len(symbols)}] {symbol}: No split data")
-                continue
+    async def backfill_symbol(idx: int, symbol: str) -> tuple[int, int, int]:
+        """Backfill one symbol; returns (inserted, skipped, validation_errors)"""
+        async with semaphore:
+            # Check if already completed
+            progress = div_service.get_backfill_progress('splits', symbol)
+            if progress and progress['status'] == 'completed':
+                logger.info(f"[{idx}/{len(symbols)}] {symbol}: Already completed, skipping")
+                return 0, 0, 0
             
-            # Insert into database
-            inserted, db_skipped = div_service.insert_splits_batch(symbol, validated)
+            # Mark as in progress
+            div_service.update_backfill_progress('splits', symbol, 'in_progress')
             
-            total_inserted += inserted
-            total_skipped += skipped + db_skipped
-            total_validation_errors += skipped
+            try:
+                # Respect rate limits, then fetch and validate
+                await rate_limiter.acquire()
+                validated, skipped = await fetch_splits_for_symbol(
+                    symbol,
+                    polygon_client,
+                    START_DATE,
+                    END_DATE,
+                    validation_service
+                )
+                
+                if not validated:
+                    # Mark as completed even if no data
+                    div_service.update_backfill_progress('splits', symbol, 'completed')
+                    logger.info(f"[{idx}/{len(symbols)}] {symbol}: No split data")
+                    return 0, 0, 0
+                
+                # Insert into database
+                inserted, db_skipped = div_service.insert_splits_batch(symbol, validated)
+                
+                # Mark as completed
+                div_service.update_backfill_progress('splits', symbol, 'completed')
+                logger.info(
+                    f"[{idx}/{len(symbols)}] {symbol}: ✓ Inserted {inserted}, "
+                    f"skipped {db_skipped} (validation errors: {skipped})"
+                )
+                return inserted, skipped + db_skipped, skipped
             
-            # Mark as completed
-            div_service.update_backfill_progress('splits', symbol, 'completed')
-            logger.info(
-                f"[{idx}/{len(symbols)}] {symbol}: ✓ Inserted {inserted}, "
-                f"skipped {db_skipped} (validation errors: {skipped})"
-            )
-        
-        except Exception as e:
-            logger.error(f"[{idx}/{len(symbols)}] {symbol}: ✗ Error - {e}")
-            div_service.update_backfill_progress(
-                'splits',
-                symbol,
-                'failed',
-                error_message=str(e)
-            )
-            total_skipped += 1
-        
-        # Respect rate limits
-        await asyncio.sleep(RATE_LIMIT_DELAY)
+            except Exception as e:
+                logger.error(f"[{idx}/{len(symbols)}] {symbol}: ✗ Error - {e}")
+                div_service.update_backfill_progress(
+                    'splits',
+                    symbol,
+                    'failed',
+                    error_message=str(e)
+                )
+                return 0, 1, 0
+    
+    # Fetches overlap up to FETCH_CONCURRENCY; the rate limiter keeps the
+    # aggregate request rate under the Polygon limit
+    try:
+        results = await asyncio.gather(
+            *(backfill_symbol(idx, symbol) for idx, symbol in enumerate(symbols, 1))
+        )
+    finally:
+        await polygon_client.close()
+    total_inserted = sum(r[0] for r in results)
+    total_skipped = sum(r[1] for r in results)
+    total_validation_errors = sum(r[2] for r in results)
     
     logger.info("=" * 60)
     logger.info("Stock split backfill complete!")
@@ -26,9 +26,15 @@ class FeatureEngineering:
         df['return_5d'] = df['close'].pct_change(5)
         df['return_20d'] = df['close'].pct_change(20)
         
-        # Price ranges
-        df['high_low_ratio'] = (df['high'] - df['low']) / df['close']
-        df['close_open_ratio'] = (df['close'] - df['open']) / df['open']
+        # Price ranges (single eval pass; uses numexpr when it is installed).
+        # eval needs numeric dtypes, so evaluate on a float copy of the price
+        # columns; NUMERIC columns come back from the DB as object/Decimal
+        ranges = df[['open', 'high', 'low', 'close']].astype(float).eval(
+            "high_low_ratio = (high - low) / close\n"
+            "close_open_ratio = (close - open) / open"
+        )
+        df['high_low_ratio'] = ranges['high_low_ratio']
+        df['close_open_ratio'] = ranges['close_open_ratio']
         
         # Volatility
         df['volatility_20'] = df['return_1d'].rolling(20).std()
@@ -274,11 +280,16 @@ def build_ml_dataset(
     news_df: pd.DataFrame = None,
     iv_df: pd.DataFrame = None,
     target_horizon: int = 5,
-    regression: bool = False
+    regression: bool = False,
+    feature_dtype=np.float32
 ) -> tuple[pd.DataFrame, pd.Series]:
     """
     Build complete ML dataset with all features
     
+    Features are computed in float64 and stored as ``feature_dtype``
+    (float32 by default, which halves the size of the feature matrix).
+    Pass ``np.float64`` to keep full precision.
+    
     Returns:
         (features_df, target_series)
     """
@@ -330,4 +341,8 @@ def build_ml_dataset(
     # Fill NaN features with median
     df = df.fillna(df.median())
     
+    # Downcast float features once all rolling/pct_change math is done
+    float_cols = df.select_dtypes(include='float64').columns
+    df[float_cols] = df[float_cols].astype(feature_dtype)
+    
     return df, target
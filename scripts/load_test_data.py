@@ -31,17 +31,27 @@ YEARS = 5
 START_DATE = datetime.now() - timedelta(days=365 * YEARS)
 END_DATE = datetime.now()
 
+# market_data columns written by the loader, in COPY order
+MARKET_DATA_COLUMNS = [
+    "symbol", "date", "open", "high", "low", "close",
+    "volume", "vwap", "quality_score", "is_validated", "has_gaps",
+]
+
+# Seeded generator so repeated loads produce identical candles
+RANDOM_SEED = 42
+_RNG = random.Random(RANDOM_SEED)
+
 
 def generate_ohlcv_data(symbol: str, date: datetime, base_price: float) -> dict:
     """Generate realistic OHLCV candle data"""
     # Random walk for prices
-    daily_return = random.gauss(0.0005, 0.02)
+    daily_return = _RNG.gauss(0.0005, 0.02)
     price = base_price * (1 + daily_return)
     
     # Open, high, low, close with realistic volatility
-    open_price = price * (1 + random.gauss(0, 0.005))
-    high_price = price * (1 + abs(random.gauss(0.01, 0.015)))
-    low_price = price * (1 - abs(random.gauss(0.01, 0.015)))
+    open_price = price * (1 + _RNG.gauss(0, 0.005))
+    high_price = price * (1 + abs(_RNG.gauss(0.01, 0.015)))
+    low_price = price * (1 - abs(_RNG.gauss(0.01, 0.015)))
     close_price = price
     
     # Ensure OHLC constraints
@@ -50,7 +60,7 @@ def generate_ohlcv_data(symbol: str, date: datetime, base_price: float) -> dict:
     
     # Volume based on volatility
     base_volume = 1_000_000 if "stock" in symbol else 100_000
-    volume = int(base_volume * (1 + abs(random.gauss(0, 0.5))))
+    volume = int(base_volume * (1 + abs(_RNG.gauss(0, 0.5))))
     
     return {
         "symbol": symbol,
@@ -61,12 +71,30 @@ def generate_ohlcv_data(symbol: str, date: datetime, base_price: float) -> dict:
         "close": round(close_price, 2),
         "volume": volume,
         "vwap": round((open_price + high_price + low_price + close_price) / 4, 2),
-        "quality_score": random.uniform(0.85, 1.0),
+        "quality_score": _RNG.uniform(0.85, 1.0),
         "is_validated": True,
         "has_gaps": False,
     }
 
 
+def iter_candle_records(symbol: str, asset_class: str):
+    """Yield MARKET_DATA_COLUMNS tuples for every candle from START_DATE to END_DATE"""
+    current_date = START_DATE
+    base_price = 100.0
+    
+    while current_date <= END_DATE:
+        # Skip weekends for stocks
+        if asset_class == "stock" and current_date.weekday() >= 5:
+            current_date += timedelta(days=1)
+            continue
+        
+        candle = generate_ohlcv_data(symbol, current_date, base_price)
+        base_price = candle["close"]  # Use close as base for next day
+        yield tuple(candle[column] for column in MARKET_DATA_COLUMNS)
+        
+        current_date += timedelta(days=1)
+
+
 async def load_test_data():
     """Load test data into database"""
     
@@ -106,41 +134,29 @@ async def load_test_data():
         except Exception as e:
             print(f"   ⚠️  Could not insert symbol: {e}")
         
-        # Generate and load 5 years of data
-        current_date = START_DATE
-        base_price = 100.0
-        candle_count = 0
-        
-        candles = []
-        
-        while current_date <= END_DATE:
-            # Skip weekends for stocks
-            if asset_class == "stock" and current_date.weekday() >= 5:
-                current_date += timedelta(days=1)
-                continue
-            
-            # Generate candle
-            candle = generate_ohlcv_data(symbol, current_date, base_price)
-            base_price = candle["close"]  # Use close as base for next day
-            candles.append(candle)
-            candle_count += 1
-            
-            current_date += timedelta(days=1)
-        
-        # Batch insert candles
+        # Bulk load 5 years of candles: COPY into a staging table, then one
+        # INSERT ... SELECT keeps the ON CONFLICT DO NOTHING semantics.
+        # Rows are generated as COPY consumes them, never held as a list.
         try:
-            await conn.executemany(
-                """
-                INSERT INTO market_data 
-                (symbol, date, open, high, low, close, volume, vwap, quality_score, is_validated, has_gaps)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                ON CONFLICT (symbol, date) DO NOTHING
-                """,
-                [(
-                    c["symbol"], c["date"], c["open"], c["high"], c["low"], c["close"],
-                    c["volume"], c["vwap"], c["quality_score"], c["is_validated"], c["has_gaps"]
-                ) for c in candles]
-            )
+            columns = ", ".join(MARKET_DATA_COLUMNS)
+            async with conn.transaction():
+                await conn.execute(
+                    "CREATE TEMP TABLE market_data_stage "
+                    "(LIKE market_data INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                status = await conn.copy_records_to_table(
+                    "market_data_stage",
+                    records=iter_candle_records(symbol, asset_class),
+                    columns=MARKET_DATA_COLUMNS,
+                )
+                candle_count = int(status.split()[-1])  # "COPY <n>"
+                await conn.execute(
+                    f"""
+                    INSERT INTO market_data ({columns})
+                    SELECT {columns} FROM market_data_stage
+                    ON CONFLICT (symbol, date) DO NOTHING
+                    """
+                )
             print(f"   ✅ Loaded {candle_count} candles")
             total_records += candle_count
         
@@ -9,31 +9,115 @@ import time
 import json
 import sys
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import random
 
 import aiohttp
 import asyncio
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop for the load generator
+    uvloop = None
+
+
+class LatencyReservoir:
+    """
+    Bounded sample of response times for long-running tests.
+    
+    Keeps a uniform random sample of at most `size` durations (Vitter's
+    Algorithm R) so percentiles stay cheap and memory stays flat however
+    long the test runs. Count, sum, min and max are tracked exactly.
+    """
+    
+    def __init__(self, size: int = 10_000, rng: Optional[random.Random] = None):
+        self.size = size
+        self.samples: List[float] = []
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self._rng = rng or random.Random()
+    
+    def add(self, duration_ms: float):
+        """Record one response time"""
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        
+        if len(self.samples) < self.size:
+            self.samples.append(duration_ms)
+        else:
+            j = self._rng.randrange(self.count)
+            if j < self.size:
+                self.samples[j] = duration_ms
+    
+    def stats(self) -> Dict[str, float]:
+        """Exact avg/min/max plus p95/p99 estimated from the sample"""
+        stats = LoadTestRunner.latency_stats(self.samples)
+        stats.update(
+            avg=self.total_ms / self.count,
+            min=self.min_ms,
+            max=self.max_ms,
+        )
+        return stats
 
 
 class LoadTestRunner:
     """Execute load tests against running API"""
     
-    def __init__(self, base_url: str = "http://localhost:8000", workers: int = 10):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        workers: int = 10,
+        max_connections: int = 200
+    ):
         self.base_url = base_url
         self.workers = workers
+        self.max_connections = max_connections
         self.results: List[Dict] = []
         self.symbols = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA"]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._healthy: Optional[bool] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session so all requests reuse keep-alive connections"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        
+    async def health_check(self, refresh: bool = False) -> bool:
+        """
+        Check if API is responding.
+        
+        The probe runs once per runner and the result is reused by every
+        test phase; pass refresh=True to probe again.
+        """
+        if self._healthy is not None and not refresh:
+            return self._healthy
         
-    async def health_check(self) -> bool:
-        """Check if API is responding"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/health", timeout=5) as resp:
-                    return resp.status == 200
+            session = self._get_session()
+            async with session.get(f"{self.base_url}/health", timeout=5) as resp:
+                self._healthy = resp.status == 200
         except Exception as e:
             print(f"Health check failed: {e}")
-            return False
+            self._healthy = False
+        
+        return self._healthy
     
     async def test_endpoint(
         self,
@@ -42,27 +126,27 @@ class LoadTestRunner:
         success_status: int = 200
     ) -> Dict:
         """Test a single endpoint"""
-        start = time.time()
+        start = time.perf_counter()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    f"{self.base_url}{endpoint}",
-                    timeout=10
-                ) as resp:
-                    await resp.json()
-                    duration = (time.time() - start) * 1000
-                    return {
-                        "success": resp.status == success_status,
-                        "status": resp.status,
-                        "duration_ms": duration,
-                        "endpoint": endpoint
-                    }
+            session = self._get_session()
+            async with session.request(
+                method,
+                f"{self.base_url}{endpoint}",
+                timeout=10
+            ) as resp:
+                await resp.json()
+                duration = (time.perf_counter() - start) * 1000
+                return {
+                    "success": resp.status == success_status,
+                    "status": resp.status,
+                    "duration_ms": duration,
+                    "endpoint": endpoint
+                }
         except asyncio.TimeoutError:
             return {
                 "success": False,
                 "status": 0,
-                "duration_ms": (time.time() - start) * 1000,
+                "duration_ms": (time.perf_counter() - start) * 1000,
                 "error": "timeout",
                 "endpoint": endpoint
             }
@@ -70,7 +154,7 @@ class LoadTestRunner:
             return {
                 "success": False,
                 "status": 0,
-                "duration_ms": (time.time() - start) * 1000,
+                "duration_ms": (time.perf_counter() - start) * 1000,
                 "error": str(e),
                 "endpoint": endpoint
             }
@@ -80,6 +164,28 @@ class LoadTestRunner:
         endpoint = f"/api/v1/historical/{symbol}?start=2024-01-01&end=2024-01-31"
         return await self.test_endpoint(endpoint, success_status=200)
     
+    @staticmethod
+    def latency_stats(durations: List[float]) -> Dict[str, float]:
+        """
+        Summarize response times (ms) from a single float64 array.
+        
+        Both percentiles come from one np.partition call (O(n) selection)
+        at the same rank as sorted(durations)[int(n * q)].
+        """
+        arr = np.asarray(durations, dtype=np.float64)
+        n = len(arr)
+        k95 = min(int(n * 0.95), n - 1)
+        k99 = min(int(n * 0.99), n - 1)
+        part = np.partition(arr, [k95, k99])
+        
+        return {
+            "avg": float(arr.mean()),
+            "min": float(arr.min()),
+            "max": float(arr.max()),
+            "p95": float(part[k95]),
+            "p99": float(part[k99]),
+        }
+    
     async def worker(self, test_func, iterations: int):
         """Worker task executing test function repeatedly"""
         for _ in range(iterations):
@@ -120,29 +226,28 @@ class LoadTestRunner:
                 for _ in range(self.workers)
             ]
             
-            start = time.time()
+            start = time.perf_counter()
             await asyncio.gather(*tasks)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             
             # Analyze results
             successful = sum(1 for r in self.results if r["success"])
             failed = len(self.results) - successful
             
             if self.results:
-                durations = [r["duration_ms"] for r in self.results]
-                avg_duration = sum(durations) / len(durations)
-                min_duration = min(durations)
-                max_duration = max(durations)
+                stats = self.latency_stats([r["duration_ms"] for r in self.results])
                 throughput = len(self.results) / duration
                 
-                print(f"{test_name}:")
-                print(f"  Requests: {len(self.results)} | "
-                      f"Success: {successful} | Failed: {failed} | "
-                      f"Success Rate: {(successful/len(self.results)*100):.1f}%")
-                print(f"  Avg: {avg_duration:.2f}ms | "
-                      f"Min: {min_duration:.2f}ms | "
-                      f"Max: {max_duration:.2f}ms | "
-                      f"Throughput: {throughput:.1f} req/s")
+                sys.stdout.write("\n".join([
+                    f"{test_name}:",
+                    f"  Requests: {len(self.results)} | "
+                    f"Success: {successful} | Failed: {failed} | "
+                    f"Success Rate: {(successful/len(self.results)*100):.1f}%",
+                    f"  Avg: {stats['avg']:.2f}ms | "
+                    f"Min: {stats['min']:.2f}ms | "
+                    f"Max: {stats['max']:.2f}ms | "
+                    f"Throughput: {throughput:.1f} req/s",
+                ]) + "\n")
         
         print()
     
@@ -170,35 +275,32 @@ class LoadTestRunner:
             for _ in range(self.workers)
         ]
         
-        start = time.time()
+        start = time.perf_counter()
         await asyncio.gather(*tasks)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         # Analyze results
         successful = sum(1 for r in self.results if r["success"])
         failed = len(self.results) - successful
         
         if self.results:
-            durations = [r["duration_ms"] for r in self.results]
-            avg_duration = sum(durations) / len(durations)
-            min_duration = min(durations)
-            max_duration = max(durations)
-            p95_duration = sorted(durations)[int(len(durations) * 0.95)]
-            p99_duration = sorted(durations)[int(len(durations) * 0.99)]
+            stats = self.latency_stats([r["duration_ms"] for r in self.results])
             throughput = len(self.results) / duration
             
-            print(f"Total Requests: {len(self.results)}")
-            print(f"Successful: {successful}")
-            print(f"Failed: {failed}")
-            print(f"Success Rate: {(successful/len(self.results)*100):.1f}%\n")
-            print(f"Response Time Statistics (ms):")
-            print(f"  Average:    {avg_duration:.2f}")
-            print(f"  Min:        {min_duration:.2f}")
-            print(f"  Max:        {max_duration:.2f}")
-            print(f"  P95:        {p95_duration:.2f}")
-            print(f"  P99:        {p99_duration:.2f}\n")
-            print(f"Throughput: {throughput:.1f} req/s")
-            print(f"Test Duration: {duration:.2f}s")
+            sys.stdout.write("\n".join([
+                f"Total Requests: {len(self.results)}",
+                f"Successful: {successful}",
+                f"Failed: {failed}",
+                f"Success Rate: {(successful/len(self.results)*100):.1f}%\n",
+                "Response Time Statistics (ms):",
+                f"  Average:    {stats['avg']:.2f}",
+                f"  Min:        {stats['min']:.2f}",
+                f"  Max:        {stats['max']:.2f}",
+                f"  P95:        {stats['p95']:.2f}",
+                f"  P99:        {stats['p99']:.2f}\n",
+                f"Throughput: {throughput:.1f} req/s",
+                f"Test Duration: {duration:.2f}s",
+            ]) + "\n")
         
         print()
     
@@ -215,44 +317,51 @@ class LoadTestRunner:
         print(f"Testing with {self.workers} concurrent workers...")
         print(f"Running for {duration_seconds} seconds...\n")
         
-        self.results = []
-        start_time = time.time()
+        # Request count grows with duration, so keep a bounded sample
+        # rather than every result
+        latencies = LatencyReservoir()
+        successful = 0
+        start_time = time.perf_counter()
         
         async def sustained_worker():
-            while time.time() - start_time < duration_seconds:
+            nonlocal successful
+            while time.perf_counter() - start_time < duration_seconds:
                 symbol = random.choice(self.symbols)
                 result = await self.test_historical_endpoint(symbol)
-                self.results.append(result)
+                latencies.add(result["duration_ms"])
+                if result["success"]:
+                    successful += 1
                 await asyncio.sleep(0.01)  # Small delay between requests
         
         # Create tasks
         tasks = [sustained_worker() for _ in range(self.workers)]
         
-        start = time.time()
+        start = time.perf_counter()
         await asyncio.gather(*tasks)
-        total_duration = time.time() - start
+        total_duration = time.perf_counter() - start
         
         # Analyze results
-        successful = sum(1 for r in self.results if r["success"])
-        failed = len(self.results) - successful
+        total = latencies.count
+        failed = total - successful
         
-        if self.results:
-            durations = [r["duration_ms"] for r in self.results]
-            avg_duration = sum(durations) / len(durations)
-            min_duration = min(durations)
-            max_duration = max(durations)
-            throughput = len(self.results) / total_duration
+        if total:
+            stats = latencies.stats()
+            throughput = total / total_duration
             
-            print(f"Total Requests: {len(self.results)}")
-            print(f"Successful: {successful}")
-            print(f"Failed: {failed}")
-            print(f"Success Rate: {(successful/len(self.results)*100):.1f}%\n")
-            print(f"Response Time Statistics (ms):")
-            print(f"  Average:    {avg_duration:.2f}")
-            print(f"  Min:        {min_duration:.2f}")
-            print(f"  Max:        {max_duration:.2f}\n")
-            print(f"Throughput: {throughput:.1f} req/s")
-            print(f"Actual Duration: {total_duration:.2f}s")
+            sys.stdout.write("\n".join([
+                f"Total Requests: {total}",
+                f"Successful: {successful}",
+                f"Failed: {failed}",
+                f"Success Rate: {(successful/total*100):.1f}%\n",
+                "Response Time Statistics (ms):",
+                f"  Average:    {stats['avg']:.2f}",
+                f"  Min:        {stats['min']:.2f}",
+                f"  Max:        {stats['max']:.2f}",
+                f"  P95:        {stats['p95']:.2f}",
+                f"  P99:        {stats['p99']:.2f}\n",
+                f"Throughput: {throughput:.1f} req/s",
+                f"Actual Duration: {total_duration:.2f}s",
+            ]) + "\n")
         
         print()
     
@@ -314,10 +423,13 @@ async def main():
     runner = LoadTestRunner(base_url="http://localhost:8000", workers=10)
     
     # Run all tests
-    await runner.run_baseline_test()
-    await runner.run_historical_load_test()
-    await runner.run_sustained_load_test(duration_seconds=30)
-    await runner.run_spike_test()
+    try:
+        await runner.run_baseline_test()
+        await runner.run_historical_load_test()
+        await runner.run_sustained_load_test(duration_seconds=30)
+        await runner.run_spike_test()
+    finally:
+        await runner.close()
     
     print("="*60)
     print(f"Completed: {datetime.utcnow().isoformat()}")
@@ -325,4 +437,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -20,6 +20,9 @@ from typing import Optional, Dict, Any
 import pandas as pd
 import json
 
+# Default timeout for every request on the shared probe session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
 
 class FreeDataSourceTester:
     def __init__(self):
@@ -35,7 +38,7 @@ class FreeDataSourceTester:
         self.session = None
 
     async def init_session(self):
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(timeout=HTTP_TIMEOUT)
 
     async def close_session(self):
         if self.session:
@@ -145,7 +148,7 @@ class FreeDataSourceTester:
 
         for endpoint_name, url in endpoints.items():
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         self.results["alpha_vantage"][endpoint_name] = {
@@ -176,7 +179,7 @@ class FreeDataSourceTester:
         for name, series_id in series_ids.items():
             url = f"https://api.stlouisfed.org/fred/series/observations?series_id={series_id}&api_key={api_key}&file_type=json"
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         obs = data.get("observations", [])
@@ -202,7 +205,7 @@ class FreeDataSourceTester:
 
         for endpoint_name, url in endpoints.items():
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         if isinstance(data, dict):
@@ -238,7 +241,7 @@ class FreeDataSourceTester:
 
         for endpoint_name, url in endpoints.items():
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         self.results["finnhub"][endpoint_name] = {
@@ -267,7 +270,7 @@ class FreeDataSourceTester:
 
         for endpoint_name, url in endpoints.items():
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         self.results["iex_cloud"][endpoint_name] = {
@@ -297,7 +300,7 @@ class FreeDataSourceTester:
 
         for endpoint_name, url in endpoints.items():
             try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                async with self.session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         self.results["polygon"][endpoint_name] = {
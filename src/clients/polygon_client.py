@@ -1,13 +1,44 @@
 """Polygon.io API client for US stocks and crypto"""
 
 import aiohttp
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Dict, Optional
+import os
+import random
+from pathlib import Path
+from typing import Awaitable, Callable, List, Dict, Optional
 from datetime import datetime, timedelta
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Fall back to the stdlib decoder
+    from json import loads as json_loads
+
+from src.services.scheduler_retry import RateLimiter
+
 logger = logging.getLogger(__name__)
 
+# fetch_range retry policy: decorrelated jitter between base and cap seconds
+FETCH_MAX_ATTEMPTS = 3
+FETCH_BACKOFF_BASE = 2.0
+FETCH_BACKOFF_CAP = 10.0
+
+# Connection pool for the shared session: enough for concurrent symbol
+# fan-out, kept alive between requests so TLS handshakes aren't repeated
+HTTP_CONNECTION_LIMIT = 128
+HTTP_CONNECTIONS_PER_HOST = 64
+HTTP_KEEPALIVE_TIMEOUT = 30
+
+# Reference endpoints served from the on-disk cache, with the record field
+# used to trim whole cached years back to the requested window
+CACHED_REFERENCE_DATE_FIELDS = {
+    'dividends': 'ex_dividend_date',
+    'splits': 'execution_date',
+}
+
 # Timeframe to Polygon API mapping
 TIMEFRAME_MAP = {
     '5m': {'multiplier': 5, 'timespan': 'minute'},
@@ -20,6 +51,10 @@ TIMEFRAME_MAP = {
 }
 
 
+class _RetryableError(ValueError):
+    """Transient Polygon failure (429, 5xx, network) worth retrying"""
+
+
 class PolygonClient:
     """
     Polygon.io API client for US stocks and crypto.
@@ -36,10 +71,119 @@ class PolygonClient:
     Rate limit: 150 requests/minute
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, requests_per_minute: int = 150, cache_dir: Optional[str] = None):
         self.api_key = api_key
         self.base_url = "https://api.polygon.io/v2"
         self.crypto_base_url = "https://api.polygon.io/v1"
+        # Shared by every fetch_range call on this client, so concurrent
+        # symbols are paced against the account limit instead of tripping 429s
+        self.rate_limiter = RateLimiter(max_requests=requests_per_minute, window_seconds=60)
+        self.rate_limited_count = 0
+        # On-disk cache of closed calendar years of dividends/splits (None disables it)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Session shared by every request on this client, created on first use.
+        
+        A new one is opened if the previous session was closed or belongs to
+        a different event loop than the caller's; a stale session from another
+        loop is closed first so its connector isn't leaked.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            logger.debug("Event loop changed; replacing Polygon HTTP session")
+            await self.close()
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    def _cache_path(self, endpoint: str, symbol: str, year: int) -> Path:
+        """Cache file for one calendar year of a reference endpoint"""
+        key = hashlib.sha256(f"{endpoint}:{symbol}:{year}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[List[Dict]]:
+        """Cached results for path, or None on a miss"""
+        try:
+            return json_loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+    
+    @staticmethod
+    def _write_cache(path: Optional[Path], results: List[Dict]) -> None:
+        """Store results at path (None = don't cache); failures are logged, never raised"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(results))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+    
+    async def _fetch_reference(
+        self,
+        endpoint: str,
+        symbol: str,
+        start: str,
+        end: str,
+        fetch_window: Callable[..., Awaitable[List[Dict]]]
+    ) -> List[Dict]:
+        """
+        Run fetch_window over start..end, serving closed calendar years from disk.
+        
+        Past data doesn't change, so every year that ended before the current
+        one is fetched whole once and cached; only the current year is fetched
+        live. Cached years are trimmed back to start..end by record date.
+        """
+        if self.cache_dir is None:
+            return await fetch_window(symbol, start, end)
+        
+        date_field = CACHED_REFERENCE_DATE_FIELDS[endpoint]
+        current_year = datetime.utcnow().year
+        first_year, last_year = int(start[:4]), int(end[:4])
+        
+        results = []
+        for year in range(first_year, min(last_year, current_year - 1) + 1):
+            path = self._cache_path(endpoint, symbol, year)
+            records = self._read_cache(path)
+            if records is None:
+                records = await fetch_window(symbol, f"{year}-01-01", f"{year}-12-31", cache_path=path)
+            else:
+                logger.info(f"Loaded {len(records)} cached {endpoint} for {symbol} ({year})")
+            results.extend(
+                record for record in records
+                if start <= (record.get(date_field) or start)[:10] <= end
+            )
+        
+        if last_year >= current_year:
+            tail_start = max(start, f"{current_year}-01-01")
+            results.extend(await fetch_window(symbol, tail_start, end))
+        
+        return results
     
     @staticmethod
     def _get_timeframe_params(timeframe: str) -> Dict[str, any]:
@@ -90,10 +234,6 @@ class PolygonClient:
         
         return symbol
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def fetch_range(
         self,
         symbol: str,
@@ -108,6 +248,10 @@ class PolygonClient:
         
         Supports both stocks and crypto with same method.
         
+        Requests are paced by the client's rate limiter. 429s, 5xx responses
+        and network errors are retried up to FETCH_MAX_ATTEMPTS times with
+        decorrelated-jitter backoff; other errors fail immediately.
+        
         Returns list of candles:
         [{'t': timestamp_ms, 'o': open, 'h': high, 'l': low, 'c': close, 'v': volume, 'n': count}]
         
@@ -146,33 +290,65 @@ class PolygonClient:
             "adjusted": str(adjusted).lower()
         }
         
+        delay = FETCH_BACKOFF_BASE
+        for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+            await self.rate_limiter.acquire()
+            try:
+                return await self._fetch_aggregates(url, params, symbol, timeframe, start, end)
+            except _RetryableError as e:
+                if attempt == FETCH_MAX_ATTEMPTS:
+                    raise ValueError(str(e)) from e
+                delay = min(FETCH_BACKOFF_CAP, random.uniform(FETCH_BACKOFF_BASE, delay * 3))
+                logger.warning(
+                    f"Attempt {attempt} for {symbol} ({timeframe}) failed: {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+    
+    async def _fetch_aggregates(
+        self,
+        url: str,
+        params: Dict,
+        symbol: str,
+        timeframe: str,
+        start: str,
+        end: str
+    ) -> List[Dict]:
+        """Single aggregates request; raises _RetryableError for transient failures"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) for {symbol} ({timeframe}) - {start} to {end}")
-                        raise ValueError("Rate limited (429) - too many requests")
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} for {symbol} ({timeframe})")
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    data = await response.json()
-                    
-                    # Check for API-level errors
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} ({timeframe}): {data.get('message')}")
-                        return []
-                    
-                    # Extract results or return empty list
-                    results = data.get("results", [])
-                    logger.info(f"Fetched {len(results)} candles for {symbol} ({timeframe}) from {start} to {end}")
-                    return results
-        
-        except aiohttp.ClientError as e:
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    self.rate_limited_count += 1
+                    logger.warning(f"Rate limited (429) for {symbol} ({timeframe}) - {start} to {end}")
+                    raise _RetryableError("Rate limited (429) - too many requests")
+                
+                if response.status >= 500:
+                    logger.error(f"API error {response.status} for {symbol} ({timeframe})")
+                    raise _RetryableError(f"API returned status {response.status}")
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} for {symbol} ({timeframe})")
+                    raise ValueError(f"API returned status {response.status}")
+                
+                data = await response.json(loads=json_loads)
+                
+                # Check for API-level errors
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} ({timeframe}): {data.get('message')}")
+                    return []
+                
+                # Extract results or return empty list
+                results = data.get("results", [])
+                logger.info(f"Fetched {len(results)} candles for {symbol} ({timeframe}) from {start} to {end}")
+                return results
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Network error fetching {symbol} ({timeframe}): {e}")
-            raise ValueError(f"Network error: {e}")
+            raise _RetryableError(f"Network error: {e}")
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error fetching {symbol} ({timeframe}): {e}")
             raise
@@ -247,20 +423,16 @@ class PolygonClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("results")
-                    return None
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=10) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    return data.get("results")
+                return None
         except Exception as e:
             logger.error(f"Error fetching ticker details for {symbol}: {e}")
             return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def fetch_dividends(
         self,
         symbol: str,
@@ -281,6 +453,20 @@ class PolygonClient:
         Raises:
             ValueError: If API error or rate limit
         """
+        return await self._fetch_reference("dividends", symbol, start, end, self._fetch_dividends_window)
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def _fetch_dividends_window(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        cache_path: Optional[Path] = None
+    ) -> List[Dict]:
+        """Single dividends request; results are written to cache_path on success"""
         url = "https://api.polygon.io/v2/reference/dividends"
         
         params = {
@@ -292,27 +478,28 @@ class PolygonClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) fetching dividends for {symbol}")
-                        raise ValueError("Rate limited (429) - too many requests")
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} fetching dividends for {symbol}")
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    data = await response.json()
-                    
-                    # Check for API-level errors
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} dividends: {data.get('message')}")
-                        return []
-                    
-                    results = data.get("results", [])
-                    logger.info(f"Fetched {len(results)} dividends for {symbol} ({start} to {end})")
-                    return results
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    logger.warning(f"Rate limited (429) fetching dividends for {symbol}")
+                    raise ValueError("Rate limited (429) - too many requests")
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} fetching dividends for {symbol}")
+                    raise ValueError(f"API returned status {response.status}")
+                
+                data = await response.json(loads=json_loads)
+                
+                # Check for API-level errors
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} dividends: {data.get('message')}")
+                    return []
+                
+                results = data.get("results", [])
+                logger.info(f"Fetched {len(results)} dividends for {symbol} ({start} to {end})")
+                self._write_cache(cache_path, results)
+                return results
         
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching dividends for {symbol}: {e}")
@@ -321,10 +508,6 @@ class PolygonClient:
             logger.error(f"Unexpected error fetching dividends for {symbol}: {e}")
             raise
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def fetch_stock_splits(
         self,
         symbol: str,
@@ -345,6 +528,20 @@ class PolygonClient:
         Raises:
             ValueError: If API error or rate limit
         """
+        return await self._fetch_reference("splits", symbol, start, end, self._fetch_splits_window)
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def _fetch_splits_window(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        cache_path: Optional[Path] = None
+    ) -> List[Dict]:
+        """Single splits request; results are written to cache_path on success"""
         url = "https://api.polygon.io/v2/reference/splits"
         
         params = {
@@ -356,27 +553,28 @@ class PolygonClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) fetching splits for {symbol}")
-                        raise ValueError("Rate limited (429) - too many requests")
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} fetching splits for {symbol}")
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    data = await response.json()
-                    
-                    # Check for API-level errors
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} splits: {data.get('message')}")
-                        return []
-                    
-                    results = data.get("results", [])
-                    logger.info(f"Fetched {len(results)} splits for {symbol} ({start} to {end})")
-                    return results
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    logger.warning(f"Rate limited (429) fetching splits for {symbol}")
+                    raise ValueError("Rate limited (429) - too many requests")
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} fetching splits for {symbol}")
+                    raise ValueError(f"API returned status {response.status}")
+                
+                data = await response.json(loads=json_loads)
+                
+                # Check for API-level errors
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} splits: {data.get('message')}")
+                    return []
+                
+                results = data.get("results", [])
+                logger.info(f"Fetched {len(results)} splits for {symbol} ({start} to {end})")
+                self._write_cache(cache_path, results)
+                return results
         
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching splits for {symbol}: {e}")
@@ -416,26 +614,26 @@ class PolygonClient:
         all_articles = []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) fetching news for {symbol}")
-                        return []
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} fetching news for {symbol}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} news: {data.get('message')}")
-                        return []
-                    
-                    results = data.get("results", [])
-                    logger.info(f"Fetched {len(results)} news articles for {symbol} ({start} to {end})")
-                    return results
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    logger.warning(f"Rate limited (429) fetching news for {symbol}")
+                    return []
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} fetching news for {symbol}")
+                    return []
+                
+                data = await response.json(loads=json_loads)
+                
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} news: {data.get('message')}")
+                    return []
+                
+                results = data.get("results", [])
+                logger.info(f"Fetched {len(results)} news articles for {symbol} ({start} to {end})")
+                return results
         
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching news for {symbol}: {e}")
@@ -465,26 +663,26 @@ class PolygonClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) fetching earnings for {symbol}")
-                        return []
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} fetching earnings for {symbol}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} earnings: {data.get('message')}")
-                        return []
-                    
-                    results = data.get("results", [])
-                    logger.info(f"Fetched {len(results)} earnings records for {symbol} ({start} to {end})")
-                    return results
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    logger.warning(f"Rate limited (429) fetching earnings for {symbol}")
+                    return []
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} fetching earnings for {symbol}")
+                    return []
+                
+                data = await response.json(loads=json_loads)
+                
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} earnings: {data.get('message')}")
+                    return []
+                
+                results = data.get("results", [])
+                logger.info(f"Fetched {len(results)} earnings records for {symbol} ({start} to {end})")
+                return results
         
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching earnings for {symbol}: {e}")
@@ -514,30 +712,30 @@ class PolygonClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=30) as response:
-                    
-                    if response.status == 429:
-                        logger.warning(f"Rate limited (429) fetching options for {symbol}")
-                        return None
-                    
-                    if response.status == 404:
-                        logger.info(f"No options chain found for {symbol}")
-                        return None
-                    
-                    if response.status != 200:
-                        logger.error(f"API error {response.status} fetching options for {symbol}")
-                        return None
-                    
-                    data = await response.json()
-                    
-                    if data.get("status") == "ERROR":
-                        logger.warning(f"Polygon API error for {symbol} options: {data.get('message')}")
-                        return None
-                    
-                    results = data.get("results", {})
-                    logger.info(f"Fetched options chain snapshot for {symbol}")
-                    return results
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                
+                if response.status == 429:
+                    logger.warning(f"Rate limited (429) fetching options for {symbol}")
+                    return None
+                
+                if response.status == 404:
+                    logger.info(f"No options chain found for {symbol}")
+                    return None
+                
+                if response.status != 200:
+                    logger.error(f"API error {response.status} fetching options for {symbol}")
+                    return None
+                
+                data = await response.json(loads=json_loads)
+                
+                if data.get("status") == "ERROR":
+                    logger.warning(f"Polygon API error for {symbol} options: {data.get('message')}")
+                    return None
+                
+                results = data.get("results", {})
+                logger.info(f"Fetched options chain snapshot for {symbol}")
+                return results
         
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching options for {symbol}: {e}")
@@ -2,12 +2,14 @@
 
 import os
 import logging
-from typing import Optional, List
+from typing import FrozenSet, Optional, List
 
 logger = logging.getLogger(__name__)
 
 # Allowed timeframes for OHLCV data
 ALLOWED_TIMEFRAMES: List[str] = ['5m', '15m', '30m', '1h', '4h', '1d', '1w']
+# Same values for O(1) membership checks; keep the list for ordered display
+ALLOWED_TIMEFRAME_SET: FrozenSet[str] = frozenset(ALLOWED_TIMEFRAMES)
 DEFAULT_TIMEFRAMES: List[str] = ['1h', '1d']
 
 
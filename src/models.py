@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from typing import List, Optional
 from decimal import Decimal
-from src.config import ALLOWED_TIMEFRAMES, DEFAULT_TIMEFRAMES
+from src.config import ALLOWED_TIMEFRAMES, ALLOWED_TIMEFRAME_SET, DEFAULT_TIMEFRAMES
 
 
 class OHLCVData(BaseModel):
@@ -27,7 +27,7 @@ class OHLCVData(BaseModel):
     @validator('timeframe')
     def validate_timeframe(cls, v):
         """Validate timeframe is allowed"""
-        if v not in ALLOWED_TIMEFRAMES:
+        if v not in ALLOWED_TIMEFRAME_SET:
             raise ValueError(f"Invalid timeframe: {v}. Allowed: {ALLOWED_TIMEFRAMES}")
         return v
     
@@ -78,7 +78,7 @@ class TrackedSymbol(BaseModel):
         """Validate that all timeframes are allowed"""
         if not v:
             raise ValueError("At least one timeframe must be specified")
-        invalid = [tf for tf in v if tf not in ALLOWED_TIMEFRAMES]
+        invalid = [tf for tf in v if tf not in ALLOWED_TIMEFRAME_SET]
         if invalid:
             raise ValueError(f"Invalid timeframes: {invalid}. Allowed: {ALLOWED_TIMEFRAMES}")
         return v
@@ -99,7 +99,7 @@ class UpdateSymbolTimeframesRequest(BaseModel):
         """Validate that all timeframes are allowed"""
         if not v:
             raise ValueError("At least one timeframe must be specified")
-        invalid = [tf for tf in v if tf not in ALLOWED_TIMEFRAMES]
+        invalid = [tf for tf in v if tf not in ALLOWED_TIMEFRAME_SET]
         if invalid:
             raise ValueError(f"Invalid timeframes: {invalid}. Allowed: {ALLOWED_TIMEFRAMES}")
         # Remove duplicates and sort for consistency
@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from decimal import Decimal
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -37,7 +38,9 @@ class AutoBackfillScheduler:
         database_url: str,
         symbols: List[str] = None,
         schedule_hour: int = 2,
-        schedule_minute: int = 0
+        schedule_minute: int = 0,
+        max_concurrent_symbols: int = 5,
+        symbols_cache_ttl: int = 120
     ):
         """
         Initialize scheduler.
@@ -48,6 +51,8 @@ class AutoBackfillScheduler:
             symbols: List of symbols to backfill (loaded from DB if not provided)
             schedule_hour: UTC hour to run backfill (0-23, default 2)
             schedule_minute: Minute to run backfill (0-59, default 0)
+            max_concurrent_symbols: Symbols backfilled at once (default 5)
+            symbols_cache_ttl: Seconds a loaded symbol list is reused (default 120)
         """
         self.polygon_client = PolygonClient(polygon_api_key)
         self.db_service = DatabaseService(database_url)
@@ -60,6 +65,16 @@ class AutoBackfillScheduler:
         
         self.schedule_hour = schedule_hour
         self.schedule_minute = schedule_minute
+        self.max_concurrent_symbols = max(1, max_concurrent_symbols)
+        
+        # asyncpg pool for tracked_symbols reads/status writes, opened on
+        # first use and closed when each backfill job finishes
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        
+        # (loaded_at, symbols) from the last successful tracked_symbols read
+        self._symbols_cache: Optional[Tuple[float, List[tuple]]] = None
+        self._symbols_ttl = symbols_cache_ttl
         
         # APScheduler instance
         self.scheduler = AsyncIOScheduler()
@@ -75,6 +90,8 @@ class AutoBackfillScheduler:
             try:
                 loop = asyncio.get_event_loop()
                 self.symbols = loop.run_until_complete(self._load_symbols_from_db())
+                # Pool belongs to this loop; the job opens its own on the scheduler loop
+                loop.run_until_complete(self._close_pool())
                 logger.info(f"Loaded {len(self.symbols)} symbols from database")
             except Exception as e:
                 logger.error(f"Failed to load symbols from database: {e}")
@@ -110,30 +127,60 @@ class AutoBackfillScheduler:
             self.scheduler.shutdown()
             logger.info("Scheduler stopped")
     
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Return the shared connection pool, creating it on first use"""
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self.database_url,
+                        min_size=1,
+                        max_size=self.max_concurrent_symbols
+                    )
+        return self._pool
+    
+    async def _close_pool(self) -> None:
+        """Close the shared connection pool if open"""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+    
     async def _load_symbols_from_db(self) -> List[tuple]:
         """
         Load active symbols from tracked_symbols table with asset class and timeframes.
         
+        The result is reused for symbols_cache_ttl seconds; call
+        invalidate_symbols_cache() after changing tracked_symbols.
+        
         Returns:
             List of tuples (symbol, asset_class, timeframes) for active symbols
         """
+        if self._symbols_cache is not None:
+            loaded_at, symbols = self._symbols_cache
+            if time.monotonic() - loaded_at < self._symbols_ttl:
+                return symbols
+        
         try:
-            conn = await asyncpg.connect(self.database_url)
-            
-            rows = await conn.fetch(
-                "SELECT symbol, asset_class, timeframes FROM tracked_symbols WHERE active = TRUE ORDER BY symbol ASC"
-            )
-            
-            await conn.close()
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT symbol, asset_class, timeframes FROM tracked_symbols WHERE active = TRUE ORDER BY symbol ASC"
+                )
             
             # Return list of (symbol, asset_class, timeframes) tuples
             # timeframes is a PostgreSQL array, convert to list
-            return [(row['symbol'], row['asset_class'], row['timeframes'] or ['1d']) for row in rows]
+            symbols = [(row['symbol'], row['asset_class'], row['timeframes'] or ['1d']) for row in rows]
+            self._symbols_cache = (time.monotonic(), symbols)
+            return symbols
         
         except Exception as e:
             logger.error(f"Failed to load symbols from database: {e}")
             return []
     
+    def invalidate_symbols_cache(self) -> None:
+        """Force the next symbol load to re-read tracked_symbols"""
+        self._symbols_cache = None
+    
     async def _update_symbol_backfill_status(
         self,
         symbol: str,
@@ -149,28 +196,27 @@ class AutoBackfillScheduler:
             error_message: Error message if status is failed
         """
         try:
-            conn = await asyncpg.connect(self.database_url)
-            
-            if error_message:
-                await conn.execute(
-                    """
-                    UPDATE tracked_symbols
-                    SET backfill_status = $1, backfill_error = $2, last_backfill = NOW()
-                    WHERE symbol = $3
-                    """,
-                    status, error_message, symbol
-                )
-            else:
-                await conn.execute(
-                    """
-                    UPDATE tracked_symbols
-                    SET backfill_status = $1, backfill_error = NULL, last_backfill = NOW()
-                    WHERE symbol = $2
-                    """,
-                    status, symbol
-                )
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                if error_message:
+                    await conn.execute(
+                        """
+                        UPDATE tracked_symbols
+                        SET backfill_status = $1, backfill_error = $2, last_backfill = NOW()
+                        WHERE symbol = $3
+                        """,
+                        status, error_message, symbol
+                    )
+                else:
+                    await conn.execute(
+                        """
+                        UPDATE tracked_symbols
+                        SET backfill_status = $1, backfill_error = NULL, last_backfill = NOW()
+                        WHERE symbol = $2
+                        """,
+                        status, symbol
+                    )
             
-            await conn.close()
             logger.debug(f"Updated {symbol} backfill status to {status}")
         
         except Exception as e:
@@ -206,46 +252,50 @@ class AutoBackfillScheduler:
             "symbols_processed": []
         }
         
-        for symbol, asset_class, timeframes in self.symbols:
-            try:
-                # Update status: in_progress
-                await self._update_symbol_backfill_status(symbol, "in_progress", None)
-                
-                # Run backfill for each configured timeframe
-                total_for_symbol = 0
-                for timeframe in timeframes:
-                    records = await self._backfill_symbol(symbol, asset_class, timeframe)
-                    total_for_symbol += records
+        # Up to max_concurrent_symbols run at once; a finished symbol frees its
+        # slot for the next immediately. Request pacing is left to the Polygon
+        # client's rate limiter. Totals are tallied as each symbol finishes so
+        # progress is logged mid-run; symbols_processed keeps symbol order.
+        semaphore = asyncio.Semaphore(self.max_concurrent_symbols)
+        
+        async def run_symbol(index: int, symbol: str, asset_class: str, timeframes: List[str]) -> Tuple[int, Dict]:
+            async with semaphore:
+                return index, await self._backfill_symbol_timeframes(symbol, asset_class, timeframes)
+        
+        tasks = [
+            asyncio.ensure_future(run_symbol(index, symbol, asset_class, timeframes))
+            for index, (symbol, asset_class, timeframes) in enumerate(self.symbols)
+        ]
+        processed: List[Optional[Dict]] = [None] * len(tasks)
+        
+        try:
+            for done, next_finished in enumerate(asyncio.as_completed(tasks), start=1):
+                index, entry = await next_finished
+                processed[index] = entry
                 
-                if total_for_symbol > 0:
-                    results["success"] += 1
-                    # Update status: completed
-                    await self._update_symbol_backfill_status(symbol, "completed", None)
+                if entry["status"] == "failed":
+                    results["failed"] += 1
                 else:
-                    logger.warning(f"No records inserted for {symbol}")
-                    await self._update_symbol_backfill_status(symbol, "completed", "No records inserted")
+                    if entry["records"] > 0:
+                        results["success"] += 1
+                    results["total_records"] += entry["records"]
                 
-                results["total_records"] += total_for_symbol
-                results["symbols_processed"].append({
-                    "symbol": symbol,
-                    "asset_class": asset_class,
-                    "timeframes": timeframes,
-                    "records": total_for_symbol,
-                    "status": "completed"
-                })
-                
-            except Exception as e:
-                logger.error(f"Backfill failed for {symbol}: {e}")
-                results["failed"] += 1
-                # Update status: failed with error message
-                await self._update_symbol_backfill_status(symbol, "failed", str(e))
-                results["symbols_processed"].append({
-                    "symbol": symbol,
-                    "asset_class": asset_class,
-                    "timeframes": timeframes,
-                    "status": "failed",
-                    "error": str(e)
-                })
+                logger.info(
+                    f"Backfill progress: {done}/{len(tasks)} symbols "
+                    f"({entry['symbol']} {entry['status']})"
+                )
+        finally:
+            # If the job was cancelled or the loop above raised, stop the
+            # remaining symbols before closing what they're using
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Job runs once a day; don't hold idle connections in between
+            await self._close_pool()
+            await self.polygon_client.close()
+        
+        results["symbols_processed"] = processed
         
         _last_backfill_result = results
         
@@ -254,6 +304,55 @@ class AutoBackfillScheduler:
             f"{results['failed']} failed, {results['total_records']} records imported"
         )
     
+    async def _backfill_symbol_timeframes(self, symbol: str, asset_class: str, timeframes: List[str]) -> Dict:
+        """
+        Backfill every configured timeframe for one symbol and track its status.
+        
+        Returns:
+            Entry for the job's symbols_processed list
+        """
+        try:
+            # Update status: in_progress
+            await self._update_symbol_backfill_status(symbol, "in_progress", None)
+            
+            # Timeframes are independent fetches; run them together. Every
+            # timeframe finishes before a failure marks the symbol failed.
+            outcomes = await asyncio.gather(
+                *(self._backfill_symbol(symbol, asset_class, timeframe) for timeframe in timeframes),
+                return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+            total_for_symbol = sum(outcomes)
+            
+            if total_for_symbol > 0:
+                # Update status: completed
+                await self._update_symbol_backfill_status(symbol, "completed", None)
+            else:
+                logger.warning(f"No records inserted for {symbol}")
+                await self._update_symbol_backfill_status(symbol, "completed", "No records inserted")
+            
+            return {
+                "symbol": symbol,
+                "asset_class": asset_class,
+                "timeframes": timeframes,
+                "records": total_for_symbol,
+                "status": "completed"
+            }
+        
+        except Exception as e:
+            logger.error(f"Backfill failed for {symbol}: {e}")
+            # Update status: failed with error message
+            await self._update_symbol_backfill_status(symbol, "failed", str(e))
+            return {
+                "symbol": symbol,
+                "asset_class": asset_class,
+                "timeframes": timeframes,
+                "status": "failed",
+                "error": str(e)
+            }
+    
     async def _backfill_symbol(self, symbol: str, asset_class: str = "stock", timeframe: str = "1d") -> int:
         """
         Backfill data for a single symbol and timeframe with retries.
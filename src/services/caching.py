@@ -151,6 +151,18 @@ class QueryCache:
                 "namespace": namespace
             })
     
+    def reset(self):
+        """
+        Drop all entries and zero hit/miss counters.
+        
+        Also replaces the lock, so a reset cache can be reused from a new
+        event loop.
+        """
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+    
     @property
     def hit_rate(self) -> float:
         """Calculate cache hit rate"""
@@ -7,6 +7,10 @@ from decimal import Decimal, InvalidOperation
 
 logger = logging.getLogger(__name__)
 
+# Field sets checked for every candle, built once at import
+REQUIRED_FIELDS = ('o', 'h', 'l', 'c', 'v', 't')
+CRITICAL_FIELDS = ('o', 'h', 'l', 'c', 'v')
+
 
 class DataQualityChecker:
     """
@@ -101,8 +105,7 @@ class DataQualityChecker:
         """Check individual candle validity"""
         issues = []
         
-        required_fields = ['o', 'h', 'l', 'c', 'v', 't']
-        missing = [f for f in required_fields if f not in candle]
+        missing = [f for f in REQUIRED_FIELDS if f not in candle]
         if missing:
             issues.append(f"Candle {index}: missing fields {missing}")
             return issues
@@ -174,14 +177,9 @@ class DataQualityChecker:
         """Check data field completeness"""
         issues = []
         
-        expected_fields = {'o', 'h', 'l', 'c', 'v', 't', 'n', 'vw'}
-        
         for i, candle in enumerate(candles):
-            actual_fields = set(candle.keys())
-            
             # Check for null values in critical fields
-            critical_fields = ['o', 'h', 'l', 'c', 'v']
-            for field in critical_fields:
+            for field in CRITICAL_FIELDS:
                 if candle.get(field) is None:
                     issues.append(f"Candle {i}: null value in critical field '{field}'")
         
@@ -204,8 +202,7 @@ class DataQualityChecker:
         
         for candle in candles:
             # Check field completeness
-            expected_fields = {'o', 'h', 'l', 'c', 'v', 't'}
-            missing = len(expected_fields - set(candle.keys())) / len(expected_fields)
+            missing = sum(1 for f in REQUIRED_FIELDS if f not in candle) / len(REQUIRED_FIELDS)
             score -= missing * 0.1
             
             # Basic OHLCV checks
@@ -4,6 +4,9 @@ import logging
 from typing import List, Optional, Dict
 from datetime import datetime
 import time
+from functools import lru_cache
+
+import numpy as np
 from sqlalchemy import create_engine, text, bindparam
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
@@ -14,6 +17,120 @@ logger = logging.getLogger(__name__)
 _metrics_cache = {"data": None, "timestamp": 0}
 _CACHE_TTL = 300  # seconds
 
+# Batch upsert for insert_ohlcv_batch, built once so SQLAlchemy's compiled
+# cache is hit on every call. ON CONFLICT DO UPDATE handles duplicates.
+_UPSERT_OHLCV = text("""
+    INSERT INTO market_data 
+    (time, symbol, open, high, low, close, volume, validated, quality_score, 
+     validation_notes, gap_detected, volume_anomaly, source, fetched_at, timeframe)
+    VALUES 
+    (:time, :symbol, :open, :high, :low, :close, :volume, :validated, 
+     :quality_score, :validation_notes, :gap_detected, :volume_anomaly, 
+     :source, :fetched_at, :timeframe)
+    ON CONFLICT (symbol, time, timeframe) DO UPDATE SET
+        validated = EXCLUDED.validated,
+        quality_score = EXCLUDED.quality_score,
+        validation_notes = EXCLUDED.validation_notes,
+        gap_detected = EXCLUDED.gap_detected,
+        volume_anomaly = EXCLUDED.volume_anomaly,
+        fetched_at = EXCLUDED.fetched_at
+""")
+
+# Fixed statements for the logging and stats methods below
+_INSERT_VALIDATION_LOG = text("""
+    INSERT INTO validation_log 
+    (symbol, check_name, passed, error_message, quality_score)
+    VALUES (:symbol, :check_name, :passed, :error_message, :quality_score)
+""")
+
+_INSERT_BACKFILL_HISTORY = text("""
+    INSERT INTO backfill_history
+    (symbol, start_date, end_date, records_imported, success, error_details)
+    VALUES (:symbol, :start_date, :end_date, :records_imported, :success, :error_details)
+""")
+
+_SYMBOL_STATS = text("""
+    SELECT 
+        COUNT(*) as record_count,
+        MIN(time) as start_date,
+        MAX(time) as end_date,
+        COUNT(*) FILTER (WHERE validated = TRUE) as validated_count,
+        COUNT(*) FILTER (WHERE gap_detected = TRUE) as gaps_count
+    FROM market_data
+    WHERE symbol = :symbol
+""")
+
+_SYMBOLS_STATS = text("""
+    SELECT 
+        symbol,
+        COUNT(*) as record_count,
+        MIN(time) as start_date,
+        MAX(time) as end_date,
+        COUNT(*) FILTER (WHERE validated = TRUE) as validated_count,
+        COUNT(*) FILTER (WHERE gap_detected = TRUE) as gaps_count
+    FROM market_data
+    WHERE symbol = ANY(:symbols)
+    GROUP BY symbol
+""")
+
+_STATUS_METRICS = text("""
+    SELECT 
+        COUNT(DISTINCT symbol) as symbols,
+        MAX(time) as latest_time,
+        COUNT(*) as total_records,
+        COUNT(*) FILTER (WHERE validated = TRUE) as validated_records,
+        COUNT(*) FILTER (WHERE gap_detected = TRUE) as gap_records
+    FROM market_data
+""")
+
+_ALL_SYMBOLS_DETAILED = text("""
+    SELECT 
+        m.symbol,
+        COUNT(*) as records,
+        COUNT(*) FILTER (WHERE m.validated = TRUE)::float / COUNT(*) * 100 as validation_rate,
+        MAX(m.time) as latest_data,
+        EXTRACT(EPOCH FROM (NOW() - MAX(m.time))) / 3600 as data_age_hours,
+        COALESCE(ts.timeframes, ARRAY[]::text[]) as timeframes
+    FROM market_data m
+    LEFT JOIN tracked_symbols ts ON m.symbol = ts.symbol
+    GROUP BY m.symbol, ts.timeframes
+    ORDER BY m.symbol ASC
+""")
+
+
+@lru_cache(maxsize=32)
+def _historical_data_sql(validated_only: bool, min_quality: float) -> str:
+    """
+    SELECT for get_historical_data, built once per filter combination.
+    
+    Takes psycopg2-style parameters (symbol, timeframe, start, end).
+    """
+    # Build WHERE clause conditions
+    conditions = [
+        "symbol = %s",
+        "timeframe = %s",
+        "time >= %s::timestamp",
+        "time < %s::timestamp + INTERVAL '1 day'"
+    ]
+    
+    if validated_only:
+        conditions.append("validated = TRUE")
+    
+    if min_quality > 0:
+        conditions.append(f"quality_score >= {min_quality}")
+    
+    where_clause = " AND ".join(conditions)
+    
+    return f"""
+        SELECT 
+            time, symbol, timeframe, open, high, low, close, volume,
+            source, validated, quality_score, validation_notes,
+            gap_detected, volume_anomaly, fetched_at
+        FROM market_data
+        WHERE {where_clause}
+        ORDER BY time ASC
+    """
+
 
 class DatabaseService:
     """
@@ -40,6 +157,10 @@ class DatabaseService:
             max_overflow=20,  # Additional connections if pool exhausted
             pool_recycle=3600,  # Recycle connections every hour (prevents stale connections)
             pool_pre_ping=True,  # Test connections before using them
+            # Multi-row execute() calls go out as psycopg2 execute_batch pages
+            # instead of one round-trip per row
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=500,
             echo=False
         )
         self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
@@ -74,13 +195,18 @@ class DatabaseService:
         inserted = 0
         
         try:
+            # Convert Polygon timestamps (epoch milliseconds) to naive UTC
+            # datetimes in one vectorized pass instead of one call per candle
+            timestamps = np.fromiter(
+                (candle.get('t', 0) for candle in candles),
+                dtype=np.int64,
+                count=len(candles)
+            ).astype('datetime64[ms]').astype('datetime64[us]').tolist()
+            fetched_at = datetime.utcnow()
+            
             # Prepare insert values
             values = []
-            for candle, meta in zip(candles, metadata):
-                # Convert Polygon timestamp (milliseconds) to seconds
-                timestamp_ms = candle.get('t', 0)
-                timestamp = datetime.utcfromtimestamp(timestamp_ms / 1000)
-                
+            for candle, meta, timestamp in zip(candles, metadata, timestamps):
                 values.append({
                     'time': timestamp,
                     'symbol': symbol,
@@ -95,31 +221,12 @@ class DatabaseService:
                     'gap_detected': meta['gap_detected'],
                     'volume_anomaly': meta['volume_anomaly'],
                     'source': 'polygon',
-                    'fetched_at': datetime.utcnow(),
+                    'fetched_at': fetched_at,
                     'timeframe': timeframe
                 })
             
-            # Execute batch insert
-            # Using ON CONFLICT DO UPDATE to handle duplicates (upsert)
-            insert_stmt = text("""
-                INSERT INTO market_data 
-                (time, symbol, open, high, low, close, volume, validated, quality_score, 
-                 validation_notes, gap_detected, volume_anomaly, source, fetched_at, timeframe)
-                VALUES 
-                (:time, :symbol, :open, :high, :low, :close, :volume, :validated, 
-                 :quality_score, :validation_notes, :gap_detected, :volume_anomaly, 
-                 :source, :fetched_at, :timeframe)
-                ON CONFLICT (symbol, time, timeframe) DO UPDATE SET
-                    validated = EXCLUDED.validated,
-                    quality_score = EXCLUDED.quality_score,
-                    validation_notes = EXCLUDED.validation_notes,
-                    gap_detected = EXCLUDED.gap_detected,
-                    volume_anomaly = EXCLUDED.volume_anomaly,
-                    fetched_at = EXCLUDED.fetched_at
-            """)
-            
-            for value in values:
-                session.execute(insert_stmt, value)
+            # One executemany for the whole batch (paged by the driver)
+            session.execute(_UPSERT_OHLCV, values)
             
             session.commit()
             inserted = len(values)
@@ -160,33 +267,8 @@ class DatabaseService:
         session = self.SessionLocal()
         
         try:
-            # Build WHERE clause conditions
-            conditions = [
-                "symbol = %s",
-                "timeframe = %s",
-                "time >= %s::timestamp",
-                "time < %s::timestamp + INTERVAL '1 day'"
-            ]
-            
             query_params = [symbol, timeframe, start, end]
-            
-            if validated_only:
-                conditions.append("validated = TRUE")
-            
-            if min_quality > 0:
-                conditions.append(f"quality_score >= {min_quality}")
-            
-            where_clause = " AND ".join(conditions)
-            
-            sql = f"""
-                SELECT 
-                    time, symbol, timeframe, open, high, low, close, volume,
-                    source, validated, quality_score, validation_notes,
-                    gap_detected, volume_anomaly, fetched_at
-                FROM market_data
-                WHERE {where_clause}
-                ORDER BY time ASC
-            """
+            sql = _historical_data_sql(validated_only, min_quality)
             
             # Use raw SQL execute with psycopg2 style parameters
             conn = session.connection().connection
@@ -238,13 +320,7 @@ class DatabaseService:
         session = self.SessionLocal()
         
         try:
-            insert_stmt = text("""
-                INSERT INTO validation_log 
-                (symbol, check_name, passed, error_message, quality_score)
-                VALUES (:symbol, :check_name, :passed, :error_message, :quality_score)
-            """)
-            
-            session.execute(insert_stmt, {
+            session.execute(_INSERT_VALIDATION_LOG, {
                 'symbol': symbol,
                 'check_name': check_name,
                 'passed': passed,
@@ -272,13 +348,7 @@ class DatabaseService:
         session = self.SessionLocal()
         
         try:
-            insert_stmt = text("""
-                INSERT INTO backfill_history
-                (symbol, start_date, end_date, records_imported, success, error_details)
-                VALUES (:symbol, :start_date, :end_date, :records_imported, :success, :error_details)
-            """)
-            
-            session.execute(insert_stmt, {
+            session.execute(_INSERT_BACKFILL_HISTORY, {
                 'symbol': symbol,
                 'start_date': start_date,
                 'end_date': end_date,
@@ -294,6 +364,20 @@ class DatabaseService:
         finally:
             session.close()
     
+    @staticmethod
+    def _symbol_stats(record_count, start_date, end_date, validated_count, gaps_count) -> Dict:
+        """Stats dict for one symbol from its _SYMBOL_STATS aggregates"""
+        validation_rate = (validated_count / record_count) if record_count else 0
+        return {
+            "record_count": record_count or 0,
+            "date_range": {
+                "start": start_date.isoformat() if start_date else None,
+                "end": end_date.isoformat() if end_date else None
+            },
+            "validation_rate": round(validation_rate, 2),
+            "gaps_detected": gaps_count or 0
+        }
+    
     def get_symbol_stats(self, symbol: str) -> Dict:
         """
         Get detailed statistics for a specific symbol.
@@ -307,39 +391,12 @@ class DatabaseService:
         session = self.SessionLocal()
         
         try:
-            stats_query = text("""
-                SELECT 
-                    COUNT(*) as record_count,
-                    MIN(time) as start_date,
-                    MAX(time) as end_date,
-                    COUNT(*) FILTER (WHERE validated = TRUE) as validated_count,
-                    COUNT(*) FILTER (WHERE gap_detected = TRUE) as gaps_count
-                FROM market_data
-                WHERE symbol = :symbol
-            """)
-            
-            result = session.execute(stats_query, {"symbol": symbol}).first()
+            result = session.execute(_SYMBOL_STATS, {"symbol": symbol}).first()
             
             if result:
-                record_count, start_date, end_date, validated_count, gaps_count = result
-                validation_rate = (validated_count / record_count) if record_count > 0 else 0
-                
-                return {
-                    "record_count": record_count or 0,
-                    "date_range": {
-                        "start": start_date.isoformat() if start_date else None,
-                        "end": end_date.isoformat() if end_date else None
-                    },
-                    "validation_rate": round(validation_rate, 2),
-                    "gaps_detected": gaps_count or 0
-                }
+                return self._symbol_stats(*result)
             else:
-                return {
-                    "record_count": 0,
-                    "date_range": {"start": None, "end": None},
-                    "validation_rate": 0,
-                    "gaps_detected": 0
-                }
+                return self._symbol_stats(0, None, None, 0, 0)
         
         except Exception as e:
             logger.error(f"Error getting stats for {symbol}: {e}")
@@ -348,6 +405,34 @@ class DatabaseService:
         finally:
             session.close()
     
+    def get_symbols_stats(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get get_symbol_stats() for several symbols with one grouped query.
+        
+        Args:
+            symbols: Stock tickers
+        
+        Returns:
+            Dict mapping each symbol to its stats dict (zeroed if it has no data)
+        """
+        if not symbols:
+            return {}
+        
+        session = self.SessionLocal()
+        
+        try:
+            rows = session.execute(_SYMBOLS_STATS, {"symbols": list(symbols)}).fetchall()
+            stats = {row[0]: self._symbol_stats(*row[1:]) for row in rows}
+            empty = self._symbol_stats(0, None, None, 0, 0)
+            return {symbol: stats.get(symbol, empty) for symbol in symbols}
+        
+        except Exception as e:
+            logger.error(f"Error getting stats for {len(symbols)} symbols: {e}")
+            return {symbol: {} for symbol in symbols}
+        
+        finally:
+            session.close()
+    
     def get_status_metrics(self) -> Dict:
         """Get overall system metrics for status endpoint (cached, 5-min TTL)"""
         global _metrics_cache
@@ -363,16 +448,7 @@ class DatabaseService:
         
         try:
             # Single optimized query for all metrics
-            metrics_query = text("""
-                SELECT 
-                    COUNT(DISTINCT symbol) as symbols,
-                    MAX(time) as latest_time,
-                    COUNT(*) as total_records,
-                    COUNT(*) FILTER (WHERE validated = TRUE) as validated_records,
-                    COUNT(*) FILTER (WHERE gap_detected = TRUE) as gap_records
-                FROM market_data
-            """)
-            result = session.execute(metrics_query).first()
+            result = session.execute(_STATUS_METRICS).first()
             
             if result:
                 symbol_count, latest_date, total_count, valid_count, gap_count = result
@@ -414,21 +490,7 @@ class DatabaseService:
         
         try:
             # Query for per-symbol statistics from market_data
-            symbols_query = text("""
-                SELECT 
-                    m.symbol,
-                    COUNT(*) as records,
-                    COUNT(*) FILTER (WHERE m.validated = TRUE)::float / COUNT(*) * 100 as validation_rate,
-                    MAX(m.time) as latest_data,
-                    EXTRACT(EPOCH FROM (NOW() - MAX(m.time))) / 3600 as data_age_hours,
-                    COALESCE(ts.timeframes, ARRAY[]::text[]) as timeframes
-                FROM market_data m
-                LEFT JOIN tracked_symbols ts ON m.symbol = ts.symbol
-                GROUP BY m.symbol, ts.timeframes
-                ORDER BY m.symbol ASC
-            """)
-            
-            results = session.execute(symbols_query).fetchall()
+            results = session.execute(_ALL_SYMBOLS_DETAILED).fetchall()
             
             symbols_data = []
             for row in results:
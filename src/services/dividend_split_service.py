@@ -3,10 +3,37 @@
 import logging
 from typing import List, Optional, Dict
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import column, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger(__name__)
 
+# Lightweight table handles so each batch goes out as one multi-row INSERT
+_DIVIDENDS = table(
+    'dividends',
+    column('symbol'), column('ex_date'), column('record_date'), column('pay_date'),
+    column('dividend_amount'), column('dividend_type'), column('currency'),
+)
+_STOCK_SPLITS = table(
+    'stock_splits',
+    column('symbol'), column('execution_date'), column('split_from'),
+    column('split_to'), column('split_ratio'),
+)
+
+# Built once at import rather than re-created for every candle
+_UPSERT_OHLCV_ADJUSTED = text("""
+    INSERT INTO ohlcv_adjusted 
+    (time, symbol, open, high, low, close, volume, timeframe, source, fetched_at)
+    VALUES (:time, :symbol, :open, :high, :low, :close, :volume, :timeframe, :source, :fetched_at)
+    ON CONFLICT (symbol, time, timeframe) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        fetched_at = EXCLUDED.fetched_at
+""")
+
 
 class DividendSplitService:
     """
@@ -37,43 +64,40 @@ class DividendSplitService:
         if not dividends:
             return 0, 0
         
-        session = self.db.SessionLocal()
+        rows = []
         inserted = 0
         skipped = 0
         
+        for div in dividends:
+            try:
+                rows.append({
+                    'symbol': symbol,
+                    'ex_date': div.get('ex_dividend_date'),
+                    'record_date': div.get('record_date'),
+                    'pay_date': div.get('pay_date'),
+                    'dividend_amount': float(div.get('cash_amount', 0)),
+                    'dividend_type': div.get('dividend_type', 'regular'),
+                    'currency': div.get('currency', 'USD')
+                })
+            except (TypeError, ValueError) as e:
+                logger.error(f"Error preparing dividend for {symbol}: {e}")
+                skipped += 1
+        
+        if not rows:
+            return inserted, skipped
+        
+        session = self.db.SessionLocal()
+        
         try:
-            for div in dividends:
-                try:
-                    # Use raw SQL for upsert (on conflict do nothing)
-                    query = text("""
-                        INSERT INTO dividends 
-                        (symbol, ex_date, record_date, pay_date, dividend_amount, dividend_type, currency)
-                        VALUES (:symbol, :ex_date, :record_date, :pay_date, :amount, :div_type, :currency)
-                        ON CONFLICT (symbol, ex_date) DO NOTHING
-                    """)
-                    
-                    result = session.execute(
-                        query,
-                        {
-                            'symbol': symbol,
-                            'ex_date': div.get('ex_dividend_date'),
-                            'record_date': div.get('record_date'),
-                            'pay_date': div.get('pay_date'),
-                            'amount': float(div.get('cash_amount', 0)),
-                            'div_type': div.get('dividend_type', 'regular'),
-                            'currency': div.get('currency', 'USD')
-                        }
-                    )
-                    
-                    # Check if row was actually inserted
-                    if result.rowcount > 0:
-                        inserted += 1
-                    else:
-                        skipped += 1
-                
-                except Exception as e:
-                    logger.error(f"Error inserting dividend for {symbol}: {e}")
-                    skipped += 1
+            # One multi-row upsert; RETURNING yields only the rows actually inserted
+            query = (
+                pg_insert(_DIVIDENDS)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=['symbol', 'ex_date'])
+                .returning(_DIVIDENDS.c.ex_date)
+            )
+            inserted = len(session.execute(query).fetchall())
+            skipped += len(rows) - inserted
             
             session.commit()
             logger.info(f"Dividend batch for {symbol}: inserted {inserted}, skipped {skipped}")
@@ -81,6 +105,9 @@ class DividendSplitService:
         except Exception as e:
             logger.error(f"Error in dividend batch insert: {e}")
             session.rollback()
+            # Nothing from the batch was stored
+            inserted = 0
+            skipped = len(dividends)
         
         finally:
             session.close()
@@ -101,44 +128,40 @@ class DividendSplitService:
         if not splits:
             return 0, 0
         
-        session = self.db.SessionLocal()
+        rows = []
         inserted = 0
         skipped = 0
         
+        for split in splits:
+            try:
+                # Calculate split ratio if not provided
+                split_from = int(split.get('split_from', 1))
+                split_to = int(split.get('split_to', 1))
+                rows.append({
+                    'symbol': symbol,
+                    'execution_date': split.get('execution_date'),
+                    'split_from': split_from,
+                    'split_to': split_to,
+                    'split_ratio': split_to / split_from if split_from > 0 else 1.0
+                })
+            except (TypeError, ValueError) as e:
+                logger.error(f"Error preparing split for {symbol}: {e}")
+                skipped += 1
+        
+        if not rows:
+            return inserted, skipped
+        
+        session = self.db.SessionLocal()
+        
         try:
-            for split in splits:
-                try:
-                    # Calculate split ratio if not provided
-                    split_from = int(split.get('split_from', 1))
-                    split_to = int(split.get('split_to', 1))
-                    ratio = split_to / split_from if split_from > 0 else 1.0
-                    
-                    query = text("""
-                        INSERT INTO stock_splits 
-                        (symbol, execution_date, split_from, split_to, split_ratio)
-                        VALUES (:symbol, :execution_date, :split_from, :split_to, :ratio)
-                        ON CONFLICT (symbol, execution_date) DO NOTHING
-                    """)
-                    
-                    result = session.execute(
-                        query,
-                        {
-                            'symbol': symbol,
-                            'execution_date': split.get('execution_date'),
-                            'split_from': split_from,
-                            'split_to': split_to,
-                            'ratio': ratio
-                        }
-                    )
-                    
-                    if result.rowcount > 0:
-                        inserted += 1
-                    else:
-                        skipped += 1
-                
-                except Exception as e:
-                    logger.error(f"Error inserting split for {symbol}: {e}")
-                    skipped += 1
+            query = (
+                pg_insert(_STOCK_SPLITS)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=['symbol', 'execution_date'])
+                .returning(_STOCK_SPLITS.c.execution_date)
+            )
+            inserted = len(session.execute(query).fetchall())
+            skipped += len(rows) - inserted
             
             session.commit()
             logger.info(f"Split batch for {symbol}: inserted {inserted}, skipped {skipped}")
@@ -146,6 +169,9 @@ class DividendSplitService:
         except Exception as e:
             logger.error(f"Error in split batch insert: {e}")
             session.rollback()
+            # Nothing from the batch was stored
+            inserted = 0
+            skipped = len(splits)
         
         finally:
             session.close()
@@ -336,25 +362,11 @@ class DividendSplitService:
             for candle in candles:
                 try:
                     # Convert Polygon timestamp (milliseconds) to seconds
-                    from datetime import datetime as dt
                     timestamp_ms = candle.get('t', 0)
-                    timestamp = dt.utcfromtimestamp(timestamp_ms / 1000)
-                    
-                    query = text("""
-                        INSERT INTO ohlcv_adjusted 
-                        (time, symbol, open, high, low, close, volume, timeframe, source, fetched_at)
-                        VALUES (:time, :symbol, :open, :high, :low, :close, :volume, :timeframe, :source, :fetched_at)
-                        ON CONFLICT (symbol, time, timeframe) DO UPDATE SET
-                            open = EXCLUDED.open,
-                            high = EXCLUDED.high,
-                            low = EXCLUDED.low,
-                            close = EXCLUDED.close,
-                            volume = EXCLUDED.volume,
-                            fetched_at = EXCLUDED.fetched_at
-                    """)
+                    timestamp = datetime.utcfromtimestamp(timestamp_ms / 1000)
                     
                     result = session.execute(
-                        query,
+                        _UPSERT_OHLCV_ADJUSTED,
                         {
                             'time': timestamp,
                             'symbol': symbol,
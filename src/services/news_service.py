@@ -7,6 +7,17 @@ from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
+# Built once at import rather than re-created for every article
+_INSERT_NEWS = text("""
+    INSERT INTO news 
+    (symbol, title, description, url, image_url, author, source, published_at,
+     sentiment_score, sentiment_label, sentiment_confidence, keywords)
+    VALUES (:symbol, :title, :description, :url, :image_url, :author, :source, 
+            :published_at, :sentiment_score, :sentiment_label, :sentiment_confidence, 
+            :keywords)
+    ON CONFLICT (symbol, url) DO NOTHING
+""")
+
 
 class NewsService:
     """
@@ -51,18 +62,8 @@ class NewsService:
                     else:
                         keywords_str = None
                     
-                    query = text("""
-                        INSERT INTO news 
-                        (symbol, title, description, url, image_url, author, source, published_at,
-                         sentiment_score, sentiment_label, sentiment_confidence, keywords)
-                        VALUES (:symbol, :title, :description, :url, :image_url, :author, :source, 
-                                :published_at, :sentiment_score, :sentiment_label, :sentiment_confidence, 
-                                :keywords)
-                        ON CONFLICT (symbol, url) DO NOTHING
-                    """)
-                    
                     result = session.execute(
-                        query,
+                        _INSERT_NEWS,
                         {
                             'symbol': symbol,
                             'title': article.get('title'),
@@ -1,17 +1,81 @@
 """Real-time performance monitoring and bottleneck detection"""
 
 import time
-from typing import Dict, List, Optional
+from collections import Counter, defaultdict, deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from statistics import mean, median, stdev
+from statistics import mean, stdev
 from asyncio import Lock
 
+import numpy as np
+
 from src.services.structured_logging import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
 
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile using an O(n) partial sort.
+    
+    Returns the same element as ``sorted(values)[int(len(values) * q)]``
+    without sorting the whole list.
+    
+    Args:
+        values: Non-empty sequence of numbers
+        q: Fraction in [0, 1] (e.g. 0.95 for p95)
+    
+    Returns:
+        Value at the requested rank
+    """
+    return percentiles(values, (q,))[0]
+
+
+def percentiles(values: List[float], qs: Sequence[float]) -> List[float]:
+    """
+    Several nearest-rank percentiles from a single partition pass.
+    
+    Args:
+        values: Non-empty sequence of numbers
+        qs: Fractions in [0, 1]
+    
+    Returns:
+        One value per entry in qs, same ranks as percentile()
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = len(arr)
+    ranks = [min(int(n * q), n - 1) for q in qs]
+    part = np.partition(arr, ranks)
+    return [float(part[k]) for k in ranks]
+
+
+def median_p95_p99(values: List[float]) -> Tuple[float, float, float]:
+    """
+    Median, p95 and p99 from one partition of the data.
+    
+    The median matches statistics.median (mean of the two middle values
+    for even-length input); p95/p99 match percentile().
+    
+    Args:
+        values: Non-empty sequence of numbers
+    
+    Returns:
+        (median, p95, p99)
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = len(arr)
+    lo, hi = (n - 1) // 2, n // 2
+    k95 = min(int(n * 0.95), n - 1)
+    k99 = min(int(n * 0.99), n - 1)
+    part = np.partition(arr, [lo, hi, k95, k99])
+    return (
+        float((part[lo] + part[hi]) / 2),
+        float(part[k95]),
+        float(part[k99]),
+    )
+
+
 @dataclass
 class QueryProfile:
     """Profile data for a single query"""
@@ -39,7 +103,8 @@ class PerformanceMonitor:
         """
         self.window_hours = window_hours
         self.max_queries = max_queries
-        self.queries: List[QueryProfile] = []
+        # Bounded deque: appends never reallocate and the oldest entry drops off
+        self.queries: Deque[QueryProfile] = deque(maxlen=max_queries)
         self.lock = Lock()
     
     async def record_query(
@@ -60,25 +125,34 @@ class PerformanceMonitor:
             error: Error message if failed
             **params: Query parameters for filtering
         """
+        now = datetime.utcnow()
         profile = QueryProfile(
             query_type=query_type,
             duration_ms=duration_ms,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             params=params,
             success=success,
             error=error
         )
         
         async with self.lock:
+            # Appending past max_queries evicts the oldest entry
             self.queries.append(profile)
             
-            # Evict old entries beyond window
-            cutoff = datetime.utcnow() - timedelta(hours=self.window_hours)
-            self.queries = [q for q in self.queries if q.timestamp > cutoff]
-            
-            # Evict oldest if at max size
-            if len(self.queries) > self.max_queries:
-                self.queries = self.queries[-self.max_queries:]
+            # Evict old entries beyond window (queries are in arrival order)
+            cutoff = now - timedelta(hours=self.window_hours)
+            while self.queries and self.queries[0].timestamp <= cutoff:
+                self.queries.popleft()
+    
+    def reset(self):
+        """
+        Drop all recorded queries.
+        
+        Also replaces the lock, so a reset monitor can be reused from a new
+        event loop.
+        """
+        self.queries.clear()
+        self.lock = Lock()
     
     async def get_stats(self, query_type: Optional[str] = None) -> Dict:
         """
@@ -106,9 +180,10 @@ class PerformanceMonitor:
             
             durations = [q.duration_ms for q in queries if q.success]
             successful = len(durations)
-            failed = sum(1 for q in queries if not q.success)
+            failed = len(queries) - successful
             
             if durations:
+                p50, p95, p99 = median_p95_p99(durations)
                 return {
                     "query_type": query_type or "all",
                     "total": len(queries),
@@ -118,9 +193,9 @@ class PerformanceMonitor:
                     "min_ms": min(durations),
                     "max_ms": max(durations),
                     "mean_ms": round(mean(durations), 2),
-                    "median_ms": round(median(durations), 2),
-                    "p95_ms": round(sorted(durations)[int(len(durations) * 0.95)], 2) if len(durations) > 1 else durations[0],
-                    "p99_ms": round(sorted(durations)[int(len(durations) * 0.99)], 2) if len(durations) > 1 else durations[0],
+                    "median_ms": round(p50, 2),
+                    "p95_ms": round(p95, 2),
+                    "p99_ms": round(p99, 2),
                     "stdev_ms": round(stdev(durations), 2) if len(durations) > 1 else 0,
                 }
             else:
@@ -150,16 +225,14 @@ class PerformanceMonitor:
             if threshold_ms is None:
                 all_durations = [q.duration_ms for q in self.queries if q.success]
                 if all_durations:
-                    threshold_ms = sorted(all_durations)[int(len(all_durations) * 0.95)]
+                    threshold_ms = percentile(all_durations, 0.95)
                 else:
                     return []
             
             # Group by query type and find bottlenecks
-            by_type = {}
+            by_type: Dict[str, List[float]] = defaultdict(list)
             for q in self.queries:
                 if q.duration_ms >= threshold_ms:
-                    if q.query_type not in by_type:
-                        by_type[q.query_type] = []
                     by_type[q.query_type].append(q.duration_ms)
             
             results = []
@@ -180,10 +253,8 @@ class PerformanceMonitor:
     async def get_query_types(self) -> Dict[str, int]:
         """Get count of queries by type"""
         async with self.lock:
-            counts = {}
-            for q in self.queries:
-                counts[q.query_type] = counts.get(q.query_type, 0) + 1
-            return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+            counts = Counter(q.query_type for q in self.queries)
+            return dict(counts.most_common())
     
     async def get_summary(self) -> Dict:
         """Get overall performance summary"""
@@ -191,20 +262,21 @@ class PerformanceMonitor:
             if not self.queries:
                 return {"total_queries": 0}
             
-            successful = [q for q in self.queries if q.success]
-            failed = [q for q in self.queries if not q.success]
-            
-            durations = [q.duration_ms for q in successful]
+            # Single pass: successful durations, everything else is a failure
+            durations = [q.duration_ms for q in self.queries if q.success]
+            total = len(self.queries)
+            failed = total - len(durations)
+            p50, p95, p99 = median_p95_p99(durations) if durations else (0, 0, 0)
             
             return {
-                "total_queries": len(self.queries),
-                "successful": len(successful),
-                "failed": len(failed),
-                "error_rate_pct": round((len(failed) / len(self.queries)) * 100, 2),
+                "total_queries": total,
+                "successful": len(durations),
+                "failed": failed,
+                "error_rate_pct": round((failed / total) * 100, 2),
                 "avg_duration_ms": round(mean(durations), 2) if durations else 0,
-                "median_duration_ms": round(median(durations), 2) if durations else 0,
-                "p95_duration_ms": round(sorted(durations)[int(len(durations) * 0.95)], 2) if len(durations) > 1 else (durations[0] if durations else 0),
-                "p99_duration_ms": round(sorted(durations)[int(len(durations) * 0.99)], 2) if len(durations) > 1 else (durations[0] if durations else 0),
+                "median_duration_ms": round(p50, 2),
+                "p95_duration_ms": round(p95, 2),
+                "p99_duration_ms": round(p99, 2),
                 "min_duration_ms": min(durations) if durations else 0,
                 "max_duration_ms": max(durations) if durations else 0,
                 "window_hours": self.window_hours,
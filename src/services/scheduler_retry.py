@@ -104,6 +104,13 @@ class CircuitBreaker:
         elif self.failure_count >= self.failure_threshold:
             self.state = CircuitBreakerState.OPEN
             logger.error(f"Circuit breaker opened after {self.failure_count} failures")
+    
+    def reset(self) -> None:
+        """Return to CLOSED state and clear failure/success counters"""
+        self.state = CircuitBreakerState.CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.last_failure_time = None
 
 
 class RetryableOperation:
@@ -197,16 +204,23 @@ class RetryableOperation:
 class RateLimiter:
     """Simple rate limiter for API calls"""
     
-    def __init__(self, max_requests: int, window_seconds: float):
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        clock: Callable[[], datetime] = datetime.utcnow
+    ):
         """
         Initialize rate limiter.
         
         Args:
             max_requests: Maximum requests allowed
             window_seconds: Time window in seconds
+            clock: Returns the current UTC time (injectable for tests)
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self.clock = clock
         self.requests: list = []
     
     async def acquire(self) -> None:
@@ -214,36 +228,58 @@ class RateLimiter:
         Acquire a rate limit token.
         Blocks if limit exceeded.
         """
-        now = datetime.utcnow()
+        now = self.clock()
         
         # Remove old requests outside window
-        self.requests = [
-            req_time for req_time in self.requests
-            if (now - req_time).total_seconds() < self.window_seconds
-        ]
+        self._prune(now)
         
         # Wait if at limit
         while len(self.requests) >= self.max_requests:
-            # Wait until oldest request expires
+            # Sleep until the oldest request expires, i.e. exactly when a slot
+            # frees up, rather than polling
             oldest = self.requests[0]
             wait_time = (oldest - now).total_seconds() + self.window_seconds
             if wait_time > 0:
                 logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
-                await asyncio.sleep(min(wait_time, 1.0))
+                await asyncio.sleep(wait_time)
             
-            now = datetime.utcnow()
-            self.requests = [
-                req_time for req_time in self.requests
-                if (now - req_time).total_seconds() < self.window_seconds
-            ]
+            now = self.clock()
+            self._prune(now)
         
         # Record this request
         self.requests.append(now)
     
+    def consume(self, n: int = 1) -> int:
+        """
+        Take up to n request slots at once without waiting.
+        
+        The window is pruned once for the whole batch rather than once
+        per request.
+        
+        Args:
+            n: Number of slots wanted
+        
+        Returns:
+            Number of slots actually granted (0 to n)
+        """
+        now = self.clock()
+        self._prune(now)
+        
+        granted = max(0, min(n, self.max_requests - len(self.requests)))
+        self.requests.extend([now] * granted)
+        return granted
+    
+    def _prune(self, now: datetime) -> None:
+        """Drop tracked requests that have left the window"""
+        self.requests = [
+            req_time for req_time in self.requests
+            if (now - req_time).total_seconds() < self.window_seconds
+        ]
+    
     def get_next_available_time(self) -> datetime:
         """Get when the next request can be made"""
         if len(self.requests) < self.max_requests:
-            return datetime.utcnow()
+            return self.clock()
         
         oldest = self.requests[0]
         return oldest + timedelta(seconds=self.window_seconds)
@@ -8,6 +8,11 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from contextvars import ContextVar
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
 # Context variable for storing trace ID across async operations
 trace_id_context: ContextVar[str] = ContextVar("trace_id", default="")
 
@@ -30,7 +35,11 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
-        return json.dumps(log_data)
+        if orjson is not None:
+            # C encoder; default=str keeps non-JSON extras (datetimes, Decimals)
+            # loggable and OPT_NON_STR_KEYS accepts int/etc. dict keys like json does
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(log_data, default=str)
 
 
 class StructuredLogger:
@@ -5,7 +5,7 @@ import asyncpg
 from datetime import datetime
 
 from src.services.structured_logging import StructuredLogger
-from src.config import ALLOWED_TIMEFRAMES, DEFAULT_TIMEFRAMES
+from src.config import ALLOWED_TIMEFRAMES, ALLOWED_TIMEFRAME_SET, DEFAULT_TIMEFRAMES
 
 logger = StructuredLogger(__name__)
 
@@ -254,7 +254,7 @@ class SymbolManager:
         symbol = symbol.upper()
         
         # Validate timeframes
-        invalid = [tf for tf in timeframes if tf not in ALLOWED_TIMEFRAMES]
+        invalid = [tf for tf in timeframes if tf not in ALLOWED_TIMEFRAME_SET]
         if invalid:
             raise ValueError(
                 f"Invalid timeframes: {invalid}. "
@@ -135,7 +135,13 @@ class TestInsertOHLCVBatch:
         result = db_service.insert_ohlcv_batch('AAPL', candles, metadata)
         
         assert result == 3
-        assert mock_session.execute.call_count == 3
+        # Whole batch goes through a single executemany call
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args[0][1]
+        assert [row['close'] for row in params] == [151.0, 152.0, 153.0]
+        assert [row['time'] for row in params] == [
+            datetime.utcfromtimestamp(c['t'] / 1000) for c in candles
+        ]
         mock_session.commit.assert_called_once()
 
 
@@ -250,6 +256,18 @@ class TestGetHistoricalData:
         assert call_args is not None
         assert 'quality_score >= 0.85' in call_args[0][0]
     
+    def test_query_sql_built_once_per_filter(self, db_service, mock_session):
+        """Test repeated queries with the same filters reuse one SQL string"""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_session.connection.return_value.connection.cursor.return_value = mock_cursor
+        
+        db_service.get_historical_data('AAPL', '2024-11-07', '2024-11-07')
+        db_service.get_historical_data('MSFT', '2024-11-01', '2024-11-07')
+        
+        first, second = (c[0][0] for c in mock_cursor.execute.call_args_list)
+        assert first is second
+    
     def test_query_error_handling(self, db_service, mock_session):
         """Test error handling in data retrieval"""
         mock_session.execute.side_effect = Exception("Query Error")
@@ -1,6 +1,8 @@
 """Load testing suite for Market Data API"""
 
 import asyncio
+import statistics
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict
@@ -9,7 +11,10 @@ from concurrent.futures import ThreadPoolExecutor
 
 from src.services.structured_logging import StructuredLogger
 from src.services.caching import init_query_cache, get_query_cache
-from src.services.performance_monitor import init_performance_monitor, get_performance_monitor
+from src.services.performance_monitor import (
+    PerformanceMonitor, init_performance_monitor, get_performance_monitor,
+    median_p95_p99, percentile
+)
 
 logger = StructuredLogger(__name__)
 
@@ -19,126 +24,153 @@ class LoadTestResults:
     
     def __init__(self, test_name: str):
         self.test_name = test_name
-        self.results: List[Dict] = []
+        self.started_at: str = None
         self.start_time = None
         self.end_time = None
+        self.errors: List[str] = []
+        
+        # Running aggregates, so summaries never rescan individual results
+        self.total_count = 0
+        self.successful_count = 0
+        self._duration_sum_ms = 0.0
+        self._duration_min_ms = float("inf")
+        self._duration_max_ms = 0.0
     
     def add_result(self, duration_ms: float, success: bool, error: str = None):
         """Add a test result"""
-        self.results.append({
-            "duration_ms": duration_ms,
-            "success": success,
-            "error": error,
-            "timestamp": datetime.utcnow()
-        })
+        self.total_count += 1
+        if success:
+            self.successful_count += 1
+        elif error:
+            self.errors.append(error)
+        
+        self._duration_sum_ms += duration_ms
+        if duration_ms < self._duration_min_ms:
+            self._duration_min_ms = duration_ms
+        if duration_ms > self._duration_max_ms:
+            self._duration_max_ms = duration_ms
     
     def start(self):
         """Mark test start"""
-        self.start_time = time.time()
+        self.started_at = datetime.utcnow().isoformat()
+        self.start_time = time.monotonic()
     
     def stop(self):
         """Mark test end"""
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
     
     @property
     def duration_seconds(self) -> float:
         """Total test duration"""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0
     
-    @property
-    def successful_count(self) -> int:
-        """Count of successful requests"""
-        return sum(1 for r in self.results if r["success"])
-    
     @property
     def failed_count(self) -> int:
         """Count of failed requests"""
-        return sum(1 for r in self.results if not r["success"])
+        return self.total_count - self.successful_count
     
     @property
     def success_rate(self) -> float:
         """Success rate percentage"""
-        if not self.results:
+        if not self.total_count:
             return 0
-        return (self.successful_count / len(self.results)) * 100
+        return (self.successful_count / self.total_count) * 100
     
     @property
     def avg_response_time_ms(self) -> float:
         """Average response time"""
-        if not self.results:
+        if not self.total_count:
             return 0
-        return sum(r["duration_ms"] for r in self.results) / len(self.results)
+        return self._duration_sum_ms / self.total_count
     
     @property
     def min_response_time_ms(self) -> float:
         """Minimum response time"""
-        if not self.results:
+        if not self.total_count:
             return 0
-        return min(r["duration_ms"] for r in self.results)
+        return self._duration_min_ms
     
     @property
     def max_response_time_ms(self) -> float:
         """Maximum response time"""
-        if not self.results:
+        if not self.total_count:
             return 0
-        return max(r["duration_ms"] for r in self.results)
+        return self._duration_max_ms
     
     @property
     def throughput_rps(self) -> float:
         """Requests per second"""
         if self.duration_seconds == 0:
             return 0
-        return len(self.results) / self.duration_seconds
+        return self.total_count / self.duration_seconds
     
     def summary(self) -> Dict:
-        """Get summary of test results"""
+        """Get summary of test results (unrounded; print_summary formats)"""
         return {
             "test_name": self.test_name,
-            "total_requests": len(self.results),
+            "started_at": self.started_at,
+            "total_requests": self.total_count,
             "successful": self.successful_count,
             "failed": self.failed_count,
-            "success_rate_pct": round(self.success_rate, 2),
-            "avg_response_ms": round(self.avg_response_time_ms, 2),
-            "min_response_ms": round(self.min_response_time_ms, 2),
-            "max_response_ms": round(self.max_response_time_ms, 2),
-            "duration_seconds": round(self.duration_seconds, 2),
-            "throughput_rps": round(self.throughput_rps, 2),
+            "success_rate_pct": self.success_rate,
+            "avg_response_ms": self.avg_response_time_ms,
+            "min_response_ms": self.min_response_time_ms,
+            "max_response_ms": self.max_response_time_ms,
+            "duration_seconds": self.duration_seconds,
+            "throughput_rps": self.throughput_rps,
         }
     
     def print_summary(self):
         """Print formatted summary"""
         summary = self.summary()
-        print(f"\n{'='*60}")
-        print(f"Load Test: {summary['test_name']}")
-        print(f"{'='*60}")
-        print(f"Total Requests: {summary['total_requests']}")
-        print(f"Successful: {summary['successful']}")
-        print(f"Failed: {summary['failed']}")
-        print(f"Success Rate: {summary['success_rate_pct']}%")
-        print(f"Avg Response Time: {summary['avg_response_ms']}ms")
-        print(f"Min Response Time: {summary['min_response_ms']}ms")
-        print(f"Max Response Time: {summary['max_response_ms']}ms")
-        print(f"Total Duration: {summary['duration_seconds']}s")
-        print(f"Throughput: {summary['throughput_rps']} req/s")
-        print(f"{'='*60}\n")
+        # One write for the whole block instead of a print() per line
+        sys.stdout.write("\n".join([
+            f"\n{'='*60}",
+            f"Load Test: {summary['test_name']}",
+            f"{'='*60}",
+            f"Total Requests: {summary['total_requests']}",
+            f"Successful: {summary['successful']}",
+            f"Failed: {summary['failed']}",
+            f"Success Rate: {summary['success_rate_pct']:.2f}%",
+            f"Avg Response Time: {summary['avg_response_ms']:.2f}ms",
+            f"Min Response Time: {summary['min_response_ms']:.2f}ms",
+            f"Max Response Time: {summary['max_response_ms']:.2f}ms",
+            f"Total Duration: {summary['duration_seconds']:.2f}s",
+            f"Throughput: {summary['throughput_rps']:.2f} req/s",
+            f"{'='*60}\n",
+        ]) + "\n")
 
 
 # Fixtures
 
-@pytest.fixture
-def cache():
-    """Initialize query cache for tests"""
+@pytest.fixture(scope="session")
+def shared_cache():
+    """Global query cache, initialized once per session"""
     return init_query_cache(max_size=1000)
 
 
-@pytest.fixture
-def monitor():
-    """Initialize performance monitor for tests"""
+@pytest.fixture(scope="session")
+def shared_monitor():
+    """Global performance monitor, initialized once per session"""
     return init_performance_monitor(window_hours=24)
 
 
+@pytest.fixture
+def cache(shared_cache):
+    """Shared query cache, emptied for each test"""
+    shared_cache.reset()
+    return shared_cache
+
+
+@pytest.fixture
+def monitor(shared_monitor):
+    """Shared performance monitor, emptied for each test"""
+    shared_monitor.reset()
+    return shared_monitor
+
+
 # Cache Performance Tests
 
 class TestCachePerformance:
@@ -196,6 +228,19 @@ class TestCachePerformance:
         
         stats_after = cache.stats()
         assert stats_after["size"] == 10
+    
+    async def test_cache_reset(self, cache):
+        """Test reset drops entries and hit/miss counters"""
+        await cache.set("test", "value", ttl=60, id=1)
+        await cache.get("test", id=1)
+        await cache.get("test", id=2)
+        
+        cache.reset()
+        
+        stats = cache.stats()
+        assert stats["size"] == 0
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
 
 
 # Performance Monitoring Tests
@@ -220,6 +265,24 @@ class TestPerformanceMonitoring:
         assert summary["failed"] == 1
         assert summary["error_rate_pct"] == 50.0
     
+    async def test_max_queries_evicts_oldest(self):
+        """Test that the query window is capped at max_queries"""
+        monitor = PerformanceMonitor(max_queries=5)
+        for i in range(8):
+            await monitor.record_query("fetch", float(i), success=True)
+        
+        assert len(monitor.queries) == 5
+        assert [q.duration_ms for q in monitor.queries] == [3.0, 4.0, 5.0, 6.0, 7.0]
+    
+    async def test_monitor_reset(self, monitor):
+        """Test reset drops recorded queries"""
+        await monitor.record_query("fetch", 10, success=True)
+        
+        monitor.reset()
+        
+        summary = await monitor.get_summary()
+        assert summary["total_queries"] == 0
+    
     async def test_bottleneck_detection(self, monitor):
         """Test detection of slow queries"""
         # Record some normal queries
@@ -244,6 +307,23 @@ class TestPerformanceMonitoring:
         assert stats["p95_ms"] >= stats["median_ms"]
         assert stats["p99_ms"] >= stats["p95_ms"]
         assert stats["max_ms"] >= stats["p99_ms"]
+    
+    def test_percentile_matches_sorted_index(self):
+        """Test partition-based percentile picks the same rank as a full sort"""
+        values = [float((i * 37) % 101) for i in range(101)]
+        for q in (0.5, 0.95, 0.99):
+            assert percentile(values, q) == sorted(values)[int(len(values) * q)]
+        assert percentile([42.0], 0.99) == 42.0
+    
+    def test_median_p95_p99_matches_statistics(self):
+        """Test single-pass median/p95/p99 agrees with the per-stat helpers"""
+        for n in (1, 2, 100, 101):
+            values = [float((i * 37) % 101) for i in range(n)]
+            assert median_p95_p99(values) == (
+                statistics.median(values),
+                percentile(values, 0.95),
+                percentile(values, 0.99),
+            )
 
 
 # Load Test Scenarios
@@ -295,8 +375,9 @@ class TestLoadScenarios:
         assert summary["error_rate_pct"] < 10
 
 
-# Baseline Performance Tests
+# Baseline Performance Tests (run explicitly with: pytest -m performance)
 
+@pytest.mark.performance
 class TestBaselinePerformance:
     """Establish baseline performance metrics"""
     
@@ -353,6 +434,7 @@ class TestBaselinePerformance:
 
 # Stress Tests
 
+@pytest.mark.performance
 class TestStressScenarios:
     """Test system under stress"""
     
@@ -3,7 +3,11 @@
 import pytest
 import asyncio
 from datetime import datetime, timedelta
-from src.services.structured_logging import StructuredLogger, get_trace_id, set_trace_id
+import json
+import logging
+from src.services.structured_logging import (
+    StructuredFormatter, StructuredLogger, get_trace_id, set_trace_id
+)
 from src.services.metrics import MetricsCollector, MetricType
 from src.services.alerting import AlertManager, AlertType, AlertSeverity, LogAlertHandler
 from src.middleware import ObservabilityMiddleware
@@ -29,6 +33,27 @@ class TestStructuredLogger:
         logger.info("Test", extra={"key": "value"})
         assert "Test" in caplog.text
 
+    def test_formatter_emits_json_with_extra(self):
+        """Test formatter output is valid JSON, including non-JSON extras"""
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "hello", (), None)
+        record.extra_data = {"symbol": "AAPL", "as_of": datetime(2024, 1, 2, 3, 4, 5)}
+
+        data = json.loads(StructuredFormatter().format(record))
+
+        assert data["message"] == "hello"
+        assert data["level"] == "INFO"
+        assert data["extra"]["symbol"] == "AAPL"
+        assert data["extra"]["as_of"].startswith("2024-01-02")
+
+    def test_formatter_accepts_non_str_keys(self):
+        """Test extras with non-string dict keys are still logged, as with json"""
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "hello", (), None)
+        record.extra_data = {"counts": {1: 2}}
+
+        data = json.loads(StructuredFormatter().format(record))
+
+        assert data["extra"]["counts"] == {"1": 2}
+
     def test_trace_id_generation(self):
         """Test trace ID generation"""
         trace_id = get_trace_id()
@@ -1,5 +1,7 @@
 """Phase 2.2: Tests for scheduler retry and backoff mechanisms"""
 
+import itertools
+import operator
 import pytest
 import asyncio
 from datetime import datetime, timedelta
@@ -11,6 +13,65 @@ from src.services.scheduler_retry import (
 # Import datetime at module level for use in tests
 from datetime import datetime as dt
 
+# Exponential delays for initial_backoff=2.0 (2 ** (attempt + 1)), capped at 60s
+EXPONENTIAL_DELAYS = [
+    min(delay, 60.0) for delay in itertools.accumulate([2.0] * 6, operator.mul)
+]
+
+
+@pytest.fixture(autouse=True)
+def cleanup_test_data():
+    """
+    No database to clean up here. Overrides the async conftest fixture so
+    the async tests can share one module-scoped event loop
+    (@pytest.mark.asyncio(scope="module")) instead of one per test.
+    """
+    yield
+
+
+def _drive_failures(cb: CircuitBreaker, n: int) -> None:
+    """Record n consecutive failures on a circuit breaker"""
+    for _ in range(n):
+        cb.record_failure()
+
+
+class FakeClock:
+    """Manually advanced UTC clock for RateLimiter tests"""
+    
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+    
+    def __call__(self) -> datetime:
+        return self.now
+    
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock():
+    """Fresh fake clock per test"""
+    return FakeClock()
+
+
+@pytest.fixture(scope="module")
+def shared_breaker():
+    """Default CircuitBreaker built once per module"""
+    return CircuitBreaker()
+
+
+@pytest.fixture
+def breaker(shared_breaker):
+    """Shared default CircuitBreaker, reset to CLOSED for each test"""
+    shared_breaker.reset()
+    return shared_breaker
+
+
+@pytest.fixture(scope="module")
+def default_retry_op():
+    """Stateless RetryableOperation with default config"""
+    return RetryableOperation()
+
 
 class TestRetryConfig:
     """Test RetryConfig"""
@@ -41,20 +102,16 @@ class TestRetryConfig:
 class TestCircuitBreaker:
     """Test CircuitBreaker"""
     
-    def test_initial_state_closed(self):
+    def test_initial_state_closed(self, breaker):
         """Test that circuit breaker starts in CLOSED state"""
-        cb = CircuitBreaker()
-        
-        assert cb.state == CircuitBreakerState.CLOSED
-        assert cb.can_execute() is True
+        assert breaker.state == CircuitBreakerState.CLOSED
+        assert breaker.can_execute() is True
     
     def test_failure_threshold_opens_breaker(self):
         """Test that reaching failure threshold opens circuit"""
         cb = CircuitBreaker(failure_threshold=3)
         
-        # Record failures
-        for _ in range(3):
-            cb.record_failure()
+        _drive_failures(cb, 3)
         
         assert cb.state == CircuitBreakerState.OPEN
         assert cb.can_execute() is False
@@ -63,8 +120,7 @@ class TestCircuitBreaker:
         """Test that success resets failure counter"""
         cb = CircuitBreaker(failure_threshold=3)
         
-        cb.record_failure()
-        cb.record_failure()
+        _drive_failures(cb, 2)
         cb.record_success()
         
         assert cb.failure_count == 0
@@ -92,33 +148,42 @@ class TestCircuitBreaker:
         
         assert cb.state == CircuitBreakerState.CLOSED
     
-    def test_half_open_failure_reopens_breaker(self):
+    def test_half_open_failure_reopens_breaker(self, breaker):
         """Test that failure in HALF_OPEN reopens circuit"""
-        cb = CircuitBreaker()
-        cb.state = CircuitBreakerState.HALF_OPEN
+        breaker.state = CircuitBreakerState.HALF_OPEN
         
-        cb.record_failure()
+        breaker.record_failure()
         
-        assert cb.state == CircuitBreakerState.OPEN
+        assert breaker.state == CircuitBreakerState.OPEN
+    
+    def test_reset_returns_to_closed(self, breaker):
+        """Test that reset clears counters and closes circuit"""
+        _drive_failures(breaker, breaker.failure_threshold)
+        assert breaker.state == CircuitBreakerState.OPEN
+        
+        breaker.reset()
+        
+        assert breaker.state == CircuitBreakerState.CLOSED
+        assert breaker.failure_count == 0
+        assert breaker.last_failure_time is None
 
 
 class TestRetryableOperation:
     """Test RetryableOperation"""
     
-    @pytest.mark.asyncio
-    async def test_successful_operation_first_try(self):
+    @pytest.mark.asyncio(scope="module")
+    async def test_successful_operation_first_try(self, default_retry_op):
         """Test successful operation on first attempt"""
         async def operation():
             return "success"
         
-        retry_op = RetryableOperation()
-        result, success, error = await retry_op.execute(operation)
+        result, success, error = await default_retry_op.execute(operation)
         
         assert success is True
         assert result == "success"
         assert error is None
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_operation_with_retries(self):
         """Test operation that fails then succeeds"""
         attempt_count = 0
@@ -138,7 +203,7 @@ class TestRetryableOperation:
         assert result == "success"
         assert attempt_count == 2
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_operation_max_retries_exceeded(self):
         """Test operation that exceeds max retries"""
         async def failing_operation():
@@ -151,28 +216,21 @@ class TestRetryableOperation:
         assert success is False
         assert isinstance(error, ValueError)
     
-    @pytest.mark.asyncio
-    async def test_exponential_backoff_calculation(self):
-        """Test exponential backoff calculation"""
+    @pytest.mark.parametrize("attempt,expected", list(enumerate(EXPONENTIAL_DELAYS)))
+    def test_exponential_backoff_calculation(self, attempt, expected):
+        """Test exponential backoff calculation (2s, 4s, 8s... capped at 60s)"""
         config = RetryConfig(
-            initial_backoff=1.0,
+            initial_backoff=2.0,
             max_backoff=60.0,
             strategy=BackoffStrategy.EXPONENTIAL,
             jitter=False
         )
         retry_op = RetryableOperation(config=config)
         
-        backoff_0 = retry_op._calculate_backoff(0)  # 1^1 = 1
-        backoff_1 = retry_op._calculate_backoff(1)  # 1^2 = 1
-        backoff_2 = retry_op._calculate_backoff(2)  # 1^3 = 1
-        
-        # With initial_backoff=1.0: 1.0 ** (0+1) = 1.0
-        assert backoff_0 == 1.0
-        assert backoff_1 == 1.0
-        assert backoff_2 == 1.0
+        assert retry_op._calculate_backoff(attempt) == expected
     
-    @pytest.mark.asyncio
-    async def test_linear_backoff_calculation(self):
+    @pytest.mark.parametrize("attempt,expected", [(0, 1.0), (1, 2.0), (2, 3.0)])
+    def test_linear_backoff_calculation(self, attempt, expected):
         """Test linear backoff calculation"""
         config = RetryConfig(
             initial_backoff=1.0,
@@ -181,16 +239,10 @@ class TestRetryableOperation:
         )
         retry_op = RetryableOperation(config=config)
         
-        backoff_0 = retry_op._calculate_backoff(0)  # 1 * 1 = 1
-        backoff_1 = retry_op._calculate_backoff(1)  # 1 * 2 = 2
-        backoff_2 = retry_op._calculate_backoff(2)  # 1 * 3 = 3
-        
-        assert backoff_0 == 1.0
-        assert backoff_1 == 2.0
-        assert backoff_2 == 3.0
+        assert retry_op._calculate_backoff(attempt) == expected
     
-    @pytest.mark.asyncio
-    async def test_fixed_backoff_calculation(self):
+    @pytest.mark.parametrize("attempt", [0, 1, 2])
+    def test_fixed_backoff_calculation(self, attempt):
         """Test fixed backoff calculation"""
         config = RetryConfig(
             initial_backoff=2.0,
@@ -199,15 +251,9 @@ class TestRetryableOperation:
         )
         retry_op = RetryableOperation(config=config)
         
-        backoff_0 = retry_op._calculate_backoff(0)
-        backoff_1 = retry_op._calculate_backoff(1)
-        backoff_2 = retry_op._calculate_backoff(2)
-        
-        assert backoff_0 == 2.0
-        assert backoff_1 == 2.0
-        assert backoff_2 == 2.0
+        assert retry_op._calculate_backoff(attempt) == 2.0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_backoff_respects_max_backoff(self):
         """Test that backoff respects max_backoff limit"""
         config = RetryConfig(
@@ -222,7 +268,23 @@ class TestRetryableOperation:
         backoff = retry_op._calculate_backoff(4)
         assert backoff == 30.0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
+    async def test_failed_retries_open_circuit_breaker(self):
+        """Test that each failed attempt counts toward the breaker threshold"""
+        async def failing_operation():
+            raise ValueError("Always fails")
+        
+        cb = CircuitBreaker(failure_threshold=3)
+        config = RetryConfig(max_retries=2, initial_backoff=0.01)
+        retry_op = RetryableOperation(config=config, circuit_breaker=cb)
+        
+        _, success, _ = await retry_op.execute(failing_operation)
+        
+        assert success is False
+        assert cb.failure_count == 3
+        assert cb.state == CircuitBreakerState.OPEN
+    
+    @pytest.mark.asyncio(scope="module")
     async def test_circuit_breaker_blocks_request(self):
         """Test that circuit breaker blocks requests when open"""
         cb = CircuitBreaker(failure_threshold=1)
@@ -242,56 +304,102 @@ class TestRetryableOperation:
 class TestRateLimiter:
     """Test RateLimiter"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_allows_requests_within_limit(self):
         """Test that requests within limit are allowed"""
         limiter = RateLimiter(max_requests=3, window_seconds=1.0)
         
         # Should allow 3 requests
-        await limiter.acquire()
-        await limiter.acquire()
-        await limiter.acquire()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
         
         assert len(limiter.requests) == 3
     
-    @pytest.mark.asyncio
-    async def test_blocks_requests_exceeding_limit(self):
+    @pytest.mark.asyncio(scope="module")
+    async def test_blocks_requests_exceeding_limit(self, clock, monkeypatch):
         """Test that requests exceeding limit are blocked"""
-        limiter = RateLimiter(max_requests=2, window_seconds=0.1)
+        limiter = RateLimiter(max_requests=2, window_seconds=0.1, clock=clock)
+        
+        await limiter.acquire()
+        await limiter.acquire()
         
+        # Advance the fake clock instead of sleeping on the wall clock
+        waits = []
+        
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+            clock.advance(seconds)
+        
+        monkeypatch.setattr("src.services.scheduler_retry.asyncio.sleep", fake_sleep)
         await limiter.acquire()
+        
+        # Should have waited exactly one window for the oldest request to expire
+        assert waits == [0.1]
+        assert len(limiter.requests) == 1
+    
+    @pytest.mark.asyncio(scope="module")
+    async def test_blocked_request_wakes_once_when_slot_frees(self, clock, monkeypatch):
+        """Test a blocked acquire sleeps straight to the slot expiry instead of polling"""
+        limiter = RateLimiter(max_requests=1, window_seconds=60.0, clock=clock)
         await limiter.acquire()
+        clock.advance(15.0)
+        
+        waits = []
         
-        # Record time and then try third request
-        start_time = asyncio.get_event_loop().time()
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+            clock.advance(seconds)
+        
+        monkeypatch.setattr("src.services.scheduler_retry.asyncio.sleep", fake_sleep)
         await limiter.acquire()
-        elapsed = asyncio.get_event_loop().time() - start_time
         
-        # Should have waited for window to pass
-        assert elapsed >= 0.1
+        assert waits == [45.0]
+    
+    def test_consume_grants_batch_within_limit(self):
+        """Test that consume takes a whole batch of slots in one call"""
+        limiter = RateLimiter(max_requests=10, window_seconds=60.0)
+        
+        assert limiter.consume(10) == 10
+        assert limiter.consume(1) == 0
+        assert len(limiter.requests) == 10
+    
+    def test_consume_grants_partial_batch(self):
+        """Test that consume grants only the remaining slots"""
+        limiter = RateLimiter(max_requests=5, window_seconds=60.0)
+        
+        assert limiter.consume(3) == 3
+        assert limiter.consume(4) == 2
+        assert len(limiter.requests) == 5
+    
+    def test_consume_after_window_passes(self, clock):
+        """Test that slots free up once the window has elapsed"""
+        limiter = RateLimiter(max_requests=10, window_seconds=60.0, clock=clock)
+        
+        assert limiter.consume(10) == 10
+        clock.advance(30.0)
+        assert limiter.consume(1) == 0
+        clock.advance(30.0)
+        assert limiter.consume(10) == 10
     
-    @pytest.mark.asyncio
-    async def test_next_available_time(self):
+    @pytest.mark.asyncio(scope="module")
+    async def test_next_available_time(self, clock):
         """Test calculation of next available request time"""
-        limiter = RateLimiter(max_requests=1, window_seconds=1.0)
+        limiter = RateLimiter(max_requests=1, window_seconds=1.0, clock=clock)
         
         await limiter.acquire()
-        next_time = limiter.get_next_available_time()
         
-        # Next available should be at least 1 second away
-        diff = (next_time - datetime.utcnow()).total_seconds()
-        assert diff >= 0.9  # Allow small timing variance
+        # Next available is one full window after the only request
+        assert limiter.get_next_available_time() == clock() + timedelta(seconds=1)
     
-    @pytest.mark.asyncio
-    async def test_window_expiration(self):
+    @pytest.mark.asyncio(scope="module")
+    async def test_window_expiration(self, clock):
         """Test that old requests are removed from tracking"""
-        limiter = RateLimiter(max_requests=1, window_seconds=0.1)
+        limiter = RateLimiter(max_requests=1, window_seconds=0.1, clock=clock)
         
         await limiter.acquire()
         assert len(limiter.requests) == 1
         
-        # Wait for window to expire
-        await asyncio.sleep(0.15)
+        # Expire the window
+        clock.advance(0.1)
         
         # New request should be allowed
         await limiter.acquire()
@@ -2,14 +2,21 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch, call
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.scheduler import AutoBackfillScheduler
+from src.scheduler import AutoBackfillScheduler, get_last_backfill_result
 from src.services.symbol_manager import SymbolManager
 from src.services.database_service import DatabaseService
 
 
+def _pool_with(conn):
+    """asyncpg pool mock whose acquire() yields conn"""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool
+
+
 # ==============================================================================
 # Phase 6.3.1: Scheduler Symbol Loading from DB
 # ==============================================================================
@@ -23,9 +30,9 @@ async def test_load_symbols_returns_tuples_with_asset_class():
         symbols=[]
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         mock_conn.fetch.return_value = [
             {'symbol': 'AAPL', 'asset_class': 'stock', 'timeframes': ['1h', '1d']},
@@ -40,7 +47,10 @@ async def test_load_symbols_returns_tuples_with_asset_class():
         assert symbols[1] == ('MSFT', 'stock', ['1h', '1d'])
         assert symbols[2] == ('BTC', 'crypto', ['1h', '1d'])
         
-        mock_conn.close.assert_called_once()
+        # Connection is borrowed from the pool and handed back
+        pool = mock_create_pool.return_value
+        pool.acquire.assert_called_once()
+        pool.acquire.return_value.__aexit__.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -52,9 +62,9 @@ async def test_load_symbols_empty_list():
         symbols=[]
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         mock_conn.fetch.return_value = []
         
         symbols = await scheduler._load_symbols_from_db()
@@ -71,7 +81,7 @@ async def test_load_symbols_database_error():
         symbols=[]
     )
     
-    with patch('asyncpg.connect', side_effect=Exception("Connection failed")):
+    with patch('asyncpg.create_pool', side_effect=Exception("Connection failed")):
         symbols = await scheduler._load_symbols_from_db()
         
         # Should return empty list on error
@@ -87,9 +97,9 @@ async def test_load_symbols_ordered_by_symbol():
         symbols=[]
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         mock_conn.fetch.return_value = [
             {'symbol': 'MSFT', 'asset_class': 'stock'},
@@ -105,6 +115,34 @@ async def test_load_symbols_ordered_by_symbol():
         assert "ORDER BY symbol ASC" in query_arg
 
 
+@pytest.mark.asyncio
+async def test_load_symbols_cached_until_invalidated():
+    """Test repeated loads reuse the last result until the cache is invalidated"""
+    scheduler = AutoBackfillScheduler(
+        polygon_api_key="test_key",
+        database_url="postgresql://test",
+        symbols=[]
+    )
+    
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
+        mock_conn = AsyncMock()
+        mock_create_pool.return_value = _pool_with(mock_conn)
+        mock_conn.fetch.return_value = [
+            {'symbol': 'AAPL', 'asset_class': 'stock', 'timeframes': ['1d']},
+        ]
+        
+        first = await scheduler._load_symbols_from_db()
+        second = await scheduler._load_symbols_from_db()
+        
+        assert first == second == [('AAPL', 'stock', ['1d'])]
+        mock_conn.fetch.assert_called_once()
+        
+        scheduler.invalidate_symbols_cache()
+        await scheduler._load_symbols_from_db()
+        
+        assert mock_conn.fetch.call_count == 2
+
+
 # ==============================================================================
 # Phase 6.3.2: Backfill Status Tracking
 # ==============================================================================
@@ -117,9 +155,9 @@ async def test_update_backfill_status_completed():
         database_url="postgresql://test"
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         await scheduler._update_symbol_backfill_status("AAPL", "completed", None)
         
@@ -140,9 +178,9 @@ async def test_update_backfill_status_failed():
         database_url="postgresql://test"
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         error_msg = "API rate limited"
         await scheduler._update_symbol_backfill_status("AAPL", "failed", error_msg)
@@ -165,15 +203,40 @@ async def test_update_backfill_status_in_progress():
         database_url="postgresql://test"
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         await scheduler._update_symbol_backfill_status("BTC", "in_progress", None)
         
         mock_conn.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_status_updates_share_one_pool():
+    """Test repeated status updates reuse a single pool until it is closed"""
+    scheduler = AutoBackfillScheduler(
+        polygon_api_key="test_key",
+        database_url="postgresql://test"
+    )
+    
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
+        mock_conn = AsyncMock()
+        pool = _pool_with(mock_conn)
+        pool.close = AsyncMock()
+        mock_create_pool.return_value = pool
+        
+        await scheduler._update_symbol_backfill_status("AAPL", "in_progress", None)
+        await scheduler._update_symbol_backfill_status("AAPL", "completed", None)
+        
+        mock_create_pool.assert_awaited_once()
+        assert mock_conn.execute.await_count == 2
+        
+        await scheduler._close_pool()
+        pool.close.assert_awaited_once()
+        assert scheduler._pool is None
+
+
 @pytest.mark.asyncio
 async def test_update_backfill_status_database_error():
     """Test error handling when update fails"""
@@ -182,7 +245,7 @@ async def test_update_backfill_status_database_error():
         database_url="postgresql://test"
     )
     
-    with patch('asyncpg.connect', side_effect=Exception("DB error")):
+    with patch('asyncpg.create_pool', side_effect=Exception("DB error")):
         # Should not raise exception
         await scheduler._update_symbol_backfill_status("AAPL", "failed", "Error")
 
@@ -191,9 +254,17 @@ async def test_update_backfill_status_database_error():
 # Phase 6.3.3: Symbol Statistics Endpoint
 # ==============================================================================
 
-def test_get_symbol_stats_with_data():
-    """Test getting statistics for a symbol with data"""
+@pytest.fixture(scope="module")
+def stats_db():
+    """DatabaseService shared by the stats tests; each patches SessionLocal"""
     db = DatabaseService("postgresql://test")
+    yield db
+    db.engine.dispose()
+
+
+def test_get_symbol_stats_with_data(stats_db):
+    """Test getting statistics for a symbol with data"""
+    db = stats_db
     
     # Mock the database query
     with patch.object(db, 'SessionLocal') as mock_session:
@@ -221,9 +292,9 @@ def test_get_symbol_stats_with_data():
         assert stats["gaps_detected"] == 2
 
 
-def test_get_symbol_stats_no_data():
+def test_get_symbol_stats_no_data(stats_db):
     """Test getting statistics for symbol with no data"""
-    db = DatabaseService("postgresql://test")
+    db = stats_db
     
     with patch.object(db, 'SessionLocal') as mock_session:
         mock_session_instance = MagicMock()
@@ -243,9 +314,9 @@ def test_get_symbol_stats_no_data():
         assert stats["gaps_detected"] == 0
 
 
-def test_get_symbol_stats_all_validated():
+def test_get_symbol_stats_all_validated(stats_db):
     """Test statistics when all records are validated"""
-    db = DatabaseService("postgresql://test")
+    db = stats_db
     
     with patch.object(db, 'SessionLocal') as mock_session:
         mock_session_instance = MagicMock()
@@ -268,9 +339,9 @@ def test_get_symbol_stats_all_validated():
         assert stats["gaps_detected"] == 0
 
 
-def test_get_symbol_stats_low_validation():
+def test_get_symbol_stats_low_validation(stats_db):
     """Test statistics with low validation rate"""
-    db = DatabaseService("postgresql://test")
+    db = stats_db
     
     with patch.object(db, 'SessionLocal') as mock_session:
         mock_session_instance = MagicMock()
@@ -293,92 +364,194 @@ def test_get_symbol_stats_low_validation():
         assert stats["gaps_detected"] == 15
 
 
+def test_get_symbols_stats_one_grouped_query(stats_db):
+    """Test stats for many symbols come from one query, zeroed where there's no data"""
+    db = stats_db
+    
+    with patch.object(db, 'SessionLocal') as mock_session:
+        mock_session_instance = MagicMock()
+        mock_session.return_value = mock_session_instance
+        
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [
+            ("AAPL", 100, datetime(2023, 1, 1), datetime(2023, 12, 31), 95, 2),
+        ]
+        
+        mock_session_instance.execute.return_value = mock_result
+        
+        stats = db.get_symbols_stats(["AAPL", "NEWCOIN"])
+        
+        assert mock_session_instance.execute.call_count == 1
+        assert stats["AAPL"]["validation_rate"] == 0.95
+        assert stats["AAPL"]["gaps_detected"] == 2
+        assert stats["NEWCOIN"]["record_count"] == 0
+        assert stats["NEWCOIN"]["date_range"] == {"start": None, "end": None}
+
+
 # ==============================================================================
 # Phase 6.3.4: Crypto Support
 # ==============================================================================
 
 @pytest.mark.asyncio
-async def test_backfill_handles_stock_asset_class():
+async def test_backfill_handles_stock_asset_class(patched_scheduler):
     """Test backfill processes stocks correctly"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
-    )
+    scheduler = patched_scheduler
     
     with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = [
             {'t': 1609459200000, 'o': 130.0, 'h': 131.0, 'l': 129.0, 'c': 130.5, 'v': 1000000}
         ]
         
-        with patch.object(scheduler, 'db_service'):
-            with patch.object(scheduler.validation_service, 'validate_candle') as mock_validate:
-                mock_validate.return_value = (True, {'validated': True})
-                with patch.object(scheduler.db_service, 'insert_ohlcv_batch', return_value=1):
-                    with patch.object(scheduler.db_service, 'log_backfill'):
-                        records = await scheduler._backfill_symbol("AAPL", "stock", "1d")
-                        
-                        # Should call fetch_range for stocks
-                        mock_fetch.assert_called_once()
+        records = await scheduler._backfill_symbol("AAPL", "stock", "1d")
+        
+        # Should call fetch_range for stocks
+        mock_fetch.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_backfill_handles_crypto_asset_class():
+async def test_backfill_handles_crypto_asset_class(patched_scheduler):
     """Test backfill processes crypto correctly"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
-    )
+    scheduler = patched_scheduler
     
     with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
         mock_fetch.return_value = [
             {'t': 1609459200000, 'o': 29000.0, 'h': 30000.0, 'l': 28000.0, 'c': 29500.0, 'v': 100}
         ]
         
-        with patch.object(scheduler, 'db_service'):
-            with patch.object(scheduler.validation_service, 'validate_candle') as mock_validate:
-                mock_validate.return_value = (True, {'validated': True})
-                with patch.object(scheduler.db_service, 'insert_ohlcv_batch', return_value=1):
-                    with patch.object(scheduler.db_service, 'log_backfill'):
-                        records = await scheduler._backfill_symbol("BTCUSD", "crypto", "1d")
-                        
-                        # Should call fetch_range for crypto
-                        mock_fetch.assert_called_once()
+        records = await scheduler._backfill_symbol("BTCUSD", "crypto", "1d")
+        
+        # Should call fetch_range for crypto
+        mock_fetch.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_backfill_job_processes_mixed_assets():
-    """Test backfill job handles mixed stock and crypto symbols"""
+@pytest.fixture(scope="module")
+def mock_scheduler():
+    """Scheduler with its per-symbol work mocked, built once per module"""
     scheduler = AutoBackfillScheduler(
         polygon_api_key="test_key",
         database_url="postgresql://test"
     )
-    
-    # Set up mixed symbols with timeframes
-    scheduler.symbols = [
+    scheduler._load_symbols_from_db = AsyncMock()
+    scheduler._backfill_symbol = AsyncMock()
+    scheduler._update_symbol_backfill_status = AsyncMock()
+    yield scheduler
+
+
+@pytest.fixture
+def job_scheduler(mock_scheduler):
+    """mock_scheduler with mocks and concurrency reset for the next test"""
+    for mock in (
+        mock_scheduler._load_symbols_from_db,
+        mock_scheduler._backfill_symbol,
+        mock_scheduler._update_symbol_backfill_status,
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_scheduler.max_concurrent_symbols = 5
+    return mock_scheduler
+
+
+@pytest.mark.asyncio
+async def test_backfill_job_processes_mixed_assets(job_scheduler):
+    """Test backfill job handles mixed stock and crypto symbols"""
+    job_scheduler._load_symbols_from_db.return_value = [
         ("AAPL", "stock", ["1d"]),
         ("MSFT", "stock", ["1d"]),
         ("BTCUSD", "crypto", ["1d"]),
         ("SPY", "etf", ["1d"])
     ]
+    job_scheduler._backfill_symbol.return_value = 5
+    
+    await job_scheduler._backfill_job()
+    
+    # Should process all symbols (4 symbols x 1 timeframe each)
+    mock_backfill = job_scheduler._backfill_symbol
+    assert mock_backfill.call_count == 4
+    
+    # Check calls include asset class and timeframe
+    calls = mock_backfill.call_args_list
+    assert calls[0][0] == ("AAPL", "stock", "1d")
+    assert calls[1][0] == ("MSFT", "stock", "1d")
+    assert calls[2][0] == ("BTCUSD", "crypto", "1d")
+    assert calls[3][0] == ("SPY", "etf", "1d")
+
+
+@pytest.mark.asyncio
+async def test_backfill_job_bounds_concurrent_symbols(job_scheduler):
+    """Test backfill job runs symbols concurrently up to max_concurrent_symbols"""
+    symbols = [(f"SYM{i}", "stock", ["1d"]) for i in range(5)]
+    
+    in_flight = 0
+    peak = 0
+    
+    async def slow_backfill(symbol, asset_class, timeframe):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 1
+    
+    job_scheduler.max_concurrent_symbols = 2
+    job_scheduler._load_symbols_from_db.return_value = symbols
+    job_scheduler._backfill_symbol.side_effect = slow_backfill
+    
+    await job_scheduler._backfill_job()
+    
+    result = get_last_backfill_result()
+    assert peak == 2
+    assert result["success"] == 5
+    assert result["total_records"] == 5
+    assert [entry["symbol"] for entry in result["symbols_processed"]] == [s for s, _, _ in symbols]
+
+
+@pytest.mark.asyncio
+async def test_backfill_job_cancel_stops_symbol_tasks(job_scheduler):
+    """Test cancelling the job cancels in-flight symbols instead of orphaning them"""
+    cancelled = []
+    
+    async def hanging_backfill(symbol, asset_class, timeframe):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(symbol)
+            raise
+    
+    job_scheduler._load_symbols_from_db.return_value = [(f"SYM{i}", "stock", ["1d"]) for i in range(3)]
+    job_scheduler._backfill_symbol.side_effect = hanging_backfill
+    
+    job = asyncio.ensure_future(job_scheduler._backfill_job())
+    await asyncio.sleep(0.01)
+    job.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await job
+    
+    assert sorted(cancelled) == ["SYM0", "SYM1", "SYM2"]
+    assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_job_runs_timeframes_concurrently(job_scheduler):
+    """Test a symbol's timeframes are backfilled together and their records summed"""
+    in_flight = 0
+    peak = 0
+    
+    async def slow_backfill(symbol, asset_class, timeframe):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 2
+    
+    job_scheduler._load_symbols_from_db.return_value = [("AAPL", "stock", ["1h", "4h", "1d"])]
+    job_scheduler._backfill_symbol.side_effect = slow_backfill
+    
+    await job_scheduler._backfill_job()
     
-    with patch.object(scheduler, '_load_symbols_from_db', new_callable=AsyncMock) as mock_load:
-        mock_load.return_value = scheduler.symbols
-        
-        with patch.object(scheduler, '_backfill_symbol', new_callable=AsyncMock) as mock_backfill:
-            mock_backfill.return_value = 5
-            
-            with patch.object(scheduler, '_update_symbol_backfill_status', new_callable=AsyncMock):
-                await scheduler._backfill_job()
-                
-                # Should process all symbols (4 symbols x 1 timeframe each)
-                assert mock_backfill.call_count == 4
-                
-                # Check calls include asset class and timeframe
-                calls = mock_backfill.call_args_list
-                assert calls[0][0] == ("AAPL", "stock", "1d")
-                assert calls[1][0] == ("MSFT", "stock", "1d")
-                assert calls[2][0] == ("BTCUSD", "crypto", "1d")
-                assert calls[3][0] == ("SPY", "etf", "1d")
+    result = get_last_backfill_result()
+    assert peak == 3
+    assert result["total_records"] == 6
+    assert result["symbols_processed"][0]["status"] == "completed"
 
 
 # ==============================================================================
@@ -386,92 +559,73 @@ async def test_backfill_job_processes_mixed_assets():
 # ==============================================================================
 
 @pytest.mark.asyncio
-async def test_backfill_job_updates_status_progression():
+async def test_backfill_job_updates_status_progression(job_scheduler):
     """Test that backfill job properly tracks status transitions"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test",
-        symbols=[("AAPL", "stock", ["1d"])]  # Provide symbols in constructor with timeframes
-    )
+    job_scheduler._load_symbols_from_db.return_value = [("AAPL", "stock", ["1d"])]
+    job_scheduler._backfill_symbol.return_value = 10
     
-    with patch.object(scheduler, '_load_symbols_from_db', new_callable=AsyncMock) as mock_load:
-        mock_load.return_value = [("AAPL", "stock", ["1d"])]
-        
-        with patch.object(scheduler, '_backfill_symbol', new_callable=AsyncMock) as mock_backfill:
-            mock_backfill.return_value = 10
-            
-            with patch.object(scheduler, '_update_symbol_backfill_status', new_callable=AsyncMock) as mock_status:
-                await scheduler._backfill_job()
-                
-                # Should have 2 calls: in_progress, then completed
-                assert mock_status.call_count >= 2
-                
-                # First call should be in_progress
-                first_call = mock_status.call_args_list[0]
-                assert first_call[0][1] == "in_progress"
-                
-                # Last call should be completed
-                last_call = mock_status.call_args_list[-1]
-                assert last_call[0][1] == "completed"
+    await job_scheduler._backfill_job()
+    
+    mock_status = job_scheduler._update_symbol_backfill_status
+    
+    # Should have 2 calls: in_progress, then completed
+    assert mock_status.call_count >= 2
+    
+    # First call should be in_progress
+    first_call = mock_status.call_args_list[0]
+    assert first_call[0][1] == "in_progress"
+    
+    # Last call should be completed
+    last_call = mock_status.call_args_list[-1]
+    assert last_call[0][1] == "completed"
 
 
 @pytest.mark.asyncio
-async def test_backfill_job_error_updates_failed_status():
+async def test_backfill_job_error_updates_failed_status(job_scheduler):
     """Test that failed backfill updates status to failed"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test",
-        symbols=[("BADTICKER", "stock", ["1d"])]
-    )
+    job_scheduler._load_symbols_from_db.return_value = [("BADTICKER", "stock", ["1d"])]
+    job_scheduler._backfill_symbol.side_effect = Exception("API error")
     
-    with patch.object(scheduler, '_load_symbols_from_db', new_callable=AsyncMock) as mock_load:
-        mock_load.return_value = [("BADTICKER", "stock", ["1d"])]
-        
-        with patch.object(scheduler, '_backfill_symbol', side_effect=Exception("API error")):
-            with patch.object(scheduler, '_update_symbol_backfill_status', new_callable=AsyncMock) as mock_status:
-                await scheduler._backfill_job()
-                
-                # Should have called status with failed
-                failed_calls = [
-                    call_item for call_item in mock_status.call_args_list
-                    if call_item[0][1] == "failed"
-                ]
-                assert len(failed_calls) > 0
+    await job_scheduler._backfill_job()
+    
+    # Should have called status with failed
+    failed_calls = [
+        call_item for call_item in job_scheduler._update_symbol_backfill_status.call_args_list
+        if call_item[0][1] == "failed"
+    ]
+    assert len(failed_calls) > 0
 
 
 @pytest.mark.asyncio
-async def test_symbol_manager_get_all_symbols_with_asset_class():
+async def test_symbol_manager_get_all_symbols_with_asset_class(mock_asyncpg):
     """Test that symbol manager returns asset_class field"""
     manager = SymbolManager("postgresql://test")
     
-    with patch('asyncpg.connect') as mock_connect:
-        mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        mock_conn.fetch.return_value = [
-            {
-                'id': 1,
-                'symbol': 'AAPL',
-                'asset_class': 'stock',
-                'active': True,
-                'date_added': datetime(2023, 1, 1),
-                'last_backfill': datetime(2023, 12, 31),
-                'backfill_status': 'completed', 'timeframes': ['1h', '1d']
-            }
-        ]
-        
-        symbols = await manager.get_all_symbols(active_only=True)
-        
-        assert len(symbols) == 1
-        assert symbols[0]['asset_class'] == 'stock'
+    _, mock_conn = mock_asyncpg
+    
+    mock_conn.fetch.return_value = [
+        {
+            'id': 1,
+            'symbol': 'AAPL',
+            'asset_class': 'stock',
+            'active': True,
+            'date_added': datetime(2023, 1, 1),
+            'last_backfill': datetime(2023, 12, 31),
+            'backfill_status': 'completed', 'timeframes': ['1h', '1d']
+        }
+    ]
+    
+    symbols = await manager.get_all_symbols(active_only=True)
+    
+    assert len(symbols) == 1
+    assert symbols[0]['asset_class'] == 'stock'
 
 
 # ==============================================================================
 # Summary Tests
 # ==============================================================================
 
-@pytest.mark.asyncio
-async def test_phase_6_3_summary():
+def test_phase_6_3_summary():
     """Test that Phase 6.3 functionality is complete"""
     scheduler = AutoBackfillScheduler(
         polygon_api_key="test_key",
@@ -3,6 +3,7 @@
 import pytest
 import asyncio
 import uuid
+import httpx
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime
 from fastapi.testclient import TestClient
@@ -1219,13 +1220,15 @@ class TestMiddlewareIntegrationAdvanced:
                 await asyncio.sleep(0.01)
                 return {"status": "ok"}
             
-            client = TestClient(app_test)
-            responses = [
-                client.post("/api/v1/admin/test", headers={"X-API-Key": "key"})
-                for _ in range(3)
-            ]
+            # Issue the requests together so the handler sleeps overlap
+            async with httpx.AsyncClient(app=app_test, base_url="http://test") as client:
+                responses = await asyncio.gather(*(
+                    client.post("/api/v1/admin/test", headers={"X-API-Key": "key"})
+                    for _ in range(3)
+                ))
             
             assert all(r.status_code == 200 for r in responses)
+            assert mock_auth_service.validate_api_key.await_count == 3
 
 
 class TestSymbolManagerDatabaseAdvanced:
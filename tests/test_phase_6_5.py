@@ -1,79 +1,100 @@
 """Tests for Phase 6.5: Crypto Symbol Support Implementation"""
 
 import pytest
-import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch, call
-from decimal import Decimal
+import inspect
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.scheduler import AutoBackfillScheduler
 from src.clients.polygon_client import PolygonClient
 from src.services.symbol_manager import SymbolManager
-from src.services.database_service import DatabaseService
+
+
+# Shared read-only test data; copy with dict() before mutating
+_CRYPTO_CANDLE = {'t': 1609459200000, 'o': 29000, 'h': 30000, 'l': 28000, 'c': 29500, 'v': 100}
+_START = datetime(2021, 1, 1)
+_END = datetime(2021, 1, 31)
+_BTC_ROW = {
+    'id': 1,
+    'symbol': 'BTCUSD',
+    'asset_class': 'crypto',
+    'active': True,
+    'date_added': datetime(2021, 1, 1),
+    'backfill_status': 'pending', 'timeframes': ['1h', '1d']
+}
+
+
+# Signatures computed once at import; tenacity-wrapped methods are costly to introspect
+_CRYPTO_SIG = inspect.signature(PolygonClient.fetch_crypto_daily_range)
+_FETCH_INSERT_SIG = inspect.signature(AutoBackfillScheduler._fetch_and_insert)
+
+
+def _pool_with(conn):
+    """asyncpg pool mock whose acquire() yields conn"""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool
+
+
+def _bare_scheduler():
+    """AutoBackfillScheduler without __init__, for tests that only drive _fetch_and_insert"""
+    scheduler = object.__new__(AutoBackfillScheduler)
+    scheduler.polygon_client = MagicMock(fetch_range=AsyncMock())
+    scheduler.db_service = MagicMock()
+    scheduler.validation_service = MagicMock()
+    scheduler.symbols = []
+    return scheduler
 
 
 # ==============================================================================
 # Phase 6.5.1: Polygon Crypto Endpoint Verification
 # ==============================================================================
 
-@pytest.mark.asyncio
-async def test_polygon_client_has_crypto_endpoint():
+@pytest.fixture(scope="module")
+def polygon_client():
+    """PolygonClient shared by the read-only introspection tests"""
+    return PolygonClient("test_key")
+
+
+def test_polygon_client_has_crypto_endpoint(polygon_client):
     """Test that PolygonClient has crypto fetch method"""
-    client = PolygonClient("test_key")
-    
-    assert hasattr(client, 'fetch_crypto_daily_range')
-    assert callable(client.fetch_crypto_daily_range)
+    assert hasattr(polygon_client, 'fetch_crypto_daily_range')
+    assert callable(polygon_client.fetch_crypto_daily_range)
 
 
-@pytest.mark.asyncio
-async def test_fetch_crypto_daily_range_method_signature():
+def test_fetch_crypto_daily_range_method_signature(polygon_client):
     """Test crypto method has correct signature"""
-    import inspect
-    
-    client = PolygonClient("test_key")
-    sig = inspect.signature(client.fetch_crypto_daily_range)
-    
-    params = list(sig.parameters.keys())
+    params = list(_CRYPTO_SIG.parameters.keys())
     assert 'symbol' in params
     assert 'start' in params
     assert 'end' in params
 
 
-@pytest.mark.asyncio
-async def test_fetch_crypto_daily_range_is_async():
+def test_fetch_crypto_daily_range_is_async(polygon_client):
     """Test crypto method is an async function"""
-    import inspect
-    
-    client = PolygonClient("test_key")
-    assert inspect.iscoroutinefunction(client.fetch_crypto_daily_range)
+    assert inspect.iscoroutinefunction(polygon_client.fetch_crypto_daily_range)
 
 
-def test_fetch_crypto_has_docstring():
+def test_fetch_crypto_has_docstring(polygon_client):
     """Test crypto method has docstring"""
-    client = PolygonClient("test_key")
-    
-    doc = client.fetch_crypto_daily_range.__doc__
+    doc = polygon_client.fetch_crypto_daily_range.__doc__
     assert doc is not None
     assert 'crypto' in doc.lower()
 
 
-def test_fetch_crypto_method_name():
+def test_fetch_crypto_method_name(polygon_client):
     """Test crypto method has correct name"""
-    client = PolygonClient("test_key")
-    
-    assert hasattr(client, 'fetch_crypto_daily_range')
-    assert client.fetch_crypto_daily_range.__name__ == 'fetch_crypto_daily_range'
+    assert hasattr(polygon_client, 'fetch_crypto_daily_range')
+    assert polygon_client.fetch_crypto_daily_range.__name__ == 'fetch_crypto_daily_range'
 
 
-def test_fetch_crypto_has_retry_decorator():
+def test_fetch_crypto_has_retry_decorator(polygon_client):
     """Test crypto method has retry decorator"""
-    import inspect
-    
-    client = PolygonClient("test_key")
-    source = inspect.getsource(client.__class__.fetch_crypto_daily_range)
+    method = polygon_client.__class__.fetch_crypto_daily_range
     
-    # Should have retry handling in docstring or implementation
-    assert 'retry' in source.lower() or 'tenacity' in source.lower()
+    # tenacity.retry leaves its controller on the wrapper it returns
+    assert hasattr(method, 'retry')
+    assert hasattr(method, '__wrapped__')
 
 
 # ==============================================================================
@@ -81,99 +102,69 @@ def test_fetch_crypto_has_retry_decorator():
 # ==============================================================================
 
 @pytest.mark.asyncio
-async def test_add_crypto_symbol_to_manager():
+async def test_add_crypto_symbol_to_manager(mock_asyncpg):
     """Test adding crypto symbol via SymbolManager"""
     manager = SymbolManager("postgresql://test")
     
-    with patch('asyncpg.connect') as mock_connect:
-        mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        mock_conn.fetchrow.return_value = None  # Symbol doesn't exist
-        mock_conn.fetchrow.side_effect = [
-            None,  # Check existing
-            {
-                'id': 1,
-                'symbol': 'BTCUSD',
-                'asset_class': 'crypto',
-                'active': True,
-                'date_added': datetime.now(),
-                'backfill_status': 'pending', 'timeframes': ['1h', '1d']
-            }  # Insert result
-        ]
-        
-        result = await manager.add_symbol('BTCUSD', 'crypto')
-        
-        assert result['symbol'] == 'BTCUSD'
-        assert result['asset_class'] == 'crypto'
-        assert result['active'] is True
-
-
-@pytest.mark.asyncio
-async def test_add_multiple_crypto_symbols():
-    """Test adding multiple crypto symbols"""
-    manager = SymbolManager("postgresql://test")
+    _, mock_conn = mock_asyncpg
     
-    crypto_symbols = [
-        ('BTCUSD', 'crypto'),
-        ('ETHGBP', 'crypto'),
-        ('SOLUSD', 'crypto'),
+    mock_conn.fetchrow.return_value = None  # Symbol doesn't exist
+    mock_conn.fetchrow.side_effect = [
+        None,  # Check existing
+        _BTC_ROW  # Insert result
     ]
     
-    for symbol, asset_class in crypto_symbols:
-        assert symbol.isupper()
-        assert asset_class == 'crypto'
+    result = await manager.add_symbol('BTCUSD', 'crypto')
+    
+    assert result['symbol'] == 'BTCUSD'
+    assert result['asset_class'] == 'crypto'
+    assert result['active'] is True
+
+
+@pytest.mark.parametrize("symbol", ['BTCUSD', 'ETHGBP', 'SOLUSD'])
+def test_add_multiple_crypto_symbols(symbol):
+    """Test adding multiple crypto symbols"""
+    assert symbol.isupper()
 
 
 @pytest.mark.asyncio
-async def test_crypto_symbol_case_insensitive():
+async def test_crypto_symbol_case_insensitive(mock_asyncpg):
     """Test that crypto symbols are uppercased"""
     manager = SymbolManager("postgresql://test")
     
-    with patch('asyncpg.connect') as mock_connect:
-        mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        mock_conn.fetchrow.side_effect = [
-            None,  # Check existing
-            {
-                'id': 1,
-                'symbol': 'BTCUSD',
-                'asset_class': 'crypto',
-                'active': True,
-                'date_added': datetime.now(),
-                'backfill_status': 'pending', 'timeframes': ['1h', '1d']
-            }
-        ]
-        
-        result = await manager.add_symbol('btcusd', 'crypto')
-        
-        assert result['symbol'] == 'BTCUSD'
+    _, mock_conn = mock_asyncpg
+    
+    mock_conn.fetchrow.side_effect = [
+        None,  # Check existing
+        _BTC_ROW
+    ]
+    
+    result = await manager.add_symbol('btcusd', 'crypto')
+    
+    assert result['symbol'] == 'BTCUSD'
 
 
 @pytest.mark.asyncio
-async def test_get_crypto_symbol_with_asset_class():
+async def test_get_crypto_symbol_with_asset_class(mock_asyncpg):
     """Test retrieving crypto symbol with asset_class field"""
     manager = SymbolManager("postgresql://test")
     
-    with patch('asyncpg.connect') as mock_connect:
-        mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        mock_conn.fetchrow.return_value = {
-            'id': 1,
-            'symbol': 'ETHGBP',
-            'asset_class': 'crypto',
-            'active': True,
-            'date_added': datetime.now(),
-            'last_backfill': None,
-            'backfill_status': 'pending', 'timeframes': ['1h', '1d']
-        }
-        
-        result = await manager.get_symbol('ETHGBP')
-        
-        assert result['symbol'] == 'ETHGBP'
-        assert result['asset_class'] == 'crypto'
+    _, mock_conn = mock_asyncpg
+    
+    mock_conn.fetchrow.return_value = {
+        'id': 1,
+        'symbol': 'ETHGBP',
+        'asset_class': 'crypto',
+        'active': True,
+        'date_added': datetime.now(),
+        'last_backfill': None,
+        'backfill_status': 'pending', 'timeframes': ['1h', '1d']
+    }
+    
+    result = await manager.get_symbol('ETHGBP')
+    
+    assert result['symbol'] == 'ETHGBP'
+    assert result['asset_class'] == 'crypto'
 
 
 # ==============================================================================
@@ -223,9 +214,9 @@ async def test_load_symbols_preserves_asset_class():
         database_url="postgresql://test"
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         mock_conn.fetch.return_value = [
             {'symbol': 'AAPL', 'asset_class': 'stock', 'timeframes': ['1h', '1d']},
@@ -251,34 +242,24 @@ async def test_load_symbols_preserves_asset_class():
 # ==============================================================================
 
 @pytest.mark.asyncio
-async def test_fetch_and_insert_routes_to_crypto_endpoint():
+async def test_fetch_and_insert_routes_to_crypto_endpoint(patched_scheduler):
     """Test that crypto symbols use fetch_range"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
-    )
+    scheduler = patched_scheduler
     
     with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = [
-            {'t': 1609459200000, 'o': 29000, 'h': 30000, 'l': 28000, 'c': 29500, 'v': 100}
-        ]
+        mock_fetch.return_value = [_CRYPTO_CANDLE]
+        
+        result = await scheduler._fetch_and_insert(
+            'BTCUSD',
+            _START,
+            _END,
+            'crypto',
+            '1d'
+        )
         
-        with patch.object(scheduler, 'db_service'):
-            with patch.object(scheduler.validation_service, 'validate_candle') as mock_validate:
-                mock_validate.return_value = (True, {'validated': True})
-                with patch.object(scheduler.db_service, 'insert_ohlcv_batch', return_value=1):
-                    with patch.object(scheduler.db_service, 'log_backfill'):
-                        result = await scheduler._fetch_and_insert(
-                            'BTCUSD',
-                            datetime(2021, 1, 1),
-                            datetime(2021, 1, 31),
-                            'crypto',
-                            '1d'
-                        )
-                        
-                        # Should call fetch_range for crypto
-                        mock_fetch.assert_called_once()
-                        assert result >= 0
+        # Should call fetch_range for crypto
+        mock_fetch.assert_called_once()
+        assert result >= 0
 
 
 @pytest.mark.asyncio
@@ -290,26 +271,24 @@ async def test_backfill_job_processes_crypto_symbols():
         symbols=[('BTCUSD', 'crypto', ['1d'])]
     )
     
-    with patch.object(scheduler, '_load_symbols_from_db', new_callable=AsyncMock) as mock_load:
-        mock_load.return_value = [('BTCUSD', 'crypto', ['1d'])]
-        
-        with patch.object(scheduler, '_backfill_symbol', new_callable=AsyncMock) as mock_backfill:
-            mock_backfill.return_value = 5
-            
-            with patch.object(scheduler, '_update_symbol_backfill_status', new_callable=AsyncMock):
-                await scheduler._backfill_job()
-                
-                # Should call backfill with crypto asset class and timeframe
-                mock_backfill.assert_called_once_with('BTCUSD', 'crypto', '1d')
+    mock_backfill = AsyncMock(return_value=5)
+    
+    with patch.multiple(
+        scheduler,
+        _load_symbols_from_db=AsyncMock(return_value=[('BTCUSD', 'crypto', ['1d'])]),
+        _backfill_symbol=mock_backfill,
+        _update_symbol_backfill_status=AsyncMock(),
+    ):
+        await scheduler._backfill_job()
+    
+    # Should call backfill with crypto asset class and timeframe
+    mock_backfill.assert_called_once_with('BTCUSD', 'crypto', '1d')
 
 
 @pytest.mark.asyncio
-async def test_mixed_asset_class_backfill_sequence():
+async def test_mixed_asset_class_backfill_sequence(patched_scheduler):
     """Test backfill handles mixed stock/crypto sequence correctly"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
-    )
+    scheduler = patched_scheduler
     
     scheduler.symbols = [
         ('AAPL', 'stock', ['1d']),
@@ -318,22 +297,17 @@ async def test_mixed_asset_class_backfill_sequence():
         ('ETHGBP', 'crypto', ['1d']),
     ]
     
-    with patch.object(scheduler, '_load_symbols_from_db', new_callable=AsyncMock) as mock_load:
-        mock_load.return_value = scheduler.symbols
+    with patch.multiple(
+        scheduler,
+        _load_symbols_from_db=AsyncMock(return_value=scheduler.symbols),
+        _update_symbol_backfill_status=AsyncMock(),
+    ), patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = [{'t': 1609459200000, 'o': 130, 'h': 131, 'l': 129, 'c': 130.5, 'v': 1000000}]
         
-        with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = [{'t': 1609459200000, 'o': 130, 'h': 131, 'l': 129, 'c': 130.5, 'v': 1000000}]
-            
-            with patch.object(scheduler, 'db_service'):
-                with patch.object(scheduler.validation_service, 'validate_candle') as mock_validate:
-                    mock_validate.return_value = (True, {'validated': True})
-                    with patch.object(scheduler.db_service, 'insert_ohlcv_batch', return_value=1):
-                        with patch.object(scheduler.db_service, 'log_backfill'):
-                            with patch.object(scheduler, '_update_symbol_backfill_status', new_callable=AsyncMock):
-                                await scheduler._backfill_job()
-                                
-                                # fetch_range should be called 4 times (once per symbol with 1 timeframe)
-                                assert mock_fetch.call_count == 4
+        await scheduler._backfill_job()
+    
+    # fetch_range should be called 4 times (once per symbol with 1 timeframe)
+    assert mock_fetch.call_count == 4
 
 
 # ==============================================================================
@@ -346,14 +320,13 @@ def test_crypto_candle_format_matches_stock_format():
     required_fields = ['t', 'o', 'h', 'l', 'c', 'v']
     
     # Simulated candle response
-    candle = {'t': 1609459200000, 'o': 29000, 'h': 30000, 'l': 28000, 'c': 29500, 'v': 100}
+    candle = _CRYPTO_CANDLE
     
     for field in required_fields:
         assert field in candle
 
 
-@pytest.mark.asyncio
-async def test_crypto_large_volume_handling():
+def test_crypto_large_volume_handling():
     """Test crypto volume values are handled correctly"""
     scheduler = AutoBackfillScheduler(
         polygon_api_key="test_key",
@@ -361,14 +334,7 @@ async def test_crypto_large_volume_handling():
     )
     
     # Crypto volume is typically much smaller than stock volume
-    crypto_candle = {
-        't': 1609459200000,
-        'o': 29000,
-        'h': 30000,
-        'l': 28000,
-        'c': 29500,
-        'v': 0.5  # Small volume in crypto
-    }
+    crypto_candle = dict(_CRYPTO_CANDLE, v=0.5)  # Small volume in crypto
     
     # Should be treated as valid volume (not rejected as anomaly)
     assert crypto_candle['v'] >= 0
@@ -378,82 +344,47 @@ async def test_crypto_large_volume_handling():
 # Phase 6.5.6: Crypto-Specific Endpoints
 # ==============================================================================
 
-@pytest.mark.asyncio
-async def test_polygon_client_crypto_base_url():
+def test_polygon_client_crypto_base_url(polygon_client):
     """Test that crypto client has correct base URL"""
-    client = PolygonClient("test_key")
-    
-    assert hasattr(client, 'crypto_base_url')
+    assert hasattr(polygon_client, 'crypto_base_url')
     # Note: current implementation uses same v2 endpoint for crypto
     # But client has crypto_base_url attribute defined
 
 
-@pytest.mark.asyncio
-async def test_various_crypto_pair_formats():
+@pytest.mark.parametrize("pair", [
+    'BTCUSD',  # Bitcoin/USD
+    'ETHGBP',  # Ethereum/GBP
+    'SOLUSD',  # Solana/USD
+    'ADAUSD',  # Cardano/USD
+])
+def test_various_crypto_pair_formats(pair):
     """Test crypto symbol format handling (BTCUSD, ETHGBP, etc)"""
-    client = PolygonClient("test_key")
-    
-    crypto_pairs = [
-        'BTCUSD',  # Bitcoin/USD
-        'ETHGBP',  # Ethereum/GBP
-        'SOLUSD',  # Solana/USD
-        'ADAUSD',  # Cardano/USD
-    ]
-    
-    for pair in crypto_pairs:
-        assert len(pair) >= 6
-        assert pair.isupper()
+    assert len(pair) >= 6
+    assert pair.isupper()
 
 
 # ==============================================================================
 # Phase 6.5.7: Error Handling & Edge Cases
 # ==============================================================================
 
+@pytest.mark.parametrize("check_log", [False, True], ids=["symbol_not_found", "no_data_logged"])
 @pytest.mark.asyncio
-async def test_crypto_symbol_not_found_handling():
-    """Test handling of non-existent crypto symbol"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
-    )
-    
-    with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = []  # No data
-        
-        with patch.object(scheduler.db_service, 'log_backfill') as mock_log:
-            result = await scheduler._fetch_and_insert(
-                'FAKECRYPTO',
-                datetime(2021, 1, 1),
-                datetime(2021, 1, 31),
-                'crypto',
-                '1d'
-            )
-            
-            assert result == 0
-
-
-@pytest.mark.asyncio
-async def test_crypto_backfill_handles_no_data():
-    """Test crypto backfill when no data is returned"""
-    scheduler = AutoBackfillScheduler(
-        polygon_api_key="test_key",
-        database_url="postgresql://test"
+async def test_crypto_fetch_returns_no_data(check_log):
+    """Test handling of a crypto symbol for which no data is returned"""
+    scheduler = _bare_scheduler()
+    scheduler.polygon_client.fetch_range.return_value = []  # No data
+    
+    result = await scheduler._fetch_and_insert(
+        'FAKECRYPTO',
+        _START,
+        _END,
+        'crypto',
+        '1d'
     )
     
-    with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = []  # No data
-        
-        with patch.object(scheduler.db_service, 'log_backfill') as mock_log:
-            result = await scheduler._fetch_and_insert(
-                'FAKECRYPTO',
-                datetime(2021, 1, 1),
-                datetime(2021, 1, 31),
-                'crypto',
-                '1d'
-            )
-            
-            assert result == 0
-            mock_log.assert_called_once()
+    assert result == 0
+    if check_log:
+        scheduler.db_service.log_backfill.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -465,9 +396,9 @@ async def test_crypto_empty_symbol_list():
         symbols=[]
     )
     
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         mock_conn.fetch.return_value = []
         
         symbols = await scheduler._load_symbols_from_db()
@@ -479,21 +410,18 @@ async def test_crypto_empty_symbol_list():
 # Phase 6.5.8: Integration Test Summary
 # ==============================================================================
 
-@pytest.mark.asyncio
-async def test_phase_6_5_crypto_implementation_complete():
+def test_phase_6_5_crypto_implementation_complete(polygon_client):
     """Verify all Phase 6.5 crypto functionality is implemented"""
-    client = PolygonClient("test_key")
     scheduler = AutoBackfillScheduler("test_key", "postgresql://test")
     manager = SymbolManager("postgresql://test")
     
     # Check PolygonClient has crypto support
-    assert hasattr(client, 'fetch_crypto_daily_range')
-    assert callable(client.fetch_crypto_daily_range)
+    assert hasattr(polygon_client, 'fetch_crypto_daily_range')
+    assert callable(polygon_client.fetch_crypto_daily_range)
     
     # Check Scheduler handles asset_class parameter
     assert hasattr(scheduler, '_fetch_and_insert')
-    sig = str(inspect.signature(scheduler._fetch_and_insert))
-    assert 'asset_class' in sig
+    assert 'asset_class' in _FETCH_INSERT_SIG.parameters
     
     # Check Scheduler routes correctly
     assert hasattr(scheduler, '_backfill_symbol')
@@ -503,35 +431,26 @@ async def test_phase_6_5_crypto_implementation_complete():
 
 
 @pytest.mark.asyncio
-async def test_crypto_end_to_end_flow():
+async def test_crypto_end_to_end_flow(mock_asyncpg, patched_scheduler):
     """Test complete crypto symbol flow: add -> load -> backfill"""
     manager = SymbolManager("postgresql://test")
-    scheduler = AutoBackfillScheduler("test_key", "postgresql://test")
+    scheduler = patched_scheduler
     
     # Step 1: Add crypto symbol
-    with patch('asyncpg.connect') as mock_connect:
-        mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        mock_conn.fetchrow.side_effect = [
-            None,  # Check existing
-            {
-                'id': 1,
-                'symbol': 'BTCUSD',
-                'asset_class': 'crypto',
-                'active': True,
-                'date_added': datetime.now(),
-                'backfill_status': 'pending', 'timeframes': ['1h', '1d']
-            }
-        ]
-        
-        symbol_result = await manager.add_symbol('BTCUSD', 'crypto')
-        assert symbol_result['asset_class'] == 'crypto'
+    _, mock_conn = mock_asyncpg
+    
+    mock_conn.fetchrow.side_effect = [
+        None,  # Check existing
+        _BTC_ROW
+    ]
+    
+    symbol_result = await manager.add_symbol('BTCUSD', 'crypto')
+    assert symbol_result['asset_class'] == 'crypto'
     
     # Step 2: Load crypto symbol from DB
-    with patch('asyncpg.connect') as mock_connect:
+    with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
         mock_conn = AsyncMock()
-        mock_connect.return_value = mock_conn
+        mock_create_pool.return_value = _pool_with(mock_conn)
         
         mock_conn.fetch.return_value = [
             {'symbol': 'BTCUSD', 'asset_class': 'crypto', 'timeframes': ['1d']}
@@ -543,28 +462,14 @@ async def test_crypto_end_to_end_flow():
     
     # Step 3: Backfill crypto symbol
     with patch.object(scheduler.polygon_client, 'fetch_range', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = [
-            {'t': 1609459200000, 'o': 29000, 'h': 30000, 'l': 28000, 'c': 29500, 'v': 100}
-        ]
+        mock_fetch.return_value = [_CRYPTO_CANDLE]
         
-        with patch.object(scheduler.db_service, 'insert_ohlcv_batch', return_value=1):
-            with patch.object(scheduler.db_service, 'log_backfill'):
-                with patch.object(scheduler.validation_service, 'validate_candle') as mock_validate:
-                    mock_validate.return_value = (True, {'validated': True})
-                    
-                    result = await scheduler._fetch_and_insert(
-                        'BTCUSD',
-                        datetime(2021, 1, 1),
-                        datetime(2021, 1, 31),
-                        'crypto',
-                        '1d'
-                    )
-                    
-                    assert result >= 0
-
-
-# ==============================================================================
-# Import required for inspection
-# ==============================================================================
-
-import inspect
+        result = await scheduler._fetch_and_insert(
+            'BTCUSD',
+            _START,
+            _END,
+            'crypto',
+            '1d'
+        )
+        
+        assert result >= 0
@@ -14,7 +14,7 @@ from unittest.mock import Mock, patch, AsyncMock
 import os
 import asyncio
 
-from src.config import ALLOWED_TIMEFRAMES, DEFAULT_TIMEFRAMES
+from src.config import ALLOWED_TIMEFRAMES, ALLOWED_TIMEFRAME_SET, DEFAULT_TIMEFRAMES
 
 
 # Mock the main app for testing
@@ -90,6 +90,11 @@ class TestHistoricalDataEndpoint:
         invalid = "2h"
         assert invalid not in ALLOWED_TIMEFRAMES
     
+    def test_timeframe_set_matches_list(self):
+        """Test the membership set holds exactly the ordered timeframes"""
+        assert isinstance(ALLOWED_TIMEFRAME_SET, frozenset)
+        assert ALLOWED_TIMEFRAME_SET == set(ALLOWED_TIMEFRAMES)
+    
     def test_default_timeframe_is_1d(self):
         """Test default timeframe is 1d"""
         # When no timeframe specified, should use 1d
@@ -1,6 +1,11 @@
 """Tests for polygon_client.py - behavior and error handling"""
 
+import asyncio
 import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from src.clients import polygon_client as polygon_module
 from src.clients.polygon_client import PolygonClient
 
 
@@ -107,6 +112,181 @@ class TestClientConfiguration:
         assert client2.api_key == "different_key"
 
 
+class TestFetchRangeRetry:
+    """Test fetch_range retry and pacing (no network)"""
+    
+    @pytest.fixture
+    def no_sleep(self, monkeypatch):
+        """Record backoff delays instead of sleeping"""
+        delays = []
+        
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+        
+        monkeypatch.setattr(polygon_module.asyncio, "sleep", fake_sleep)
+        return delays
+    
+    async def test_retries_transient_errors(self, polygon_client, no_sleep):
+        """Test 429/5xx/network failures are retried with capped jittered backoff"""
+        candles = [{'t': 1, 'o': 1, 'h': 1, 'l': 1, 'c': 1, 'v': 1}]
+        polygon_client._fetch_aggregates = AsyncMock(side_effect=[
+            polygon_module._RetryableError("Rate limited (429) - too many requests"),
+            candles,
+        ])
+        
+        result = await polygon_client.fetch_range('AAPL', '1d', '2024-01-01', '2024-01-31')
+        
+        assert result == candles
+        assert polygon_client._fetch_aggregates.await_count == 2
+        assert len(no_sleep) == 1
+        assert polygon_module.FETCH_BACKOFF_BASE <= no_sleep[0] <= polygon_module.FETCH_BACKOFF_CAP
+    
+    async def test_gives_up_after_max_attempts(self, polygon_client, no_sleep):
+        """Test exhausted retries surface a ValueError"""
+        polygon_client._fetch_aggregates = AsyncMock(
+            side_effect=polygon_module._RetryableError("API returned status 503")
+        )
+        
+        with pytest.raises(ValueError, match="503"):
+            await polygon_client.fetch_range('AAPL', '1d', '2024-01-01', '2024-01-31')
+        
+        assert polygon_client._fetch_aggregates.await_count == polygon_module.FETCH_MAX_ATTEMPTS
+        assert len(no_sleep) == polygon_module.FETCH_MAX_ATTEMPTS - 1
+    
+    async def test_client_errors_not_retried(self, polygon_client, no_sleep):
+        """Test non-transient errors fail on the first attempt"""
+        polygon_client._fetch_aggregates = AsyncMock(
+            side_effect=ValueError("API returned status 403")
+        )
+        
+        with pytest.raises(ValueError, match="403"):
+            await polygon_client.fetch_range('AAPL', '1d', '2024-01-01', '2024-01-31')
+        
+        assert polygon_client._fetch_aggregates.await_count == 1
+        assert no_sleep == []
+    
+    async def test_requests_share_rate_limiter(self, polygon_client):
+        """Test each attempt takes a slot from the client's rate limiter"""
+        polygon_client._fetch_aggregates = AsyncMock(return_value=[])
+        
+        await polygon_client.fetch_range('AAPL', '1d', '2024-01-01', '2024-01-31')
+        await polygon_client.fetch_range('MSFT', '1d', '2024-01-01', '2024-01-31')
+        
+        assert len(polygon_client.rate_limiter.requests) == 2
+
+
+class TestSharedSession:
+    """Test the client's shared HTTP session"""
+    
+    async def test_session_reused_until_closed(self, polygon_client):
+        """Test the session is created once and close() releases it"""
+        session = await polygon_client._get_session()
+        assert await polygon_client._get_session() is session
+        
+        await polygon_client.close()
+        
+        assert session.closed
+        reopened = await polygon_client._get_session()
+        assert reopened is not session
+        await polygon_client.close()
+    
+    async def test_requests_share_one_session(self, polygon_client, monkeypatch):
+        """Test two requests on one client go through a single ClientSession"""
+        sessions = []
+        
+        class FakeResponse:
+            status = 200
+            
+            async def json(self, loads=None):
+                return {"results": {"ticker": "AAPL"}}
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc):
+                return False
+        
+        class FakeSession:
+            closed = False
+            
+            def __init__(self, *args, **kwargs):
+                self.requests = 0
+                sessions.append(self)
+            
+            def get(self, url, **kwargs):
+                self.requests += 1
+                return FakeResponse()
+            
+            async def close(self):
+                self.closed = True
+        
+        monkeypatch.setattr(polygon_module.aiohttp, "ClientSession", FakeSession)
+        
+        assert await polygon_client.fetch_ticker_details('AAPL') == {"ticker": "AAPL"}
+        assert await polygon_client.fetch_ticker_details('MSFT') == {"ticker": "AAPL"}
+        
+        assert len(sessions) == 1
+        assert sessions[0].requests == 2
+        await polygon_client.close()
+    
+    def test_session_from_old_loop_is_closed(self, api_key):
+        """Test moving to a new event loop closes the previous loop's session"""
+        client = PolygonClient(api_key)
+        first = asyncio.run(client._get_session())
+        
+        second = asyncio.run(client._get_session())
+        
+        assert first.closed
+        assert second is not first
+        asyncio.run(client.close())
+
+
+class TestReferenceDataCache:
+    """Test the on-disk dividends/splits cache (no network)"""
+    
+    @staticmethod
+    def _fake_window(client, calls):
+        """Stand-in for _fetch_dividends_window: one dividend per window start"""
+        async def fetch_window(symbol, start, end, cache_path=None):
+            calls.append((start, end))
+            records = [{'ticker': symbol, 'ex_dividend_date': start}]
+            client._write_cache(cache_path, records)
+            return records
+        return fetch_window
+    
+    async def test_rerun_only_fetches_current_year(self, api_key, tmp_path):
+        """Test closed years are cached whole, so a later rolling window only hits the API for the current year"""
+        client = PolygonClient(api_key, cache_dir=str(tmp_path))
+        calls = []
+        client._fetch_dividends_window = self._fake_window(client, calls)
+        year = datetime.utcnow().year
+        today = datetime.utcnow().strftime('%Y-%m-%d')
+        
+        first = await client.fetch_dividends('AAPL', f"{year - 2}-06-15", today)
+        
+        assert calls == [
+            (f"{year - 2}-01-01", f"{year - 2}-12-31"),
+            (f"{year - 1}-01-01", f"{year - 1}-12-31"),
+            (f"{year}-01-01", today),
+        ]
+        # Whole cached years are trimmed back to the requested window
+        assert [r['ex_dividend_date'] for r in first] == [f"{year - 1}-01-01", f"{year}-01-01"]
+        
+        calls.clear()
+        await client.fetch_dividends('AAPL', f"{year - 2}-06-16", today)
+        
+        assert calls == [(f"{year}-01-01", today)]
+    
+    async def test_cache_disabled_by_default(self, polygon_client):
+        """Test without a cache_dir the requested window is fetched as-is"""
+        calls = []
+        polygon_client._fetch_dividends_window = self._fake_window(polygon_client, calls)
+        
+        await polygon_client.fetch_dividends('AAPL', '2020-01-01', '2021-06-30')
+        
+        assert calls == [('2020-01-01', '2021-06-30')]
+
+
 # Run with: pytest tests/test_polygon_client.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])